@@ -1,3 +1,11 @@
+from .backend import get_backend, set_backend
 from .vector import Vector
 from .matrix import Matrix
-from .cholesky import cholesky_solve
+from .matrix_view import MatrixView
+from .symmetric_matrix import SymmetricMatrix
+from .linear_operator import LinearOperator
+from .sparse_matrix import CooMatrix, CsrMatrix, make_csr_from_matrix
+from .cholesky import CholeskyFactorization, cholesky_solve
+from .doolitle import LUFactorization
+from .pivots import NonPositivePivotError
+from .ldlt import LDLFactorization, ldlt_solve
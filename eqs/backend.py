@@ -0,0 +1,62 @@
+import importlib
+import os
+
+PYTHON_BACKEND = "python"
+NUMPY_BACKEND = "numpy"
+
+__BACKENDS = (PYTHON_BACKEND, NUMPY_BACKEND)
+__current_backend = PYTHON_BACKEND
+
+
+def set_backend(name: str):
+    """
+    Selects the backend used by the `eqs` numeric kernels:
+
+    - "python": the pure Python implementation, which is the
+      reference implementation and doesn't need any dependency.
+    - "numpy": vectorized NumPy kernels, used for dense `Matrix`
+      and `Vector` operands. Requires NumPy to be installed.
+
+    The initial backend can be set using the `EQS_BACKEND`
+    environment variable, and defaults to "python".
+
+    :param name: backend's name
+    """
+    global __current_backend
+
+    if name not in __BACKENDS:
+        raise ValueError(f"Unknown backend: {name}")
+
+    if name == NUMPY_BACKEND:
+        # Fail early if NumPy isn't installed
+        import numpy  # noqa: F401
+
+    __current_backend = name
+
+
+def get_backend() -> str:
+    """
+    Returns the name of the backend currently in use.
+
+    :return: backend's name
+    """
+    return __current_backend
+
+
+def numpy_kernels():
+    """
+    Returns the module with the NumPy kernels if the NumPy backend
+    is selected, or `None` otherwise.
+
+    The kernels module is only imported once NumPy has been
+    selected, so NumPy is never needed by the Python backend.
+
+    :return: NumPy kernels module or `None`
+    """
+    if __current_backend != NUMPY_BACKEND:
+        return None
+
+    return importlib.import_module("eqs.numpy_kernels")
+
+
+set_backend(os.environ.get("EQS_BACKEND", PYTHON_BACKEND))
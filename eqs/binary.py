@@ -0,0 +1,154 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Union
+
+from eqs.matrix import Matrix
+from eqs.sparse_matrix import CsrMatrix
+from eqs.symmetric_matrix import SymmetricMatrix
+from eqs.vector import Vector
+
+__MAGIC = b"EQSB"
+__VERSION = 1
+__HEADER = struct.Struct("<4sBBBxQQQ")
+
+__VECTOR = 0
+__DENSE = 1
+__PACKED_SYMMETRIC = 2
+__CSR = 3
+
+__COLUMN_MAJOR = 1
+
+__ITEM_SIZE = 8
+
+
+def save(file_path: str, stored: Union[Vector, Matrix, SymmetricMatrix, CsrMatrix]):
+    """
+    Saves the given vector or matrix in a binary file at
+    `file_path`, from which it can be loaded using `load`.
+
+    The file starts with a 32 byte header, with the storage kind,
+    the number of rows and columns and the number of stored values,
+    followed by the raw storage as little-endian 8 byte values:
+
+        - `Vector`: its values,
+        - `Matrix`: its values, by rows or by columns,
+        - `SymmetricMatrix`: the packed lower triangle, by rows,
+        - `CsrMatrix`: the row pointers and column indices, as
+          integers, followed by the values.
+
+    :param file_path: `str` path of the file
+    :param stored: `Vector`, `Matrix`, `SymmetricMatrix` or `CsrMatrix`
+    """
+    if isinstance(stored, Vector):
+        header = (__VECTOR, 0, stored.length, 1, stored.length)
+        sections = [stored.data]
+    elif isinstance(stored, Matrix):
+        flags = __COLUMN_MAJOR if stored.is_column_major else 0
+        (rows, cols) = (stored.rows_count, stored.cols_count)
+        header = (__DENSE, flags, rows, cols, rows * cols)
+        sections = [stored.data]
+    elif isinstance(stored, SymmetricMatrix):
+        size = stored.rows_count
+        header = (__PACKED_SYMMETRIC, 0, size, size, len(stored.data))
+        sections = [stored.data]
+    elif isinstance(stored, CsrMatrix):
+        (rows, cols) = (stored.rows_count, stored.cols_count)
+        header = (__CSR, 0, rows, cols, stored.non_zeros_count)
+        sections = [
+            array("q", stored.row_ptr),
+            array("q", stored.col_indices),
+            array("d", stored.values),
+        ]
+    else:
+        raise ValueError(f"Can't save a {type(stored).__name__}")
+
+    with open(file_path, "wb") as file:
+        file.write(__HEADER.pack(__MAGIC, __VERSION, *header))
+        for section in sections:
+            file.write(__little_endian(section))
+
+
+def load(file_path: str) -> Union[Vector, Matrix, SymmetricMatrix, CsrMatrix]:
+    """
+    Loads the vector or matrix saved with `save` in the binary file
+    at `file_path`.
+
+    The file is memory-mapped, and the loaded vector or matrix is
+    stored directly in the mapped pages, so loading costs nothing
+    until its values are read, and only the read pages are brought
+    into memory. The mapping is copy-on-write: the loaded vector or
+    matrix can be modified, but the file isn't.
+
+    :param file_path: `str` path of the file
+    :return: `Vector`, `Matrix`, `SymmetricMatrix` or `CsrMatrix`
+    """
+    with open(file_path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    if len(mapped) < __HEADER.size:
+        raise ValueError(f"{file_path} isn't an eqs binary file")
+
+    (magic, version, kind, flags, rows, cols, count) = __HEADER.unpack_from(mapped)
+    if magic != __MAGIC:
+        raise ValueError(f"{file_path} isn't an eqs binary file")
+
+    if version != __VERSION:
+        raise ValueError(f"Unsupported eqs binary file version: {version}")
+
+    sizes = [count, 0, 0] if kind != __CSR else [rows + 1, count, count]
+    expected_length = __HEADER.size + __ITEM_SIZE * sum(sizes)
+    if len(mapped) != expected_length:
+        raise ValueError(f"{file_path} has {len(mapped)} bytes, not {expected_length}")
+
+    view = memoryview(mapped)
+    start = __HEADER.size
+    stop = start + __ITEM_SIZE * count
+
+    if kind == __VECTOR:
+        return Vector.from_buffer(__native(view[start:stop], "d"))
+
+    if kind == __DENSE:
+        return Matrix.from_buffer(
+            __native(view[start:stop], "d"),
+            rows,
+            cols,
+            column_major=bool(flags & __COLUMN_MAJOR),
+        )
+
+    if kind == __PACKED_SYMMETRIC:
+        return SymmetricMatrix.from_buffer(__native(view[start:stop], "d"))
+
+    if kind == __CSR:
+        (ptr_stop, indices_stop) = (
+            start + __ITEM_SIZE * (rows + 1),
+            start + __ITEM_SIZE * (rows + 1 + count),
+        )
+        return CsrMatrix(
+            rows,
+            cols,
+            __native(view[start:ptr_stop], "q"),
+            __native(view[ptr_stop:indices_stop], "q"),
+            __native(view[indices_stop:], "d"),
+        )
+
+    raise ValueError(f"Unknown storage kind in {file_path}: {kind}")
+
+
+def __little_endian(values):
+    if sys.byteorder == "little":
+        return values
+
+    swapped = array(getattr(values, "typecode", "d"), values)
+    swapped.byteswap()
+    return swapped
+
+
+def __native(view: memoryview, typecode: str):
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return values
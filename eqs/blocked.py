@@ -0,0 +1,94 @@
+import math
+from array import array
+from operator import mul, sub
+from typing import List
+
+from eqs.pivots import check_pivot
+
+BLOCK_SIZE = 96
+
+
+def dot(a, b) -> float:
+    """
+    Computes the dot product of two sequences of numbers of the same
+    length.
+
+    Uses `math.sumprod` where available, which doesn't create an
+    intermediate float per product, and is fastest over lists: the
+    kernels copy the rows they use repeatedly into lists once.
+
+    :param a: sequence of numbers
+    :param b: sequence of numbers
+    :return: `float`
+    """
+    return __sumprod(a, b)
+
+
+def __sum_of_products(a, b) -> float:
+    return sum(map(mul, a, b))
+
+
+__sumprod = getattr(math, "sumprod", __sum_of_products)
+
+
+def cholesky_in_place(
+    data: array, row_starts: List[int], col_stride=1, block_size=BLOCK_SIZE
+):
+    """
+    Overwrites the lower triangle of a symmetric, positive-definite
+    matrix, stored in the flat `data` array, with its Cholesky
+    factor [L], using the right-looking block algorithm.
+
+    The value at the position (i, j), with j <= i, is stored at the
+    index `row_starts[i] + j * col_stride`, which fits both dense
+    matrices, in either order, and packed lower triangles. Only the
+    lower triangle is read and written.
+
+    The columns are factorized in blocks of `block_size`: the
+    block's rows are copied into lists, its columns factorized in
+    them, and the rest of the matrix is updated with the products of
+    the block's rows, each a dot product of `block_size` values. The
+    interpreter only dispatches a handful of operations per block
+    row, and the block is small enough to stay in the cache.
+
+    :param data: `array` with the matrix values, overwritten with [L]
+    :param row_starts: index in `data` of the first value of each row
+    :param col_stride: distance in `data` between consecutive columns
+    :param block_size: `int` number of columns in each block
+    """
+    size = len(row_starts)
+    cs = col_stride
+    diagonal = [data[row_starts[i] + i * cs] for i in range(size)]
+
+    for k0 in range(0, size, block_size):
+        k1 = min(k0 + block_size, size)
+        width = k1 - k0
+
+        # columns k0 to k1 of the rows below k0, updated by the
+        # previous blocks, but not beyond the main diagonal
+        panel = [
+            data[start + k0 * cs : start + min(i + 1, k1) * cs : cs].tolist()
+            for i, start in enumerate(row_starts[k0:], k0)
+        ]
+
+        for i, row in enumerate(panel, k0):
+            for c in range(min(i - k0 + 1, width)):
+                pivot_row = panel[c]
+                value = row[c] - dot(row[:c], pivot_row[:c])
+
+                if c == i - k0:
+                    check_pivot(value, diagonal[i], i)
+                    row[c] = math.sqrt(value)
+                else:
+                    row[c] = value / pivot_row[c]
+
+            start = row_starts[i] + k0 * cs
+            data[start : start + len(row) * cs : cs] = array("d", row)
+
+        # [A22] = [A22] - [L21][L21]', row by row
+        below = panel[width:]
+        for r, row in enumerate(below):
+            start = row_starts[k1 + r] + k1 * cs
+            stop = start + (r + 1) * cs
+            products = [dot(row, other) for other in below[: r + 1]]
+            data[start:stop:cs] = array("d", map(sub, data[start:stop:cs], products))
@@ -0,0 +1,50 @@
+import sys
+from array import array
+
+__DOUBLE_FORMATS = ("d", "@d", "=d", "<d" if sys.byteorder == "little" else ">d")
+__BYTE_FORMATS = ("B", "b", "c")
+
+
+def doubles_view(buffer) -> memoryview:
+    """
+    Returns a one-dimensional `memoryview` of doubles over the
+    storage of the given `buffer`, without copying it.
+
+    The buffer can be any object supporting the buffer protocol,
+    like an `array`, a `bytearray`, a `mmap` or a NumPy array, as
+    long as it's C-contiguous and either holds doubles, in any
+    shape, or raw bytes, which are read as native doubles.
+
+    The view is writable if the buffer is.
+
+    :param buffer: object supporting the buffer protocol
+    :return: `memoryview` with format 'd'
+    """
+    view = memoryview(buffer)
+
+    if view.format not in __DOUBLE_FORMATS + __BYTE_FORMATS:
+        raise ValueError(f"Buffer must hold doubles or bytes, not '{view.format}'")
+
+    if not view.c_contiguous:
+        raise ValueError("Buffer must be C-contiguous")
+
+    if view.format == "d" and view.ndim == 1:
+        return view
+
+    if view.nbytes % 8:
+        raise ValueError(f"Buffer size isn't a multiple of 8 bytes: {view.nbytes}")
+
+    return view.cast("B").cast("d")
+
+
+def as_array(values) -> array:
+    """
+    Returns the given doubles, a slice of the storage of a matrix or
+    vector, as an `array`: slices of an `array` already are new
+    arrays, but slices of a `memoryview` are views of the same
+    storage, so their values are copied into a new array.
+
+    :param values: `array` or `memoryview` of doubles
+    :return: `array` of doubles
+    """
+    return values if isinstance(values, array) else array("d", values)
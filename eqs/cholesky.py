@@ -1,12 +1,20 @@
-import math
+from typing import List, Union
 
-from eqs.lu_solve import lu_system_solve
+from eqs.backend import numpy_kernels
+from eqs.blocked import cholesky_in_place
+from eqs.lower_system import solve_lower_sys, solve_lower_sys_many
 from eqs.matrix import Matrix
+from eqs.matrix_view import MatrixView
+from eqs.symmetric_matrix import SymmetricMatrix
+from eqs.upper_system import (
+    solve_transposed_upper_sys,
+    solve_transposed_upper_sys_many,
+)
 from eqs.validate_sys import validate_system
 from eqs.vector import Vector
 
 
-def cholesky_solve(sys_mat: Matrix, sys_vec: Vector) -> Vector:
+def cholesky_solve(sys_mat: Union[Matrix, SymmetricMatrix], sys_vec: Vector) -> Vector:
     """
     The Cholesky factorization method solves systems of linear
     equations whose matrix (`sys_mat`) is positive-definite.
@@ -24,10 +32,104 @@ def cholesky_solve(sys_mat: Matrix, sys_vec: Vector) -> Vector:
     :return: result `Vector`
     """
     validate_system(sys_mat, sys_vec)
+    return CholeskyFactorization(sys_mat).solve(sys_vec)
 
-    lower_matrix = lower_matrix_decomposition(sys_mat)
-    upper_matrix = lower_matrix.transposed()
-    return lu_system_solve(lower_matrix, upper_matrix, sys_vec)
+
+def cholesky_solve_in_place(
+    sys_mat: Union[Matrix, SymmetricMatrix], sys_vec: Vector
+) -> Vector:
+    """
+    Solves the system like `cholesky_solve` does, but overwrites
+    the system matrix `sys_mat` with its lower triangular matrix
+    [L] instead of allocating a new one.
+
+    The backward substitution reads [L]' from [L], so the system
+    matrix is the only n x n buffer used by the resolution.
+
+    Warning: `sys_mat` can't be used after calling this function.
+
+    :param sys_mat: system's `Matrix`, overwritten with [L]
+    :param sys_vec: system's vector `Vector`
+    :return: result `Vector`
+    """
+    validate_system(sys_mat, sys_vec)
+    return CholeskyFactorization(sys_mat, overwrite=True).solve(sys_vec)
+
+
+class CholeskyFactorization:
+    """
+    The Cholesky factorization of a positive-definite matrix,
+    computed once and kept to solve any number of systems sharing
+    that matrix.
+
+    Factorizing the matrix has a ~O(n3) time complexity, but each
+    subsequent resolution only takes a forward and a backward
+    substitution, with a ~O(n2) time complexity.
+
+    Only [L] is kept: the backward substitution reads [L]' from it.
+    When `overwrite` is true, the factorization is computed in the
+    system matrix itself, which then holds [L], so no other n x n
+    buffer is allocated.
+
+    A `SymmetricMatrix` is factorized in its packed lower triangle,
+    which then holds [L]: only its lower triangle is meaningful.
+
+    Every pivot is checked before taking its square root: a matrix
+    which isn't positive-definite raises a `NonPositivePivotError`
+    at the first non-positive one.
+    """
+
+    def __init__(self, sys_mat: Union[Matrix, SymmetricMatrix], overwrite=False):
+        if not sys_mat.is_square:
+            raise ValueError("System matrix must be square")
+
+        if overwrite:
+            self.__lower_matrix = lower_matrix_decomposition_in_place(sys_mat)
+        elif isinstance(sys_mat, SymmetricMatrix):
+            self.__lower_matrix = lower_matrix_decomposition_in_place(sys_mat.copy())
+        else:
+            self.__lower_matrix = lower_matrix_decomposition(sys_mat)
+
+    @property
+    def size(self):
+        """
+        Number of equations in the factorized system.
+
+        :return: `int`
+        """
+        return self.__lower_matrix.rows_count
+
+    @property
+    def lower_matrix(self):
+        """
+        The lower triangular matrix [L] of the factorization.
+
+        :return: lower triangular `Matrix`
+        """
+        return self.__lower_matrix
+
+    def solve(self, sys_vec: Vector) -> Vector:
+        """
+        Solves the system for the given vector, using forward and
+        backward substitution on the factorized matrix.
+
+        :param sys_vec: system's `Vector`
+        :return: result `Vector`
+        """
+        validate_system(self.__lower_matrix, sys_vec)
+        low_solution = solve_lower_sys(self.__lower_matrix, sys_vec)
+        return solve_transposed_upper_sys(self.__lower_matrix, low_solution)
+
+    def solve_many(self, sys_vectors: List[Vector]) -> List[Vector]:
+        """
+        Solves the system for every one of the given vectors,
+        sweeping each triangular matrix once for all of them.
+
+        :param sys_vectors: systems' `Vector`s
+        :return: result `Vector`s, in the same order
+        """
+        low_solutions = solve_lower_sys_many(self.__lower_matrix, sys_vectors)
+        return solve_transposed_upper_sys_many(self.__lower_matrix, low_solutions)
 
 
 def lower_matrix_decomposition(sys_mat: Matrix) -> Matrix:
@@ -41,32 +143,65 @@ def lower_matrix_decomposition(sys_mat: Matrix) -> Matrix:
     :param sys_mat: `Matrix`
     :return: lower triangular `Matrix`
     """
+    kernels = numpy_kernels()
+    if kernels and isinstance(sys_mat, Matrix):
+        return kernels.lower_matrix_decomposition(sys_mat)
+
     size = sys_mat.rows_count
     low_mat = Matrix(size, size)
+    low_data = low_mat.data
 
     for i in range(size):
-        sq_sum = 0
+        low_data[i * size : i * size + i + 1] = sys_mat.row_values(i, 0, i + 1)
+
+    return lower_matrix_decomposition_in_place(low_mat)
+
+
+def lower_matrix_decomposition_in_place(
+    sys_mat: Union[Matrix, MatrixView, SymmetricMatrix],
+) -> Union[Matrix, MatrixView, SymmetricMatrix]:
+    """
+    Decomposes the matrix `sys_mat` into the product of a lower
+    triangular matrix and its conjugate transpose, [A] = [L][L]',
+    overwriting `sys_mat` with [L].
+
+    Every value of [L] is computed from the value of [A] at the
+    same position, which is read before being overwritten, so no
+    other matrix is needed. Only the lower triangle of `sys_mat` is
+    read; the upper triangle is zeroed.
 
-        for j in range(i + 1):
-            m_ij = sys_mat.value_at(i, j)
+    The factorization is computed by blocks of columns, as
+    `blocked.cholesky_in_place` does, which works over row slices
+    instead of reading the values one by one.
 
-            if i == j:
-                # main diagonal value
-                diag_val = math.sqrt(m_ij - sq_sum)
-                low_mat.set_value(diag_val, i, j)
+    A `SymmetricMatrix` only stores its lower triangle, which is
+    overwritten with [L]. A square `MatrixView` is factorized in the
+    storage of the viewed matrix, leaving the rest of it untouched.
 
-            else:
-                # value under main diagonal
-                non_diag_sum = 0
-                for k in range(j):
-                    l_ik = low_mat.value_at(i, k)
-                    l_jk = low_mat.value_at(j, k)
-                    non_diag_sum += l_ik * l_jk
+    :param sys_mat: `Matrix`, `MatrixView` or `SymmetricMatrix`
+    :return: `sys_mat`, now holding the lower triangular matrix
+    """
+    if isinstance(sys_mat, SymmetricMatrix):
+        return __packed_decomposition_in_place(sys_mat)
+
+    kernels = numpy_kernels()
+    if kernels and isinstance(sys_mat, Matrix):
+        return kernels.lower_matrix_decomposition_in_place(sys_mat)
+
+    size = sys_mat.rows_count
+    (data, col_stride) = (sys_mat.data, sys_mat.col_stride)
+    cholesky_in_place(data, [sys_mat.index_of(i, 0) for i in range(size)], col_stride)
 
-                l_jj = low_mat.value_at(j, j)
-                non_diag_val = (m_ij - non_diag_sum) / l_jj
-                sq_sum += non_diag_val * non_diag_val
+    for i in range(size):
+        for j in range(i + 1, size):
+            data[sys_mat.index_of(i, j)] = 0.0
+
+    return sys_mat
 
-                low_mat.set_value(non_diag_val, i, j)
 
-    return low_mat
+def __packed_decomposition_in_place(sys_mat: SymmetricMatrix) -> SymmetricMatrix:
+    size = sys_mat.rows_count
+    row_starts = [SymmetricMatrix.row_start(i) for i in range(size)]
+    cholesky_in_place(sys_mat.data, row_starts)
+
+    return sys_mat
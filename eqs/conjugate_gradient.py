@@ -1,58 +1,216 @@
 import math
+from typing import List, Tuple, Union
 
-from eqs import Matrix, Vector
+from eqs import CsrMatrix, Matrix, SymmetricMatrix, Vector
+from eqs.backend import numpy_kernels
+from eqs.linear_operator import LinearOperator
+from eqs.preconditioners import Preconditioner
 from eqs.validate_sys import validate_system
 
 
+class ConvergenceRecord:
+    """
+    The record of how a conjugate gradient resolution converged: the
+    number of iterations it took and the norm of the residual
+    [r] = [b] - [A][x] before each of them and after the last one.
+    """
+
+    def __init__(self, residual_norms: List[float]):
+        self.residual_norms = residual_norms
+
+    @property
+    def iterations(self):
+        """
+        Number of iterations the resolution took.
+
+        :return: `int`
+        """
+        return len(self.residual_norms) - 1
+
+    @property
+    def initial_residual_norm(self):
+        """
+        Norm of the residual of the initial guess.
+
+        :return: `float`
+        """
+        return self.residual_norms[0]
+
+    @property
+    def final_residual_norm(self):
+        """
+        Norm of the residual of the returned solution.
+
+        :return: `float`
+        """
+        return self.residual_norms[-1]
+
+    def __str__(self):
+        return (
+            f"{self.iterations} iterations, residual norm: "
+            f"{self.initial_residual_norm} ➜ {self.final_residual_norm}"
+        )
+
+
 def conjugate_gradient_solve(
-    sys_mat: Matrix, sys_vec: Vector, max_iter=100, max_error=1e-8
+    sys_mat: Union[Matrix, SymmetricMatrix, CsrMatrix, LinearOperator],
+    sys_vec: Vector,
+    max_iter=100,
+    max_error=1e-8,
+    preconditioner: Preconditioner = None,
+    initial_guess: Vector = None,
+    relative_tolerance: float = None,
 ) -> Vector:
     """
     The conjugate gradient method is a iterative numeric method to
     solve systems of linear equations.
 
-    The method starts with a vector full of zeroes as the first
-    approximation to the solution and improves it in each
-    iteration.
+    The method starts with the `initial_guess` as the first
+    approximation to the solution, or a vector full of zeroes if
+    none is given, and improves it in each iteration. Starting from
+    a close guess, like the solution of a slightly different
+    system, takes fewer iterations.
     In every iteration the error vector `error` is checked and only
     in the case where every value is less than the `max_error`, the
     solution is considered "good enough" and the solution vector
     returned.
+    When a `relative_tolerance` is given, the solution is instead
+    considered "good enough" once the norm of the error vector is
+    less than `relative_tolerance` times the norm of `sys_vec`,
+    which doesn't depend on the units of the system.
+
+    The initial guess is checked before iterating, so a system it
+    already solves takes no iterations. A system whose vector is all
+    zeroes is solved by the zero vector, and the initial guess is
+    ignored, as no relative tolerance can be met from any other
+    guess.
 
     If after `max_iter` iterations a "good enough" solution hasn't
     been found, the function raises an `ArithmeticError`.
 
-    :param sys_mat: system `Matrix`
+    The system matrix is only used through its product with a
+    vector, so a sparse `CsrMatrix` can be passed in: each
+    iteration then costs a time proportional to the number of
+    non-zeros instead of the square of the system size. A packed
+    `SymmetricMatrix` can be passed in too, and so can a
+    `LinearOperator`, which computes the product without storing
+    the matrix at all.
+
+    A `preconditioner` [M] can be passed in to solve the system
+    using the preconditioned conjugate gradient method, which needs
+    fewer iterations for ill-conditioned systems: each iteration
+    then also solves a [M][z] = [r] system for the residual [r]. The
+    preconditioner is set up beforehand, so it can be reused to
+    solve any number of systems sharing the same matrix.
+
+    With the NumPy backend selected, dense `Matrix` systems solved
+    with the default options are solved by the vectorized kernel
+    instead.
+
+    :param sys_mat: system matrix or `LinearOperator`
     :param sys_vec: system `Vector`
     :param max_iter: `int` max number of iterations
     :param max_error: `float` max error accepted in the solution
+    :param preconditioner: optional `Preconditioner`
+    :param initial_guess: optional first approximation `Vector`
+    :param relative_tolerance: optional `float` max relative error
     :return: solution `Vector`
     """
     validate_system(sys_mat, sys_vec)
 
-    solution = Vector(sys_vec.length)
-    error = sys_vec - sys_mat.times_vector(solution)
-    p = error.copy()
+    kernels = numpy_kernels()
+    uses_defaults = (
+        preconditioner is None and initial_guess is None and relative_tolerance is None
+    )
+    if kernels and isinstance(sys_mat, Matrix) and uses_defaults:
+        return kernels.conjugate_gradient_solve(sys_mat, sys_vec, max_iter, max_error)
 
-    def solution_good_enough():
-        for i in range(sys_vec.length):
-            if math.fabs(error.value_at(i)) > max_error:
-                return False
+    (solution, _) = conjugate_gradient_solve_with_record(
+        sys_mat,
+        sys_vec,
+        max_iter,
+        max_error,
+        preconditioner,
+        initial_guess,
+        relative_tolerance,
+    )
+    return solution
 
-        return True
 
-    for _ in range(max_iter):
-        if solution_good_enough():
-            return solution
+def conjugate_gradient_solve_with_record(
+    sys_mat: Union[Matrix, SymmetricMatrix, CsrMatrix, LinearOperator],
+    sys_vec: Vector,
+    max_iter=100,
+    max_error=1e-8,
+    preconditioner: Preconditioner = None,
+    initial_guess: Vector = None,
+    relative_tolerance: float = None,
+) -> Tuple[Vector, ConvergenceRecord]:
+    """
+    Solves the system like `conjugate_gradient_solve` does, and also
+    returns the `ConvergenceRecord` of the resolution: the number of
+    iterations and the residual norm history.
 
-        m_times_p = sys_mat.times_vector(p)
-        alpha = (error * error).sum / (p * m_times_p).sum
-        solution += p.scaled(alpha)
-        old_error = error.copy()
-        error -= m_times_p.scaled(alpha)
-        beta = (error * error).sum / (old_error * old_error).sum
-        p = error + p.scaled(beta)
+    :param sys_mat: system matrix or `LinearOperator`
+    :param sys_vec: system `Vector`
+    :param max_iter: `int` max number of iterations
+    :param max_error: `float` max error accepted in the solution
+    :param preconditioner: optional `Preconditioner`
+    :param initial_guess: optional first approximation `Vector`
+    :param relative_tolerance: optional `float` max relative error
+    :return: (solution `Vector`, `ConvergenceRecord`)
+    """
+    validate_system(sys_mat, sys_vec)
 
-    raise ArithmeticError(
-        f"Reached max number of iterations ({max_iter}) without " + "a good solution "
-    )
+    size = sys_vec.length
+
+    if initial_guess is not None and initial_guess.length != size:
+        raise ValueError("Size mismatch between initial guess and vector")
+
+    # Work buffers, updated in place in every iteration
+    if initial_guess is None or not any(sys_vec.data):
+        solution = Vector(size)
+        error = sys_vec.copy()
+    else:
+        solution = initial_guess.copy()
+        error = sys_vec - sys_mat.times_vector(solution)
+
+    z = error if preconditioner is None else preconditioner.apply(error)
+    p = z.copy()
+    m_times_p = Vector(size)
+    error_z = error.dot(z)
+    record = ConvergenceRecord([error.norm])
+
+    if relative_tolerance is None:
+
+        def solution_good_enough():
+            return max(map(math.fabs, error.data), default=0.0) <= max_error
+
+    else:
+        max_norm = relative_tolerance * sys_vec.norm
+
+        def solution_good_enough():
+            return record.final_residual_norm <= max_norm
+
+    while not solution_good_enough():
+        if record.iterations == max_iter:
+            raise ArithmeticError(
+                f"Reached max number of iterations ({max_iter}) without "
+                + "a good solution "
+            )
+
+        sys_mat.times_vector(p, out=m_times_p)
+        alpha = error_z / p.dot(m_times_p)
+        solution.axpy(alpha, p)
+        error.axpy(-alpha, m_times_p)
+        record.residual_norms.append(error.norm)
+
+        if preconditioner is not None:
+            preconditioner.apply(error, out=z)
+
+        # p = z + beta * p, keeping the residual product for the next step
+        new_error_z = error.dot(z)
+        p.scale_and_add(new_error_z / error_z, z)
+        error_z = new_error_z
+
+    return solution, record
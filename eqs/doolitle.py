@@ -1,6 +1,10 @@
-from typing import Tuple
+import math
+from array import array
+from operator import mul
+from typing import List, Tuple
+
 from eqs import Matrix, Vector
-from eqs.lu_solve import lu_system_solve
+from eqs.backend import numpy_kernels
 from eqs.validate_sys import validate_system
 
 
@@ -13,14 +17,196 @@ def doolitle_solve(sys_mat: Matrix, sys_vec: Vector) -> Vector:
     Then solves the system in two steps: a forward substitution
     followed by a backward substitution.
 
+    The rows are swapped to use the largest pivot available in each
+    column, as `LUFactorization` does, so systems with zeroes in
+    the main diagonal can be solved too.
+
     :param sys_mat: system's `Matrix`
     :param sys_vec: system's `Vector`
     :return: result `Vector`
     """
     validate_system(sys_mat, sys_vec)
+    return LUFactorization(sys_mat).solve(sys_vec)
+
+
+class LUFactorization:
+    """
+    The LU factorization with partial pivoting of a square matrix,
+    [P][A] = [L][U], computed once and kept to solve any number of
+    systems sharing that matrix. Unlike the Cholesky factorization,
+    the matrix doesn't need to be symmetric or positive-definite.
+
+    In every column, the row with the largest absolute value at or
+    below the diagonal is swapped into the pivot position, so no
+    multiplier of [L] is greater than one. The swaps are recorded in
+    the row permutation [P].
+
+    [L] and [U] are stored in a single matrix: [U] in the upper
+    triangle, including the main diagonal, and the multipliers of
+    [L] below it; the ones in the main diagonal of [L] aren't
+    stored. When `overwrite` is true, the factorization is computed
+    in the system matrix itself, so no other n x n buffer is
+    allocated.
+
+    A singular matrix, with no non-zero pivot left in a column,
+    raises a `ValueError`.
+    """
 
-    (lower, upper) = doolitle_decomposition(sys_mat)
-    return lu_system_solve(lower, upper, sys_vec)
+    def __init__(self, sys_mat: Matrix, overwrite=False):
+        if not sys_mat.is_square:
+            raise ValueError("System matrix must be square")
+
+        self.__lu_matrix = sys_mat if overwrite else sys_mat.copy()
+        self.__permutation = list(range(sys_mat.rows_count))
+        self.__pivot_growth = self.__factorize()
+
+    def __factorize(self):
+        lu_matrix = self.__lu_matrix
+        size = lu_matrix.rows_count
+        permutation = self.__permutation
+        (data, row_stride, col_stride) = (
+            lu_matrix.data,
+            lu_matrix.row_stride,
+            lu_matrix.col_stride,
+        )
+
+        def row_slice(row: int, first_col: int):
+            start = row * row_stride + first_col * col_stride
+            return slice(start, row * row_stride + size * col_stride, col_stride)
+
+        max_value = max(map(math.fabs, data), default=0.0)
+        max_upper = 0.0
+
+        for k in range(size):
+            col_k = k * col_stride
+            pivot_row = max(
+                range(k, size), key=lambda i: math.fabs(data[i * row_stride + col_k])
+            )
+            pivot = data[pivot_row * row_stride + col_k]
+            if pivot == 0.0:
+                raise ValueError(f"Matrix is singular: no pivot in column {k}")
+
+            if pivot_row != k:
+                (row_k, row_p) = (row_slice(k, 0), row_slice(pivot_row, 0))
+                # copied first: if the data is a memoryview, both slices
+                # are views of the same buffer
+                saved = array("d", data[row_k])
+                data[row_k] = data[row_p]
+                data[row_p] = saved
+                (permutation[k], permutation[pivot_row]) = (
+                    permutation[pivot_row],
+                    permutation[k],
+                )
+
+            # the values of row k right of the pivot, already part of [U]
+            u_row = data[row_slice(k, k + 1)]
+            max_upper = max(max_upper, math.fabs(pivot), *map(math.fabs, u_row))
+
+            for i in range(k + 1, size):
+                ik = i * row_stride + col_k
+                l_ik = data[ik] / pivot
+                data[ik] = l_ik
+
+                if l_ik != 0.0:
+                    row_i = row_slice(i, k + 1)
+                    data[row_i] = array(
+                        "d",
+                        [
+                            a_ij - l_ik * u_kj
+                            for a_ij, u_kj in zip(data[row_i], u_row, strict=True)
+                        ],
+                    )
+
+        return max_upper / max_value if max_value else 1.0
+
+    @property
+    def size(self):
+        """
+        Number of equations in the factorized system.
+
+        :return: `int`
+        """
+        return self.__lu_matrix.rows_count
+
+    @property
+    def lu_matrix(self):
+        """
+        The combined matrix holding [U] in its upper triangle and the
+        multipliers of [L] below the main diagonal.
+
+        :return: `Matrix`
+        """
+        return self.__lu_matrix
+
+    @property
+    def permutation(self):
+        """
+        The rows of the system matrix in their factorized order: the
+        row `k` of [L][U] is the row `permutation[k]` of [A].
+
+        :return: `List[int]`
+        """
+        return list(self.__permutation)
+
+    @property
+    def pivot_growth(self):
+        """
+        The pivot growth factor: the largest absolute value in [U]
+        divided by the largest absolute value in the system matrix.
+
+        Partial pivoting keeps it small for most matrices; a large
+        growth means the rounding errors of the factorization may
+        have been amplified, and the solutions lost precision.
+
+        :return: `float`
+        """
+        return self.__pivot_growth
+
+    def solve(self, sys_vec: Vector) -> Vector:
+        """
+        Solves the system for the given vector, using forward and
+        backward substitution on the factorized matrix.
+
+        :param sys_vec: system's `Vector`
+        :return: result `Vector`
+        """
+        (solution,) = self.solve_many([sys_vec])
+        return solution
+
+    def solve_many(self, sys_vectors: List[Vector]) -> List[Vector]:
+        """
+        Solves the system for every one of the given vectors,
+        sweeping the factorized matrix once for all of them in each
+        substitution.
+
+        :param sys_vectors: systems' `Vector`s
+        :return: result `Vector`s, in the same order
+        """
+        for vector in sys_vectors:
+            validate_system(self.__lu_matrix, vector)
+
+        size = self.size
+        lu_matrix = self.__lu_matrix
+        solutions = [
+            [vector.value_at(row) for row in self.__permutation]
+            for vector in sys_vectors
+        ]
+
+        # [L][y] = [P][b], the main diagonal of [L] being ones
+        for i in range(1, size):
+            l_row = lu_matrix.row_values(i)[:i]
+            for solution in solutions:
+                solution[i] -= sum(map(mul, l_row, solution[:i]))
+
+        # [U][x] = [y]
+        for i in range(size - 1, -1, -1):
+            u_row = lu_matrix.row_values(i)
+            u_ii = u_row[i]
+            for solution in solutions:
+                _sum = sum(map(mul, u_row[i + 1 :], solution[i + 1 :]))
+                solution[i] = (solution[i] - _sum) / u_ii
+
+        return [Vector(size).set_data(solution) for solution in solutions]
 
 
 def doolitle_decomposition(matrix: Matrix) -> Tuple[Matrix, Matrix]:
@@ -37,30 +223,33 @@ def doolitle_decomposition(matrix: Matrix) -> Tuple[Matrix, Matrix]:
     if not matrix.is_square:
         raise ValueError("Can't decompose a non-square matrix")
 
+    kernels = numpy_kernels()
+    if kernels:
+        return kernels.doolitle_decomposition(matrix)
+
     size = matrix.rows_count
-    (lower, upper) = (Matrix(size, size), Matrix(size, size))
+
+    # [L] is read by rows and [U] by columns, so [U] is stored by columns
+    (lower, upper) = (Matrix(size, size), Matrix(size, size, column_major=True))
+    (low_data, up_data) = (lower.data, upper.data)
 
     for i in range(size):
+        row_i = i * size
+
         for j in range(size):
             val = matrix.value_at(i, j)
+            col_j = j * size
 
             if i <= j:
-                _sum = 0
-                for k in range(i):
-                    l_ik = lower.value_at(i, k)
-                    u_kj = upper.value_at(k, j)
-                    _sum += l_ik * u_kj
-
-                upper.set_value(val - _sum, i, j)
+                _sum = sum(
+                    map(mul, low_data[row_i : row_i + i], up_data[col_j : col_j + i])
+                )
+                up_data[col_j + i] = val - _sum
 
             if j <= i:
-                _sum = 0
-                for k in range(j):
-                    l_ik = lower.value_at(i, k)
-                    u_kj = upper.value_at(k, j)
-                    _sum += l_ik * u_kj
-
-                u_jj = upper.value_at(j, j)
-                lower.set_value((val - _sum) / u_jj, i, j)
+                _sum = sum(
+                    map(mul, low_data[row_i : row_i + j], up_data[col_j : col_j + j])
+                )
+                low_data[row_i + j] = (val - _sum) / up_data[col_j + j]
 
     return lower, upper
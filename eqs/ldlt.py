@@ -0,0 +1,153 @@
+from operator import mul
+from typing import List, Union
+
+from eqs.matrix import Matrix
+from eqs.pivots import PIVOT_RELATIVE_TOLERANCE, check_pivot
+from eqs.symmetric_matrix import SymmetricMatrix
+from eqs.validate_sys import validate_system
+from eqs.vector import Vector
+
+
+def ldlt_solve(sys_mat: Union[Matrix, SymmetricMatrix], sys_vec: Vector) -> Vector:
+    """
+    Solves the system of linear equations whose matrix, `sys_mat`,
+    is symmetric and positive-definite using the LDL' factorization.
+
+    :param sys_mat: system's `Matrix` or `SymmetricMatrix`
+    :param sys_vec: system's `Vector`
+    :return: result `Vector`
+    """
+    validate_system(sys_mat, sys_vec)
+    return LDLFactorization(sys_mat).solve(sys_vec)
+
+
+class LDLFactorization:
+    """
+    The LDL' factorization of a symmetric, positive-definite matrix,
+    [A] = [L][D][L]', where [L] is a lower triangular matrix with
+    ones in its main diagonal and [D] a diagonal matrix: the pivots.
+
+    Unlike the Cholesky factorization, it doesn't compute any square
+    root, so a singular matrix doesn't surface as a math domain
+    error after the whole factorization, but as a pivot which is
+    checked as soon as it's computed. Each pivot must be positive
+    and greater than `relative_tolerance` times the value in the
+    main diagonal of its row; otherwise a `NonPositivePivotError`,
+    including the row, is raised and the factorization stops.
+
+    The factorization is computed in a packed `SymmetricMatrix`,
+    which holds [L] below the main diagonal and [D] in it. The lower
+    triangle of a `Matrix` is copied into a new one, and so is a
+    `SymmetricMatrix` unless `overwrite` is true.
+    """
+
+    def __init__(
+        self,
+        sys_mat: Union[Matrix, SymmetricMatrix],
+        overwrite=False,
+        relative_tolerance=PIVOT_RELATIVE_TOLERANCE,
+    ):
+        if not sys_mat.is_square:
+            raise ValueError("System matrix must be square")
+
+        if isinstance(sys_mat, SymmetricMatrix):
+            self.__ld_matrix = sys_mat if overwrite else sys_mat.copy()
+        else:
+            self.__ld_matrix = SymmetricMatrix(sys_mat.rows_count)
+            for i in range(sys_mat.rows_count):
+                for j in range(i + 1):
+                    self.__ld_matrix.set_value(sys_mat.value_at(i, j), i, j)
+
+        self.__factorize(relative_tolerance)
+
+    def __factorize(self, relative_tolerance: float):
+        size = self.__ld_matrix.rows_count
+        data = self.__ld_matrix.data
+
+        for i in range(size):
+            row_i = SymmetricMatrix.row_start(i)
+
+            # c_ij = l_ij * d_j, solving the rows from left to right
+            c_row = []
+            for j in range(i):
+                row_j = SymmetricMatrix.row_start(j)
+                _sum = sum(map(mul, c_row, data[row_j : row_j + j]))
+                c_row.append(data[row_i + j] - _sum)
+
+            pivot = data[row_i + i]
+            for j, c_ij in enumerate(c_row):
+                l_ij = c_ij / data[SymmetricMatrix.row_start(j) + j]
+                data[row_i + j] = l_ij
+                pivot -= c_ij * l_ij
+
+            check_pivot(pivot, data[row_i + i], i, relative_tolerance)
+            data[row_i + i] = pivot
+
+    @property
+    def size(self):
+        """
+        Number of equations in the factorized system.
+
+        :return: `int`
+        """
+        return self.__ld_matrix.rows_count
+
+    @property
+    def pivots(self):
+        """
+        The values of the diagonal matrix [D].
+
+        :return: `List[float]`
+        """
+        data = self.__ld_matrix.data
+        return [data[SymmetricMatrix.row_start(i) + i] for i in range(self.size)]
+
+    def solve(self, sys_vec: Vector) -> Vector:
+        """
+        Solves the system for the given vector: a forward
+        substitution over [L], a division by [D] and a backward
+        substitution over [L]'.
+
+        :param sys_vec: system's `Vector`
+        :return: result `Vector`
+        """
+        (solution,) = self.solve_many([sys_vec])
+        return solution
+
+    def solve_many(self, sys_vectors: List[Vector]) -> List[Vector]:
+        """
+        Solves the system for every one of the given vectors,
+        sweeping the factorized matrix once for all of them in each
+        substitution.
+
+        :param sys_vectors: systems' `Vector`s
+        :return: result `Vector`s, in the same order
+        """
+        for vector in sys_vectors:
+            validate_system(self.__ld_matrix, vector)
+
+        size = self.size
+        data = self.__ld_matrix.data
+        solutions = [list(vector.data) for vector in sys_vectors]
+
+        # [L][y] = [b], then [D][z] = [y]
+        for i in range(size):
+            row_i = SymmetricMatrix.row_start(i)
+            l_row = data[row_i : row_i + i]
+            for solution in solutions:
+                solution[i] -= sum(map(mul, l_row, solution[:i]))
+
+        for i in range(size):
+            d_i = data[SymmetricMatrix.row_start(i) + i]
+            for solution in solutions:
+                solution[i] /= d_i
+
+        # [L]'[x] = [z], sweeping [L] by rows from the bottom
+        for i in range(size - 1, 0, -1):
+            row_i = SymmetricMatrix.row_start(i)
+            for j in range(i):
+                l_ij = data[row_i + j]
+                for solution in solutions:
+                    solution[j] -= l_ij * solution[i]
+
+        return [Vector(size).set_data(solution) for solution in solutions]
@@ -0,0 +1,100 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+from eqs.vector import Vector
+
+
+class LinearOperator(ABC):
+    """
+    A linear operator behaves like a matrix [A] in its product times
+    a vector, [A][v], without storing the matrix' values.
+
+    Iterative methods, like the conjugate gradient method, only use
+    the system matrix through this product, so they can solve
+    systems whose matrix is never assembled: the operator computes
+    the product from whatever the matrix is made of.
+
+    Subclasses implement `matvec`, and `diagonal`, which diagonal
+    preconditioners use. Both are abstract methods, so an operator
+    lacking any of them can't be created.
+    """
+
+    def __init__(self, rows_count: int, cols_count: int):
+        self.__rows_count = rows_count
+        self.__cols_count = cols_count
+
+    @property
+    def rows_count(self):
+        """
+        Number of rows of the operator's matrix.
+
+        :return: `int`
+        """
+        return self.__rows_count
+
+    @property
+    def cols_count(self):
+        """
+        Number of columns of the operator's matrix.
+
+        :return: `int`
+        """
+        return self.__cols_count
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """
+        Number of rows and columns of the operator's matrix.
+
+        :return: (`int`, `int`)
+        """
+        return self.__rows_count, self.__cols_count
+
+    @property
+    def is_square(self):
+        """
+        Whether the operator's matrix is square.
+
+        :return: `bool`
+        """
+        return self.__rows_count == self.__cols_count
+
+    @abstractmethod
+    def matvec(self, v: Vector, out: Vector) -> Vector:
+        """
+        Computes the product of the operator's matrix times the
+        vector `v`, writing it into the `out` vector, which has as
+        many values as the matrix has rows and is not `v`.
+
+        :param v: `Vector`
+        :param out: `Vector` where the result is written
+        :return: `out`
+        """
+
+    @abstractmethod
+    def diagonal(self) -> Vector:
+        """
+        Computes the main diagonal of the operator's matrix.
+
+        :return: `Vector`
+        """
+
+    def times_vector(self, v: Vector, out: Vector = None):
+        """
+        Computes the product of the operator's matrix times the
+        vector `v`, like `Matrix.times_vector` does, so operators can
+        be used where a matrix is only multiplied times vectors.
+
+        :param v: `Vector`
+        :param out: optional `Vector` where the result is written
+        :return: `Vector`
+        """
+        if self.__cols_count != v.length:
+            raise ValueError("Size mismatch")
+
+        if out is None:
+            out = Vector(self.__rows_count)
+        elif out.length != self.__rows_count:
+            raise ValueError("Size mismatch with the output vector")
+
+        return self.matvec(v, out)
@@ -1,3 +1,7 @@
+from typing import List
+
+from eqs.backend import numpy_kernels
+from eqs.blocked import dot
 from eqs.matrix import Matrix
 from eqs.vector import Vector
 
@@ -12,20 +16,45 @@ def solve_lower_sys(low_mat: Matrix, vector: Vector) -> Vector:
     :param vector: system's `Vector` [b]
     :return: solution `Vector` [x]
     """
-    size = vector.length
-    solution = Vector(size)
+    kernels = numpy_kernels()
+    if kernels and isinstance(low_mat, Matrix):
+        return kernels.solve_lower_sys(low_mat, vector)
 
-    for i in range(size):
-        _sum = 0.0
+    (solution,) = solve_lower_sys_many(low_mat, [vector])
+    return solution
 
-        for j in range(i):
-            l_ij = low_mat.value_at(i, j)
-            y_j = solution.value_at(j)
-            _sum += l_ij * y_j
 
-        b_i = vector.value_at(i)
-        l_ii = low_mat.value_at(i, i)
-        solution_val = (b_i - _sum) / l_ii
-        solution.set_value(solution_val, i)
+def solve_lower_sys_many(low_mat: Matrix, vectors: List[Vector]) -> List[Vector]:
+    """
+    Given a lower triangular matrix `low_mat` [L] and a list of
+    vectors `vectors` [b1, b2, ...], computes the solution of every
+    [L][x] = [b] system by forward substitution.
 
-    return solution
+    All the systems are solved in a single sweep of the matrix, so
+    each value of [L] is read once for the whole block of vectors
+    instead of once per vector.
+
+    :param low_mat: lower triangular `Matrix` [L]
+    :param vectors: systems' `Vector`s [b1, b2, ...]
+    :return: solution `Vector`s [x1, x2, ...]
+    """
+    size = low_mat.rows_count
+    for vector in vectors:
+        if vector.length != size:
+            raise ValueError("Size mismatch between matrix and vector")
+
+    kernels = numpy_kernels()
+    if kernels and isinstance(low_mat, Matrix):
+        return kernels.solve_lower_sys_many(low_mat, vectors)
+
+    solutions = [vector.data.tolist() for vector in vectors]
+
+    for i in range(size):
+        # the row is copied into a list once for all the vectors
+        l_row = low_mat.row_values(i, 0, i + 1).tolist()
+        l_ii = l_row.pop()
+
+        for solution in solutions:
+            solution[i] = (solution[i] - dot(l_row, solution[:i])) / l_ii
+
+    return [Vector(size).set_data(solution) for solution in solutions]
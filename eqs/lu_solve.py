@@ -1,6 +1,8 @@
+from typing import List
+
 from eqs import Matrix, Vector
-from eqs.lower_system import solve_lower_sys
-from eqs.upper_system import solve_upper_sys
+from eqs.lower_system import solve_lower_sys, solve_lower_sys_many
+from eqs.upper_system import solve_upper_sys, solve_upper_sys_many
 
 
 def lu_system_solve(
@@ -18,3 +20,21 @@ def lu_system_solve(
     """
     low_solution = solve_lower_sys(lower_matrix, sys_vector)
     return solve_upper_sys(upper_matrix, low_solution)
+
+
+def lu_system_solve_many(
+    lower_matrix: Matrix, upper_matrix: Matrix, sys_vectors: List[Vector]
+) -> List[Vector]:
+    """
+    Given a linear equation system's matrix LU decomposition and
+    a list of system vectors, it uses forward and backward
+    substitution to compute the solution for every vector, sweeping
+    each triangular matrix only once.
+
+    :param lower_matrix: lower triangular `Matrix` [L]
+    :param upper_matrix: upper triangular `Matrix` [U]
+    :param sys_vectors: systems' `Vector`s
+    :return: list of vectors, systems' solutions
+    """
+    low_solutions = solve_lower_sys_many(lower_matrix, sys_vectors)
+    return solve_upper_sys_many(upper_matrix, low_solutions)
@@ -1,7 +1,11 @@
+from array import array
 from typing import List
+
 from eqs import Vector
+from eqs.backend import numpy_kernels
+from eqs.blocked import BLOCK_SIZE, dot
+from eqs.buffers import as_array, doubles_view
 from geom2d import are_close_enough
-from utils.lists import list_of_list_of_zeros
 
 
 class Matrix:
@@ -9,14 +13,100 @@ class Matrix:
     A matrix is a n x m array of numbers, where `n` is the number
     of rows and `m` the number of columns.
 
+    The values are stored in a single contiguous array of doubles,
+    row after row (row-major order) or, if `column_major` is set,
+    column after column. The position of a value in the `data`
+    array is `row * row_stride + col * col_stride`.
+
     Upon initialization, the matrix is filled with zeroes.
     """
 
-    def __init__(self, rows_count: int, cols_count: int):
+    __slots__ = (
+        "__rows_count",
+        "__cols_count",
+        "__is_square",
+        "__column_major",
+        "__row_stride",
+        "__col_stride",
+        "__data",
+    )
+
+    def __init__(self, rows_count: int, cols_count: int, column_major=False):
+        self.__set_shape(rows_count, cols_count, column_major)
+        self.__data = array("d", [0.0]) * (rows_count * cols_count)
+
+    def __set_shape(self, rows_count: int, cols_count: int, column_major: bool):
         self.__rows_count = rows_count
         self.__cols_count = cols_count
         self.__is_square = rows_count == cols_count
-        self.__data = list_of_list_of_zeros(rows_count, cols_count)
+        self.__column_major = column_major
+
+        if column_major:
+            self.__row_stride, self.__col_stride = 1, max(rows_count, 1)
+        else:
+            self.__row_stride, self.__col_stride = max(cols_count, 1), 1
+
+    @staticmethod
+    def from_buffer(
+        buffer, rows_count: int = None, cols_count: int = None, column_major=False
+    ):
+        """
+        Creates a matrix whose values are stored in the given
+        `buffer`, any object supporting the buffer protocol that
+        holds doubles or raw bytes, without copying them: modifying
+        the matrix modifies the buffer, and vice versa.
+
+        The values are read row after row, or column after column if
+        `column_major` is set. The number of rows and columns can be
+        omitted for two-dimensional buffers, like the ones exported
+        by other matrices or NumPy arrays, whose shape is used.
+
+        :param buffer: object supporting the buffer protocol
+        :param rows_count: `int` number of rows
+        :param cols_count: `int` number of columns
+        :param column_major: whether the values are stored by columns
+        :return: `Matrix`
+        """
+        if rows_count is None or cols_count is None:
+            shape = memoryview(buffer).shape
+            if len(shape) != 2:
+                raise ValueError("Number of rows and columns needed for the buffer")
+
+            (rows_count, cols_count) = shape[::-1] if column_major else shape
+
+        data = doubles_view(buffer)
+        if len(data) != rows_count * cols_count:
+            raise ValueError(
+                f"Buffer has {len(data)} values, not {rows_count} x {cols_count}"
+            )
+
+        matrix = Matrix(0, 0)
+        matrix.__set_shape(rows_count, cols_count, column_major)
+        matrix.__data = data
+        return matrix
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the matrix' storage through the buffer protocol, as a
+        two-dimensional buffer of doubles (format 'd') with shape
+        (rows, columns), so that `memoryview(matrix)` or
+        `numpy.asarray(matrix)` don't copy the values.
+
+        The buffer protocol can only describe row-major storage, so
+        column-major matrices raise a `BufferError`: their
+        `transposed()` matrix is row-major.
+
+        :param flags: `int` buffer request flags
+        :return: `memoryview`
+        """
+        if self.__column_major:
+            raise BufferError("Column-major matrices can't be exported as buffers")
+
+        view = memoryview(self.__data).cast("B")
+        if self.__rows_count * self.__cols_count == 0:
+            return view.cast("d")
+
+        return view.cast("d", [self.__rows_count, self.__cols_count])
 
     @property
     def rows_count(self):
@@ -46,6 +136,98 @@ class Matrix:
         """
         return self.__is_square
 
+    @property
+    def is_column_major(self):
+        """
+        Whether the values are stored column after column, instead
+        of row after row.
+
+        :return: `bool`
+        """
+        return self.__column_major
+
+    @property
+    def row_stride(self):
+        """
+        Distance in the `data` array between a value and the value
+        right below it.
+
+        :return: `int`
+        """
+        return self.__row_stride
+
+    @property
+    def col_stride(self):
+        """
+        Distance in the `data` array between a value and the value
+        right next to it.
+
+        :return: `int`
+        """
+        return self.__col_stride
+
+    @property
+    def data(self):
+        """
+        The contiguous array of doubles where the values are stored,
+        or the `memoryview` of the buffer the matrix was created
+        from.
+
+        This array is meant for hot loops that want to avoid a
+        method call per value; modifying it modifies the matrix.
+        The value at (`row`, `col`) is at the `index_of(row, col)`
+        position.
+
+        :return: `array` of doubles
+        """
+        return self.__data
+
+    def index_of(self, row: int, col: int):
+        """
+        Returns the position in the `data` array of the value at
+        the given `row` and `col`.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `int` position in `data`
+        """
+        return row * self.__row_stride + col * self.__col_stride
+
+    def row_values(self, row: int, start_col=0, stop_col: int = None):
+        """
+        Returns a new array with the values of the given `row`, or
+        only the ones in the columns from `start_col` up to, but not
+        including, `stop_col`.
+
+        For row-major matrices, this is a single slice of the
+        `data` array.
+
+        :param row: `int` row index
+        :param start_col: `int` first column index
+        :param stop_col: `int` column index after the last one
+        :return: `array` of doubles
+        """
+        if stop_col is None:
+            stop_col = self.__cols_count
+
+        start = row * self.__row_stride + start_col * self.__col_stride
+        stop = row * self.__row_stride + stop_col * self.__col_stride
+        return as_array(self.__data[start : stop : self.__col_stride])
+
+    def col_values(self, col: int):
+        """
+        Returns a new array with the values of the given `col`.
+
+        For column-major matrices, this is a single slice of the
+        `data` array.
+
+        :param col: `int` column index
+        :return: `array` of doubles
+        """
+        start = col * self.__col_stride
+        stop = start + self.__rows_count * self.__row_stride
+        return as_array(self.__data[start : stop : self.__row_stride])
+
     def set_value(self, value: float, row: int, col: int):
         """
         Sets the given `value` in the matrix at the position
@@ -62,7 +244,8 @@ class Matrix:
         :param col: `int` column index
         :return: this matrix
         """
-        self.__data[row][col] = value
+        self.__ensure_in_bounds(row, col)
+        self.__data[row * self.__row_stride + col * self.__col_stride] = value
         return self
 
     def add_to_value(self, amount: float, row: int, col: int):
@@ -78,7 +261,8 @@ class Matrix:
         :param col: int` column index
         :return: this matrix
         """
-        self.__data[row][col] += amount
+        self.__ensure_in_bounds(row, col)
+        self.__data[row * self.__row_stride + col * self.__col_stride] += amount
         return self
 
     def set_data(self, data: List[float]):
@@ -100,10 +284,13 @@ class Matrix:
         if len(data) != self.__cols_count * self.__rows_count:
             raise ValueError("Cannot set data: size mismatch")
 
-        for row in range(self.__rows_count):
-            offset = self.__cols_count * row
-            for col in range(self.__cols_count):
-                self.__data[row][col] = data[offset + col]
+        if self.is_column_major:
+            for row in range(self.__rows_count):
+                offset = self.__cols_count * row
+                for col in range(self.__cols_count):
+                    self.__data[row + col * self.__col_stride] = data[offset + col]
+        else:
+            self.__data[:] = array("d", data)
 
         return self
 
@@ -117,7 +304,7 @@ class Matrix:
         :return: this matrix
         """
         for col in range(self.__cols_count):
-            self.__data[row][col] = 1 if row == col else 0
+            self.__data[self.index_of(row, col)] = 1 if row == col else 0
 
         return self
 
@@ -131,7 +318,7 @@ class Matrix:
         :return: this matrix
         """
         for row in range(self.__rows_count):
-            self.__data[row][col] = 1 if row == col else 0
+            self.__data[self.index_of(row, col)] = 1 if row == col else 0
 
         return self
 
@@ -144,7 +331,8 @@ class Matrix:
         :param col: `int` column index
         :return: this matrix
         """
-        return self.__data[row][col]
+        self.__ensure_in_bounds(row, col)
+        return self.__data[row * self.__row_stride + col * self.__col_stride]
 
     def value_transposed_at(self, row: int, col: int):
         """
@@ -159,20 +347,21 @@ class Matrix:
         :param col: `int` column index
         :return:
         """
-        return self.__data[col][row]
+        return self.value_at(col, row)
 
     def transposed(self):
         """
         Creates a new matrix, result of transposing this matrix.
 
+        The values are copied in the same order, which is the
+        opposite storage order for the transposed matrix.
+
         :return: transposed matrix
         """
-        trans_mat = Matrix(self.__cols_count, self.__rows_count)
-
-        for i in range(self.__rows_count):
-            for j in range(self.__cols_count):
-                trans_mat.__data[j][i] = self.__data[i][j]
-
+        trans_mat = Matrix(
+            self.__cols_count, self.__rows_count, column_major=not self.is_column_major
+        )
+        memoryview(trans_mat.__data)[:] = self.__data
         return trans_mat
 
     def scale(self, factor: float):
@@ -186,13 +375,13 @@ class Matrix:
         :param factor: `float`
         :return: this matrix
         """
-        for i in range(self.__rows_count):
-            for j in range(self.__cols_count):
-                self.__data[i][j] *= factor
+        data = self.__data
+        for i in range(len(data)):
+            data[i] *= factor
 
         return self
 
-    def times_vector(self, v: Vector):
+    def times_vector(self, v: Vector, out: Vector = None):
         """
         Creates a new `Vector` result of multiplying this `Matrix`
         times the passed `Vector`.
@@ -203,20 +392,29 @@ class Matrix:
         The resulting `Vector` has a length equal to this matrix'
         rows count.
 
+        The product can be written into an existing `out` vector,
+        which must not be `v`, instead of a new one.
+
         :param v: `Vector`
+        :param out: optional `Vector` where the result is written
         :return: `Vector`
         """
         if self.__cols_count != v.length:
             raise ValueError("Size mismatch")
 
-        result = Vector(self.__rows_count)
+        if out is not None and out.length != self.__rows_count:
+            raise ValueError("Size mismatch with the output vector")
 
-        for i in range(self.__rows_count):
-            product_sum = 0
-            for j in range(self.__cols_count):
-                product_sum += self.__data[i][j] * v.value_at(j)
+        kernels = numpy_kernels()
+        if kernels:
+            return kernels.times_vector(self, v, out)
 
-            result.set_value(product_sum, i)
+        result = Vector(self.__rows_count) if out is None else out
+        result_data = result.data
+        v_data = v.data
+
+        for i in range(self.__rows_count):
+            result_data[i] = dot(self.row_values(i), v_data)
 
         return result
 
@@ -237,7 +435,7 @@ class Matrix:
 
         for i in range(self.__rows_count):
             for j in range(self.__cols_count):
-                result.__data[i][j] += other.__data[i][j]
+                result.add_to_value(other.value_at(i, j), i, j)
 
         return result
 
@@ -258,7 +456,7 @@ class Matrix:
 
         for i in range(self.__rows_count):
             for j in range(self.__cols_count):
-                result.__data[i][j] -= other.__data[i][j]
+                result.add_to_value(-other.value_at(i, j), i, j)
 
         return result
 
@@ -288,20 +486,29 @@ class Matrix:
         if self.__cols_count != other.__rows_count:
             raise ValueError("Size mismatch")
 
+        kernels = numpy_kernels()
+        if kernels:
+            return kernels.multiply(self, other)
+
         rows = self.__rows_count
         cols = other.__cols_count
-        size = self.__cols_count
-        a_data = self.__data
-        b_data = other.__data
         result = Matrix(rows, cols)
-
-        for i in range(rows):
-            for j in range(cols):
-                prod_sum = 0
-                for k in range(size):
-                    prod_sum += a_data[i][k] * b_data[k][j]
-
-                result.__data[i][j] = prod_sum
+        result_data = result.__data
+
+        # A block of columns of `other` is copied into lists once, and
+        # multiplied times every row of this matrix
+        for j0 in range(0, cols, BLOCK_SIZE):
+            b_cols = [
+                other.col_values(j).tolist()
+                for j in range(j0, min(j0 + BLOCK_SIZE, cols))
+            ]
+
+            for i in range(rows):
+                a_row = self.row_values(i).tolist()
+                start = i * cols + j0
+                result_data[start : start + len(b_cols)] = array(
+                    "d", [dot(a_row, b_col) for b_col in b_cols]
+                )
 
         return result
 
@@ -312,11 +519,10 @@ class Matrix:
 
         :return: `Matrix`
         """
-        matrix = Matrix(self.__rows_count, self.__cols_count)
-        for i in range(self.__rows_count):
-            for j in range(self.__cols_count):
-                matrix.__data[i][j] = self.__data[i][j]
-
+        matrix = Matrix(
+            self.__rows_count, self.__cols_count, column_major=self.is_column_major
+        )
+        memoryview(matrix.__data)[:] = self.__data
         return matrix
 
     def __eq__(self, other):
@@ -344,7 +550,11 @@ class Matrix:
 
         for i in range(self.__rows_count):
             for j in range(self.__cols_count):
-                if not are_close_enough(self.__data[i][j], other.__data[i][j]):
+                if not are_close_enough(self.value_at(i, j), other.value_at(i, j)):
                     return False
 
         return True
+
+    def __ensure_in_bounds(self, row: int, col: int):
+        if not (0 <= row < self.__rows_count and 0 <= col < self.__cols_count):
+            raise IndexError(f"Position ({row}, {col}) out of bounds")
@@ -0,0 +1,277 @@
+from typing import Union
+
+from eqs.blocked import dot
+from eqs.buffers import as_array
+from eqs.matrix import Matrix
+from eqs.vector import Vector
+
+
+class MatrixView:
+    """
+    A view of a block of a `Matrix`, or of another view: the values
+    in a range of its rows and a range of its columns, optionally
+    transposed, read and written in the matrix' own storage.
+
+    The ranges are Python `range` objects, so they can skip rows or
+    columns with a step; their steps must be positive. Creating a
+    view doesn't copy any value, so algorithms working on partitions
+    of a matrix, like the free and constrained blocks of a stiffness
+    matrix, can use them without allocating a new matrix:
+
+        free = range(0, 10)
+        k_ff = MatrixView(k, free, free)
+
+    Writing to the view modifies the viewed matrix, and vice versa.
+    """
+
+    __slots__ = (
+        "__data",
+        "__offset",
+        "__rows_count",
+        "__cols_count",
+        "__row_stride",
+        "__col_stride",
+    )
+
+    def __init__(
+        self,
+        matrix: Union[Matrix, "MatrixView"],
+        rows: range = None,
+        cols: range = None,
+        transposed=False,
+    ):
+        rows = range(matrix.rows_count) if rows is None else rows
+        cols = range(matrix.cols_count) if cols is None else cols
+
+        if rows.step <= 0 or cols.step <= 0:
+            raise ValueError("The rows and columns ranges must have positive steps")
+
+        if len(rows) and not (0 <= rows[0] and rows[-1] < matrix.rows_count):
+            raise IndexError(f"Rows {rows} out of bounds")
+
+        if len(cols) and not (0 <= cols[0] and cols[-1] < matrix.cols_count):
+            raise IndexError(f"Columns {cols} out of bounds")
+
+        self.__data = matrix.data
+        self.__offset = matrix.index_of(rows.start, cols.start)
+        (self.__rows_count, self.__cols_count) = (len(rows), len(cols))
+        (self.__row_stride, self.__col_stride) = (
+            matrix.row_stride * rows.step,
+            matrix.col_stride * cols.step,
+        )
+
+        if transposed:
+            (self.__rows_count, self.__cols_count) = (
+                self.__cols_count,
+                self.__rows_count,
+            )
+            (self.__row_stride, self.__col_stride) = (
+                self.__col_stride,
+                self.__row_stride,
+            )
+
+    @property
+    def rows_count(self):
+        """
+        Number of rows in the view.
+
+        :return: `int`
+        """
+        return self.__rows_count
+
+    @property
+    def cols_count(self):
+        """
+        Number of columns in the view.
+
+        :return: `int`
+        """
+        return self.__cols_count
+
+    @property
+    def is_square(self):
+        """
+        Whether the view has the same number of rows and columns.
+
+        :return: `bool`
+        """
+        return self.__rows_count == self.__cols_count
+
+    @property
+    def data(self):
+        """
+        The storage array of the viewed matrix, shared with it.
+
+        :return: `array` of doubles
+        """
+        return self.__data
+
+    @property
+    def row_stride(self):
+        """
+        Distance in `data` between the values of consecutive rows.
+
+        :return: `int`
+        """
+        return self.__row_stride
+
+    @property
+    def col_stride(self):
+        """
+        Distance in `data` between the values of consecutive columns.
+
+        :return: `int`
+        """
+        return self.__col_stride
+
+    def index_of(self, row: int, col: int):
+        """
+        Returns the index in `data` of the value at the given
+        position of the view.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `int` index in `data`
+        """
+        return self.__offset + row * self.__row_stride + col * self.__col_stride
+
+    def value_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col`.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        self.__ensure_in_bounds(row, col)
+        return self.__data[self.index_of(row, col)]
+
+    def value_transposed_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col` as if this view was transposed.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        return self.value_at(col, row)
+
+    def set_value(self, value: float, row: int, col: int):
+        """
+        Sets the given `value` at the position indicated by `row`
+        and `col` indices, in the viewed matrix.
+
+        :param value: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this view
+        """
+        self.__ensure_in_bounds(row, col)
+        self.__data[self.index_of(row, col)] = value
+        return self
+
+    def add_to_value(self, amount: float, row: int, col: int):
+        """
+        Adds the given `amount` to the value at the position
+        indicated by `row` and `col` indices, in the viewed matrix.
+
+        :param amount: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this view
+        """
+        self.__ensure_in_bounds(row, col)
+        self.__data[self.index_of(row, col)] += amount
+        return self
+
+    def row_values(self, row: int, start_col=0, stop_col: int = None):
+        """
+        Returns a new array with the values of the given `row`, or
+        only the ones in the columns from `start_col` up to, but not
+        including, `stop_col`.
+
+        :param row: `int` row index
+        :param start_col: `int` first column index
+        :param stop_col: `int` column index after the last one
+        :return: `array` of doubles
+        """
+        if stop_col is None:
+            stop_col = self.__cols_count
+
+        if stop_col <= start_col:
+            return as_array(self.__data[0:0])
+
+        start = self.index_of(row, start_col)
+        stop = self.index_of(row, stop_col - 1) + 1
+        return as_array(self.__data[start : stop : self.__col_stride])
+
+    def col_values(self, col: int):
+        """
+        Returns a new array with the values of the given `col`.
+
+        :param col: `int` column index
+        :return: `array` of doubles
+        """
+        if self.__rows_count == 0:
+            return as_array(self.__data[0:0])
+
+        start = self.index_of(0, col)
+        stop = self.index_of(self.__rows_count - 1, col) + 1
+        return as_array(self.__data[start : stop : self.__row_stride])
+
+    def transposed(self):
+        """
+        Creates a view of the transpose of this view, over the same
+        storage.
+
+        :return: `MatrixView`
+        """
+        return MatrixView(self, transposed=True)
+
+    def times_vector(self, v: Vector, out: Vector = None):
+        """
+        Computes the product of the viewed block times the vector
+        `v`, reading each row of the block as a slice of the viewed
+        matrix' storage.
+
+        The result can be written into an existing `out` vector,
+        which can't be `v`, instead of a new one.
+
+        :param v: `Vector`
+        :param out: optional `Vector` where the result is written
+        :return: `Vector`
+        """
+        if self.__cols_count != v.length:
+            raise ValueError("Size mismatch")
+
+        if out is not None and out.length != self.__rows_count:
+            raise ValueError("Size mismatch with the output vector")
+
+        result = Vector(self.__rows_count) if out is None else out
+        result_data = result.data
+        v_data = v.data
+
+        for i in range(self.__rows_count):
+            result_data[i] = dot(self.row_values(i), v_data)
+
+        return result
+
+    def to_matrix(self):
+        """
+        Creates a new `Matrix` with a copy of the viewed values.
+
+        :return: `Matrix`
+        """
+        matrix = Matrix(self.__rows_count, self.__cols_count)
+        cols = self.__cols_count
+
+        for i in range(self.__rows_count):
+            matrix.data[i * cols : (i + 1) * cols] = self.row_values(i)
+
+        return matrix
+
+    def __ensure_in_bounds(self, row: int, col: int):
+        if not (0 <= row < self.__rows_count and 0 <= col < self.__cols_count):
+            raise IndexError(f"Position ({row}, {col}) out of bounds")
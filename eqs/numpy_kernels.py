@@ -0,0 +1,215 @@
+"""
+Vectorized NumPy implementations of the `eqs` numeric kernels.
+
+These functions are used instead of the pure Python ones when the
+NumPy backend is selected (see `eqs.backend`). They take and return
+the same `Matrix` and `Vector` types: the NumPy arrays are views of
+their storage buffers, so no values are copied on the way in.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from eqs.matrix import Matrix
+from eqs.vector import Vector
+
+
+def matrix_to_array(matrix: Matrix) -> np.ndarray:
+    """
+    Returns a two-dimensional NumPy array sharing the storage of
+    the given `matrix`.
+
+    :param matrix: `Matrix`
+    :return: NumPy array view of the matrix
+    """
+    flat = np.frombuffer(matrix.data, dtype=np.float64)
+
+    if matrix.is_column_major:
+        return flat.reshape(matrix.cols_count, matrix.rows_count).T
+
+    return flat.reshape(matrix.rows_count, matrix.cols_count)
+
+
+def vector_to_array(vector: Vector) -> np.ndarray:
+    """
+    Returns a NumPy array sharing the storage of the given `vector`.
+
+    :param vector: `Vector`
+    :return: NumPy array view of the vector
+    """
+    return np.frombuffer(vector.data, dtype=np.float64)
+
+
+def array_to_matrix(values: np.ndarray) -> Matrix:
+    """
+    Creates a new row-major `Matrix` with the values of the given
+    two-dimensional NumPy array.
+
+    :param values: NumPy array
+    :return: `Matrix`
+    """
+    (rows, cols) = values.shape
+    matrix = Matrix(rows, cols)
+    matrix_to_array(matrix)[:] = values
+    return matrix
+
+
+def array_to_vector(values: np.ndarray) -> Vector:
+    """
+    Creates a new `Vector` with the values of the given NumPy array.
+
+    :param values: NumPy array
+    :return: `Vector`
+    """
+    vector = Vector(len(values))
+    vector_to_array(vector)[:] = values
+    return vector
+
+
+def multiply(a: Matrix, b: Matrix) -> Matrix:
+    return array_to_matrix(matrix_to_array(a) @ matrix_to_array(b))
+
+
+def times_vector(matrix: Matrix, vector: Vector, out: Vector = None) -> Vector:
+    product = matrix_to_array(matrix) @ vector_to_array(vector)
+    if out is None:
+        return array_to_vector(product)
+
+    vector_to_array(out)[:] = product
+    return out
+
+
+def lower_matrix_decomposition(sys_mat: Matrix) -> Matrix:
+    values = matrix_to_array(sys_mat)
+
+    try:
+        return array_to_matrix(np.linalg.cholesky(values))
+    except np.linalg.LinAlgError as error:
+        raise ValueError(f"Matrix isn't positive-definite: {error}") from error
+
+
+def lower_matrix_decomposition_in_place(sys_mat: Matrix) -> Matrix:
+    values = matrix_to_array(sys_mat)
+
+    try:
+        values[:] = np.linalg.cholesky(values)
+    except np.linalg.LinAlgError as error:
+        raise ValueError(f"Matrix isn't positive-definite: {error}") from error
+
+    return sys_mat
+
+
+def doolitle_decomposition(matrix: Matrix) -> Tuple[Matrix, Matrix]:
+    values = matrix_to_array(matrix)
+    size = matrix.rows_count
+    lower = np.eye(size)
+    upper = np.zeros((size, size))
+
+    for k in range(size):
+        upper[k, k:] = values[k, k:] - lower[k, :k] @ upper[:k, k:]
+        lower[k + 1 :, k] = (
+            values[k + 1 :, k] - lower[k + 1 :, :k] @ upper[:k, k]
+        ) / __pivot(upper[k, k])
+
+    return array_to_matrix(lower), array_to_matrix(upper)
+
+
+def solve_lower_sys(low_mat: Matrix, vector: Vector) -> Vector:
+    (solution,) = solve_lower_sys_many(low_mat, [vector])
+    return solution
+
+
+def solve_upper_sys(up_matrix: Matrix, vector: Vector) -> Vector:
+    (solution,) = solve_upper_sys_many(up_matrix, [vector])
+    return solution
+
+
+def solve_transposed_upper_sys(low_mat: Matrix, vector: Vector) -> Vector:
+    (solution,) = solve_transposed_upper_sys_many(low_mat, [vector])
+    return solution
+
+
+def solve_lower_sys_many(low_mat: Matrix, vectors: List[Vector]) -> List[Vector]:
+    lower = matrix_to_array(low_mat)
+    solutions = __vectors_to_columns(low_mat.rows_count, vectors)
+
+    for i in range(low_mat.rows_count):
+        solutions[i] -= lower[i, :i] @ solutions[:i]
+        solutions[i] /= lower[i, i]
+
+    return __columns_to_vectors(solutions)
+
+
+def solve_upper_sys_many(up_matrix: Matrix, vectors: List[Vector]) -> List[Vector]:
+    upper = matrix_to_array(up_matrix)
+    solutions = __vectors_to_columns(up_matrix.rows_count, vectors)
+
+    for i in range(up_matrix.rows_count - 1, -1, -1):
+        solutions[i] -= upper[i, i + 1 :] @ solutions[i + 1 :]
+        solutions[i] /= upper[i, i]
+
+    return __columns_to_vectors(solutions)
+
+
+def solve_transposed_upper_sys_many(
+    low_mat: Matrix, vectors: List[Vector]
+) -> List[Vector]:
+    lower = matrix_to_array(low_mat)
+    solutions = __vectors_to_columns(low_mat.rows_count, vectors)
+
+    for i in range(low_mat.rows_count - 1, -1, -1):
+        solutions[i] -= lower[i + 1 :, i] @ solutions[i + 1 :]
+        solutions[i] /= lower[i, i]
+
+    return __columns_to_vectors(solutions)
+
+
+def conjugate_gradient_solve(
+    sys_mat: Matrix, sys_vec: Vector, max_iter: int, max_error: float
+) -> Vector:
+    matrix = matrix_to_array(sys_mat)
+    solution = np.zeros(sys_vec.length)
+    error = vector_to_array(sys_vec) - matrix @ solution
+    p = error.copy()
+    error_sq = error @ error
+
+    for _ in range(max_iter):
+        if np.all(np.abs(error) <= max_error):
+            break
+
+        m_times_p = matrix @ p
+        alpha = error_sq / (p @ m_times_p)
+        solution += alpha * p
+        error -= alpha * m_times_p
+        new_error_sq = error @ error
+        p = error + (new_error_sq / error_sq) * p
+        error_sq = new_error_sq
+    else:
+        # the last iteration's solution is only checked here
+        if not np.all(np.abs(error) <= max_error):
+            raise ArithmeticError(
+                f"Reached max number of iterations ({max_iter}) without "
+                + "a good solution "
+            )
+
+    return array_to_vector(solution)
+
+
+def __pivot(value: float) -> float:
+    # NumPy would silently divide by zero into infinities
+    if value == 0:
+        raise ZeroDivisionError("Zero pivot in the decomposition")
+
+    return value
+
+
+def __vectors_to_columns(size: int, vectors: List[Vector]) -> np.ndarray:
+    if not vectors:
+        return np.zeros((size, 0))
+
+    return np.column_stack([vector_to_array(vector) for vector in vectors])
+
+
+def __columns_to_vectors(columns: np.ndarray) -> List[Vector]:
+    return [array_to_vector(columns[:, k]) for k in range(columns.shape[1])]
@@ -0,0 +1,129 @@
+import heapq
+from collections import deque
+from typing import List
+
+
+def reverse_cuthill_mckee(adjacency: List[List[int]]) -> List[int]:
+    """
+    Computes the Reverse Cuthill-McKee ordering of a graph given by
+    its `adjacency` lists: the neighbours of every vertex.
+
+    The ordering numbers the vertices by a breadth-first traversal
+    that starts at a pseudo-peripheral vertex and visits the
+    neighbours by increasing degree, then reverses the result. When
+    used to number the unknowns of a system of equations whose
+    graph is `adjacency`, the matrix' bandwidth and profile become
+    small.
+
+    Disconnected components are ordered one after the other.
+
+    The result is the list of vertices in their new order, that is,
+    the vertex at index `k` is the one numbered `k`.
+
+    :param adjacency: neighbours of every vertex
+    :return: vertices in their new order
+    """
+    count = len(adjacency)
+    degrees = [len(neighbours) for neighbours in adjacency]
+    visited = [False] * count
+    order = []
+
+    for start in sorted(range(count), key=lambda v: degrees[v]):
+        if visited[start]:
+            continue
+
+        root = __pseudo_peripheral_vertex(adjacency, degrees, start)
+        visited[root] = True
+        queue = deque([root])
+
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+
+            neighbours = [n for n in adjacency[vertex] if not visited[n]]
+            for neighbour in sorted(set(neighbours), key=lambda v: degrees[v]):
+                visited[neighbour] = True
+                queue.append(neighbour)
+
+    order.reverse()
+    return order
+
+
+def minimum_degree(adjacency: List[List[int]]) -> List[int]:
+    """
+    Computes a minimum degree ordering of a graph given by its
+    `adjacency` lists: the neighbours of every vertex.
+
+    The ordering simulates the elimination of the vertices, which
+    is what a Cholesky factorization does to the unknowns of a
+    system of equations: eliminating a vertex connects all its
+    neighbours between them, which is the fill-in of the factor.
+    Choosing the vertex with the fewest neighbours every time keeps
+    this fill-in small, and thus the factor sparse.
+
+    The degrees are exact and kept in a heap; ties are resolved by
+    the lowest vertex index, so the ordering is deterministic.
+
+    The result is the list of vertices in their new order, that is,
+    the vertex at index `k` is the one numbered `k`.
+
+    :param adjacency: neighbours of every vertex
+    :return: vertices in their new order
+    """
+    graph = [set(neighbours) - {v} for v, neighbours in enumerate(adjacency)]
+    heap = [(len(neighbours), v) for v, neighbours in enumerate(graph)]
+    heapq.heapify(heap)
+    eliminated = [False] * len(graph)
+    order = []
+
+    while heap:
+        degree, vertex = heapq.heappop(heap)
+        if eliminated[vertex] or degree != len(graph[vertex]):
+            continue
+
+        eliminated[vertex] = True
+        order.append(vertex)
+
+        neighbours = graph[vertex]
+        graph[vertex] = set()
+
+        for neighbour in neighbours:
+            neighbour_graph = graph[neighbour]
+            neighbour_graph.discard(vertex)
+            neighbour_graph.update(neighbours)
+            neighbour_graph.discard(neighbour)
+            heapq.heappush(heap, (len(neighbour_graph), neighbour))
+
+    return order
+
+
+def __pseudo_peripheral_vertex(adjacency, degrees, start):
+    vertex = start
+    levels = __level_structure(adjacency, vertex)
+
+    while True:
+        candidate = min(levels[-1], key=lambda v: degrees[v])
+        candidate_levels = __level_structure(adjacency, candidate)
+
+        if len(candidate_levels) <= len(levels):
+            return vertex
+
+        vertex, levels = candidate, candidate_levels
+
+
+def __level_structure(adjacency, root):
+    levels = [[root]]
+    seen = {root}
+
+    while True:
+        next_level = []
+        for vertex in levels[-1]:
+            for neighbour in adjacency[vertex]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    next_level.append(neighbour)
+
+        if not next_level:
+            return levels
+
+        levels.append(next_level)
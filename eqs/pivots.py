@@ -0,0 +1,47 @@
+PIVOT_RELATIVE_TOLERANCE = 1e-10
+
+
+class NonPositivePivotError(ValueError):
+    """
+    Error raised by the factorizations of positive-definite matrices
+    when a pivot isn't positive: the matrix is singular, or isn't
+    positive-definite.
+
+    The `index` is the unknown, in the system's original numbering,
+    whose equation has the offending pivot, so the error can be
+    traced back to whatever the equation models.
+    """
+
+    def __init__(self, index: int, pivot: float):
+        ValueError.__init__(
+            self,
+            f"Matrix is singular or isn't positive-definite: "
+            f"pivot {pivot} at unknown {index}",
+        )
+        self.index = index
+        self.pivot = pivot
+
+
+def check_pivot(
+    pivot: float,
+    diagonal_value: float,
+    index: int,
+    relative_tolerance=PIVOT_RELATIVE_TOLERANCE,
+):
+    """
+    Makes sure the `pivot` of the equation at `index` is positive,
+    and not negligible compared to the equation's value in the main
+    diagonal of the system matrix, `diagonal_value`.
+
+    A singular matrix has zero pivots, which rounding errors turn
+    into tiny values of any sign, so pivots smaller than
+    `relative_tolerance` times the diagonal value are considered
+    zero too.
+
+    :param pivot: `float` pivot value
+    :param diagonal_value: `float` value in the system's diagonal
+    :param index: `int` unknown of the equation
+    :param relative_tolerance: `float` smallest relative pivot
+    """
+    if pivot <= relative_tolerance * abs(diagonal_value):
+        raise NonPositivePivotError(index, pivot)
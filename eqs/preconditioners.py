@@ -0,0 +1,228 @@
+import math
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+from eqs.linear_operator import LinearOperator
+from eqs.sparse_matrix import CsrMatrix, make_csr_from_matrix
+from eqs.vector import Vector
+
+
+class Preconditioner(ABC):
+    """
+    A preconditioner [M] approximates a system's matrix [A] with a
+    matrix whose systems are cheap to solve. The preconditioned
+    conjugate gradient method solves one [M][z] = [r] system per
+    iteration, and the closer [M] is to [A], the fewer iterations it
+    needs.
+
+    Preconditioners are set up once from the system matrix, and can
+    then be applied to the residuals of any number of resolutions
+    sharing that matrix.
+
+    Subclasses implement `apply`, an abstract method, so a
+    preconditioner lacking it can't be created.
+    """
+
+    @abstractmethod
+    def apply(self, vector: Vector, out: Vector = None) -> Vector:
+        """
+        Computes the solution of the [M][z] = [r] system, where [r]
+        is the given `vector`.
+
+        The solution can be written into an existing `out` vector
+        instead of a new one.
+
+        :param vector: residual `Vector` [r]
+        :param out: optional `Vector` where the solution is written
+        :return: preconditioned `Vector` [z]
+        """
+
+
+class JacobiPreconditioner(Preconditioner):
+    """
+    The Jacobi (or diagonal) preconditioner uses the main diagonal
+    of the system matrix: [M] = diag([A]).
+
+    It's the cheapest preconditioner to set up and apply, and
+    compensates the scaling differences between the equations, like
+    the ones caused by bars with very different stiffness.
+
+    The diagonal of a `LinearOperator` is computed by its `diagonal`
+    method, so it can precondition matrix-free systems.
+    """
+
+    def __init__(self, sys_mat):
+        size = sys_mat.rows_count
+        self.__inverse_diagonal = [0.0] * size
+
+        if isinstance(sys_mat, LinearOperator):
+            diagonal = sys_mat.diagonal().data
+        else:
+            diagonal = [sys_mat.value_at(i, i) for i in range(size)]
+
+        for i in range(size):
+            a_ii = diagonal[i]
+            if a_ii == 0:
+                raise ValueError(f"Zero value in the main diagonal, at row {i}")
+
+            self.__inverse_diagonal[i] = 1.0 / a_ii
+
+    def apply(self, vector: Vector, out: Vector = None) -> Vector:
+        result = _output_for(vector, out)
+        result_data = result.data
+        v_data = vector.data
+
+        for i, inverse in enumerate(self.__inverse_diagonal):
+            result_data[i] = inverse * v_data[i]
+
+        return result
+
+
+class SsorPreconditioner(Preconditioner):
+    """
+    The Symmetric Successive Over-Relaxation preconditioner, for a
+    symmetric matrix [A] = [L] + [D] + [L]', where [L] is its strict
+    lower triangle and [D] its diagonal:
+
+        [M] = w/(2 - w) ([D]/w + [L]) ([D]/w)^-1 ([D]/w + [L]')
+
+    The relaxation factor `w` (`omega`) must be in the (0, 2) range.
+
+    Applying it takes a forward and a backward substitution over the
+    lower triangle of [A], so it costs about the same as a product
+    of [A] times a vector, and doesn't need any setup besides
+    splitting the matrix.
+    """
+
+    def __init__(self, sys_mat, omega=1.0):
+        if not 0 < omega < 2:
+            raise ValueError(f"Relaxation factor must be in (0, 2): {omega}")
+
+        self.__omega = omega
+        (self.__diagonal, self.__lower_rows) = _split_lower(sys_mat)
+
+    def apply(self, vector: Vector, out: Vector = None) -> Vector:
+        omega = self.__omega
+        diagonal = self.__diagonal
+        lower_rows = self.__lower_rows
+        result = _output_for(vector, out)
+        values = result.data
+        values[:] = vector.data
+
+        # ([D]/w + [L]) [y] = [r]
+        for i, row in enumerate(lower_rows):
+            _sum = sum(a_ij * values[j] for j, a_ij in row)
+            values[i] = (values[i] - _sum) * omega / diagonal[i]
+
+        # [w] = ([D]/w) [y]
+        for i in range(len(values)):
+            values[i] *= diagonal[i] / omega
+
+        # ([D]/w + [L]') [z] = [w], sweeping [L] by rows from the bottom
+        for i in range(len(values) - 1, -1, -1):
+            values[i] *= omega / diagonal[i]
+            for j, a_ij in lower_rows[i]:
+                values[j] -= a_ij * values[i]
+
+        return result.scale((2 - omega) / omega)
+
+
+class IncompleteCholeskyPreconditioner(Preconditioner):
+    """
+    The zero fill-in incomplete Cholesky preconditioner, IC(0):
+    [M] = [L][L]', where [L] is computed like the Cholesky factor of
+    [A] but only in the positions where [A] has non-zero values.
+
+    It's a much closer approximation to [A] than the diagonal
+    preconditioners, at the cost of a factorization-like setup. For
+    some positive-definite matrices the incomplete factorization
+    breaks down with a non-positive pivot, in which case an
+    `ArithmeticError` is raised.
+    """
+
+    def __init__(self, sys_mat):
+        (diagonal, lower_rows) = _split_lower(sys_mat)
+        size = len(diagonal)
+        low_rows = [dict() for _ in range(size)]
+        low_diagonal = [0.0] * size
+
+        for i in range(size):
+            row_i = low_rows[i]
+
+            for k, a_ik in lower_rows[i]:
+                row_k = low_rows[k]
+                _sum = sum(l_ij * row_k[j] for j, l_ij in row_i.items() if j in row_k)
+                row_i[k] = (a_ik - _sum) / low_diagonal[k]
+
+            pivot = diagonal[i] - sum(l_ij * l_ij for l_ij in row_i.values())
+            if pivot <= 0:
+                raise ArithmeticError(
+                    f"Incomplete Cholesky factorization breaks down at row {i}"
+                )
+
+            low_diagonal[i] = math.sqrt(pivot)
+
+        self.__low_diagonal = low_diagonal
+        self.__low_rows = [list(row.items()) for row in low_rows]
+
+    def apply(self, vector: Vector, out: Vector = None) -> Vector:
+        low_diagonal = self.__low_diagonal
+        low_rows = self.__low_rows
+        result = _output_for(vector, out)
+        values = result.data
+        values[:] = vector.data
+
+        # [L][y] = [r]
+        for i, row in enumerate(low_rows):
+            _sum = sum(l_ij * values[j] for j, l_ij in row)
+            values[i] = (values[i] - _sum) / low_diagonal[i]
+
+        # [L]'[z] = [y], sweeping [L] by rows from the bottom
+        for i in range(len(values) - 1, -1, -1):
+            values[i] /= low_diagonal[i]
+            for j, l_ij in low_rows[i]:
+                values[j] -= l_ij * values[i]
+
+        return result
+
+
+def _output_for(vector: Vector, out: Vector) -> Vector:
+    if out is None:
+        return Vector(vector.length)
+
+    if out.length != vector.length:
+        raise ValueError("Size mismatch with the output vector")
+
+    return out
+
+
+def _split_lower(sys_mat) -> Tuple[List[float], List[List[Tuple[int, float]]]]:
+    if not sys_mat.is_square:
+        raise ValueError("System matrix must be square")
+
+    if not isinstance(sys_mat, CsrMatrix):
+        sys_mat = make_csr_from_matrix(sys_mat)
+
+    (row_ptr, col_indices, values) = (
+        sys_mat.row_ptr,
+        sys_mat.col_indices,
+        sys_mat.values,
+    )
+    diagonal = [0.0] * sys_mat.rows_count
+    lower_rows = []
+
+    for i in range(sys_mat.rows_count):
+        row = []
+        for index in range(row_ptr[i], row_ptr[i + 1]):
+            (j, a_ij) = (col_indices[index], values[index])
+            if j < i and a_ij != 0:
+                row.append((j, a_ij))
+            elif j == i:
+                diagonal[i] = a_ij
+
+        if diagonal[i] <= 0:
+            raise ValueError(f"Non-positive value in the main diagonal, at row {i}")
+
+        lower_rows.append(row)
+
+    return diagonal, lower_rows
@@ -0,0 +1,493 @@
+import math
+from array import array
+from typing import List
+
+from eqs.blocked import dot
+from eqs.pivots import check_pivot
+from eqs.validate_sys import validate_system
+from eqs.vector import Vector
+
+
+class SkylineMatrix:
+    """
+    A symmetric square matrix stored in skyline (variable band)
+    format.
+
+    Only the lower triangle is stored, and from each row, only the
+    values between its first non-zero column and the main diagonal.
+    The first stored column of every row, `first_cols`, defines the
+    profile (or envelope) of the matrix, which needs to be known
+    before the values are set.
+
+    The Cholesky factorization of a skyline matrix doesn't create
+    values outside of its profile, so the lower triangular matrix
+    can be stored using the same profile, and its computation has
+    a time complexity of O(n·b²), where `b` is the mean bandwidth.
+
+    Being symmetric, the value at a position (i, j) is the same as
+    the value at the position (j, i).
+
+    The stored values are kept in a single flat array of doubles:
+    the ones of row `i`, which are also the ones of column `i` of
+    the upper triangle, start at the `i`-th row pointer, so each
+    row is a contiguous slice of `data`.
+
+    Upon initialization, the matrix is filled with zeroes.
+    """
+
+    def __init__(self, first_cols: List[int]):
+        for row, first_col in enumerate(first_cols):
+            if not 0 <= first_col <= row:
+                raise ValueError(f"Wrong first column for row {row}: {first_col}")
+
+        self.__size = len(first_cols)
+        self.__first_cols = array("q", first_cols)
+        self.__row_ptr = array("q", [0])
+
+        for row, first_col in enumerate(first_cols):
+            self.__row_ptr.append(self.__row_ptr[-1] + row - first_col + 1)
+
+        self.__data = array("d", [0.0]) * self.__row_ptr[-1]
+
+    @property
+    def rows_count(self):
+        """
+        Number of rows in the matrix.
+
+        :return: `int`
+        """
+        return self.__size
+
+    @property
+    def cols_count(self):
+        """
+        Number of columns in the matrix.
+
+        :return: `int`
+        """
+        return self.__size
+
+    @property
+    def is_square(self):
+        """
+        A skyline matrix is always square.
+
+        :return: `bool`
+        """
+        return True
+
+    @property
+    def profile_size(self):
+        """
+        Number of values stored in the matrix' profile.
+
+        :return: `int`
+        """
+        return len(self.__data)
+
+    @property
+    def data(self):
+        """
+        The stored values, row by row. The value at the position
+        (`row`, `col`) inside the profile is stored at the index
+        `row_start(row) + col`.
+
+        This array is meant to be used in hot loops, avoiding the
+        method calls; modifying it modifies the matrix.
+
+        :return: `array` of doubles
+        """
+        return self.__data
+
+    def row_start(self, row: int):
+        """
+        Returns the offset of the given `row` in `data`: the value
+        at the position (`row`, `col`) is stored at the index
+        `row_start(row) + col`.
+
+        :param row: `int` row index
+        :return: `int` offset in `data`
+        """
+        return self.__row_ptr[row + 1] - 1 - row
+
+    def first_col(self, row: int):
+        """
+        Returns the first column stored for the given `row`.
+
+        :param row: `int` row index
+        :return: `int` first stored column index
+        """
+        return self.__first_cols[row]
+
+    def set_value(self, value: float, row: int, col: int):
+        """
+        Sets the given `value` in the matrix at the position
+        indicated by `row` and `col` indices, and thus also at the
+        symmetric (`col`, `row`) position.
+
+        If the position is outside the matrix' profile, an error
+        is raised.
+
+        :param value: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__data[self.__index_of(row, col)] = value
+        return self
+
+    def add_to_value(self, amount: float, row: int, col: int):
+        """
+        Adds the given `amount` to the existing value at the
+        position indicated by `row` and `col` indices, and thus also
+        at the symmetric (`col`, `row`) position.
+
+        If the position is outside the matrix' profile, an error
+        is raised.
+
+        :param amount: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__data[self.__index_of(row, col)] += amount
+        return self
+
+    def set_identity_row(self, row: int):
+        """
+        Sets the row at index `row` as the identity vector, that
+        is, all 0s except for a 1 in the main diagonal position.
+
+        The matrix being symmetric, the column at index `row` is
+        also set as the identity vector.
+
+        :param row: `int` row index
+        :return: this matrix
+        """
+        data = self.__data
+        first_cols = self.__first_cols
+        (first, diag_index) = (self.__row_ptr[row], self.__row_ptr[row + 1] - 1)
+
+        data[first:diag_index] = array("d", [0.0]) * (diag_index - first)
+        data[diag_index] = 1.0
+
+        for other_row in range(row + 1, self.__size):
+            if first_cols[other_row] <= row:
+                data[self.row_start(other_row) + row] = 0.0
+
+        return self
+
+    def set_identity_col(self, col: int):
+        """
+        Sets the column at index `col` as the identity vector, that
+        is, all 0s except for a 1 in the main diagonal position.
+
+        The matrix being symmetric, this is the same as setting the
+        row at index `col` as the identity vector.
+
+        :param col: `int` column index
+        :return: this matrix
+        """
+        return self.set_identity_row(col)
+
+    def value_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col`, which is zero outside of the profile.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        if col > row:
+            row, col = col, row
+
+        if col < self.__first_cols[row]:
+            return 0.0
+
+        return self.__data[self.row_start(row) + col]
+
+    def times_vector(self, v: Vector, out: Vector = None):
+        """
+        Creates a new `Vector` result of multiplying this matrix
+        times the passed `Vector`.
+
+        Every stored row is visited once, as a slice: values below
+        the diagonal contribute to both their row and their column.
+
+        The product can be written into an existing `out` vector,
+        which must not be `v`, instead of a new one.
+
+        :param v: `Vector`
+        :param out: optional `Vector` where the result is written
+        :return: `Vector`
+        """
+        if self.__size != v.length:
+            raise ValueError("Size mismatch")
+
+        if out is not None and out.length != self.__size:
+            raise ValueError("Size mismatch with the output vector")
+
+        (data, row_ptr, first_cols) = (self.__data, self.__row_ptr, self.__first_cols)
+        v_data = v.data
+        result = Vector(self.__size) if out is None else out
+        result_data = result.data
+
+        for i in range(self.__size):
+            (first, diag_index) = (first_cols[i], row_ptr[i + 1] - 1)
+            row = data[row_ptr[i] : diag_index]
+            v_i = v_data[i]
+
+            # the rows below add their column contributions later
+            result_data[i] = data[diag_index] * v_i + dot(row, v_data[first:i])
+            if row:
+                result_data[first:i] = array(
+                    "d",
+                    [
+                        r_j + a_ij * v_i
+                        for r_j, a_ij in zip(result_data[first:i], row, strict=True)
+                    ],
+                )
+
+        return result
+
+    def copy(self):
+        """
+        Creates a new `SkylineMatrix` with the exact same profile
+        and values as this one.
+
+        :return: `SkylineMatrix`
+        """
+        matrix = SkylineMatrix(self.__first_cols)
+        matrix.__data[:] = self.__data
+        return matrix
+
+    def __index_of(self, row: int, col: int):
+        if col > row:
+            row, col = col, row
+
+        if col < self.__first_cols[row]:
+            raise ValueError(f"Position ({row}, {col}) is outside the profile")
+
+        return self.row_start(row) + col
+
+
+def skyline_cholesky_solve(sys_mat: SkylineMatrix, sys_vec: Vector) -> Vector:
+    """
+    Solves the system of linear equations whose matrix, the
+    positive-definite `sys_mat`, is stored in skyline format, using
+    the Cholesky factorization.
+
+    The lower triangular matrix [L] is computed by the
+    `skyline_cholesky_decomposition` function and shares the
+    system matrix' profile. The system is then solved by forward
+    and backward substitution, reading [L]' from [L].
+
+    :param sys_mat: system's `SkylineMatrix`
+    :param sys_vec: system's `Vector`
+    :return: result `Vector`
+    """
+    validate_system(sys_mat, sys_vec)
+    return SkylineCholeskyFactorization(sys_mat).solve(sys_vec)
+
+
+class SkylineCholeskyFactorization:
+    """
+    The Cholesky factorization of a positive-definite matrix stored
+    in skyline format, computed once and kept to solve any number
+    of systems sharing that matrix.
+
+    Each resolution only takes a forward and a backward
+    substitution inside the profile of the lower matrix.
+    """
+
+    def __init__(self, sys_mat: SkylineMatrix):
+        self.__lower_matrix = skyline_cholesky_decomposition(sys_mat)
+
+    @property
+    def size(self):
+        """
+        Number of equations in the factorized system.
+
+        :return: `int`
+        """
+        return self.__lower_matrix.rows_count
+
+    @property
+    def lower_matrix(self):
+        """
+        The lower triangular matrix [L] of the factorization,
+        stored in the lower triangle of a `SkylineMatrix`.
+
+        :return: `SkylineMatrix`
+        """
+        return self.__lower_matrix
+
+    def solve(self, sys_vec: Vector) -> Vector:
+        """
+        Solves the system for the given vector, using forward and
+        backward substitution on the factorized matrix.
+
+        :param sys_vec: system's `Vector`
+        :return: result `Vector`
+        """
+        validate_system(self.__lower_matrix, sys_vec)
+        low_solution = solve_skyline_lower_sys(self.__lower_matrix, sys_vec)
+        return solve_skyline_upper_sys(self.__lower_matrix, low_solution)
+
+    def solve_many(self, sys_vectors: List[Vector]) -> List[Vector]:
+        """
+        Solves the system for every one of the given vectors,
+        sweeping the profile of the lower matrix once for all of
+        them in each substitution.
+
+        :param sys_vectors: systems' `Vector`s
+        :return: result `Vector`s, in the same order
+        """
+        low_solutions = solve_skyline_lower_sys_many(self.__lower_matrix, sys_vectors)
+        return solve_skyline_upper_sys_many(self.__lower_matrix, low_solutions)
+
+
+def skyline_cholesky_decomposition(sys_mat: SkylineMatrix) -> SkylineMatrix:
+    """
+    Decomposes the skyline matrix `sys_mat` into the product of a
+    lower triangular matrix and its transpose: [A] = [L][L]'.
+
+    The lower triangular matrix [L] is returned as a new
+    `SkylineMatrix` with the same profile, where only the values
+    in the lower triangle are meaningful. Only the values inside
+    the profile are computed, so the time complexity is O(n·b²)
+    instead of O(n³).
+
+    Every pivot is checked before taking its square root, so a
+    singular matrix raises a `NonPositivePivotError` at the first
+    row found to be dependent on the previous ones.
+
+    :param sys_mat: `SkylineMatrix`
+    :return: lower triangular `SkylineMatrix`
+    """
+    size = sys_mat.rows_count
+    low_mat = sys_mat.copy()
+
+    row_starts = [low_mat.row_start(i) for i in range(size)]
+    first_cols = [low_mat.first_col(i) for i in range(size)]
+    data = low_mat.data
+
+    for i in range(size):
+        (first_i, start_i) = (first_cols[i], row_starts[i])
+
+        for j in range(first_i, i):
+            start_j = row_starts[j]
+            first = max(first_i, first_cols[j])
+            _sum = dot(
+                data[start_i + first : start_i + j], data[start_j + first : start_j + j]
+            )
+            data[start_i + j] = (data[start_i + j] - _sum) / data[start_j + j]
+
+        l_row = data[start_i + first_i : start_i + i]
+        pivot = data[start_i + i] - dot(l_row, l_row)
+        check_pivot(pivot, data[start_i + i], i)
+        data[start_i + i] = math.sqrt(pivot)
+
+    return low_mat
+
+
+def solve_skyline_lower_sys(low_mat: SkylineMatrix, vector: Vector) -> Vector:
+    """
+    Given a lower triangular matrix [L], stored in the lower
+    triangle of `low_mat`, and a vector `vector` [b], computes the
+    [L][x] = [b] system solution, [x], by forward substitution.
+
+    :param low_mat: `SkylineMatrix` with the lower triangular [L]
+    :param vector: system's `Vector` [b]
+    :return: solution `Vector` [x]
+    """
+    (solution,) = solve_skyline_lower_sys_many(low_mat, [vector])
+    return solution
+
+
+def solve_skyline_upper_sys(low_mat: SkylineMatrix, vector: Vector) -> Vector:
+    """
+    Given a lower triangular matrix [L], stored in the lower
+    triangle of `low_mat`, and a vector `vector` [b], computes the
+    [L]'[x] = [b] system solution, [x], by backward substitution.
+
+    The transposed matrix [L]' isn't created: the substitution
+    sweeps the rows of [L] from the bottom, subtracting each
+    solution value's contribution from the pending values.
+
+    :param low_mat: `SkylineMatrix` with the lower triangular [L]
+    :param vector: system's `Vector` [b]
+    :return: solution `Vector` [x]
+    """
+    (solution,) = solve_skyline_upper_sys_many(low_mat, [vector])
+    return solution
+
+
+def solve_skyline_lower_sys_many(
+    low_mat: SkylineMatrix, vectors: List[Vector]
+) -> List[Vector]:
+    """
+    Given a lower triangular matrix [L], stored in the lower
+    triangle of `low_mat`, and a list of vectors `vectors`, computes
+    the solution of every [L][x] = [b] system by forward
+    substitution, reading each value of [L] once for all of them.
+
+    :param low_mat: `SkylineMatrix` with the lower triangular [L]
+    :param vectors: systems' `Vector`s
+    :return: solution `Vector`s
+    """
+    size = low_mat.rows_count
+    for vector in vectors:
+        validate_system(low_mat, vector)
+
+    data = low_mat.data
+    solutions = [vector.data.tolist() for vector in vectors]
+
+    for i in range(size):
+        (first, start_i) = (low_mat.first_col(i), low_mat.row_start(i))
+        # the row is copied into a list once for all the vectors
+        l_row = data[start_i + first : start_i + i].tolist()
+        l_ii = data[start_i + i]
+
+        for solution in solutions:
+            solution[i] = (solution[i] - dot(l_row, solution[first:i])) / l_ii
+
+    return [Vector(size).set_data(solution) for solution in solutions]
+
+
+def solve_skyline_upper_sys_many(
+    low_mat: SkylineMatrix, vectors: List[Vector]
+) -> List[Vector]:
+    """
+    Given a lower triangular matrix [L], stored in the lower
+    triangle of `low_mat`, and a list of vectors `vectors`, computes
+    the solution of every [L]'[x] = [b] system by backward
+    substitution, reading each value of [L] once for all of them.
+
+    :param low_mat: `SkylineMatrix` with the lower triangular [L]
+    :param vectors: systems' `Vector`s
+    :return: solution `Vector`s
+    """
+    size = low_mat.rows_count
+    for vector in vectors:
+        validate_system(low_mat, vector)
+
+    data = low_mat.data
+    solutions = [vector.data.tolist() for vector in vectors]
+
+    for i in range(size - 1, -1, -1):
+        (first, start_i) = (low_mat.first_col(i), low_mat.row_start(i))
+        # the row of [L] is the column of [L]' above the diagonal
+        l_row = data[start_i + first : start_i + i].tolist()
+        l_ii = data[start_i + i]
+
+        for solution in solutions:
+            x_i = solution[i] / l_ii
+            solution[i] = x_i
+            solution[first:i] = [
+                x_j - l_ij * x_i
+                for x_j, l_ij in zip(solution[first:i], l_row, strict=True)
+            ]
+
+    return [Vector(size).set_data(solution) for solution in solutions]
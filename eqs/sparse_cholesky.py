@@ -0,0 +1,385 @@
+import math
+from array import array
+from typing import List
+
+from eqs.ordering import minimum_degree
+from eqs.pivots import check_pivot
+from eqs.sparse_matrix import CsrMatrix
+from eqs.validate_sys import validate_system
+from eqs.vector import Vector
+
+
+def sparse_cholesky_solve(sys_mat: CsrMatrix, sys_vec: Vector) -> Vector:
+    """
+    Solves the system of linear equations whose matrix, the
+    positive-definite and symmetric `sys_mat`, is stored in sparse
+    `CsrMatrix` format, using the sparse Cholesky factorization.
+
+    The unknowns are renumbered using a minimum degree ordering,
+    the sparsity pattern of the lower triangular matrix [L] is
+    computed by `SparseCholeskyAnalysis` and only the values in that
+    pattern are factorized.
+
+    :param sys_mat: system's `CsrMatrix`
+    :param sys_vec: system's `Vector`
+    :return: result `Vector`
+    """
+    validate_system(sys_mat, sys_vec)
+    return SparseCholeskyAnalysis(sys_mat).factorize(sys_mat).solve(sys_vec)
+
+
+def elimination_tree(adjacency: List[List[int]]) -> List[int]:
+    """
+    Computes the elimination tree of a symmetric matrix given by the
+    `adjacency` lists of its graph: the columns of the non-zero
+    values in every row.
+
+    The parent of the vertex `j` is the row of the first non-zero
+    value below the diagonal in the column `j` of the matrix'
+    Cholesky factor [L], or -1 if there is none. The non-zero
+    pattern of any row of [L] is found walking up this tree.
+
+    :param adjacency: non-zero columns of every row
+    :return: parent of every vertex, -1 for roots
+    """
+    count = len(adjacency)
+    parent = [-1] * count
+    ancestor = [-1] * count
+
+    for row in range(count):
+        for col in adjacency[row]:
+            # walk from `col` up to `row`, compressing the path
+            while col != -1 and col < row:
+                next_col = ancestor[col]
+                ancestor[col] = row
+                if next_col == -1:
+                    parent[col] = row
+
+                col = next_col
+
+    return parent
+
+
+class SparseCholeskyAnalysis:
+    """
+    The symbolic analysis of the Cholesky factorization of a sparse,
+    symmetric matrix: everything that only depends on its sparsity
+    pattern.
+
+    The analysis orders the unknowns (by minimum degree unless an
+    `ordering` is given), computes the elimination tree and, from
+    it, the sparsity pattern of the factor [L], including its fill.
+
+    The analysis can be reused to `factorize` any number of matrices
+    sharing the same pattern, for instance, the stiffness matrices
+    of a structure whose bars change their section but not their
+    connectivity. Each numeric factorization only computes the
+    values inside the pattern.
+    """
+
+    def __init__(self, pattern: CsrMatrix, ordering: List[int] = None):
+        if not pattern.is_square:
+            raise ValueError("System matrix must be square")
+
+        size = pattern.rows_count
+        (row_ptr, col_indices) = (pattern.row_ptr, pattern.col_indices)
+
+        adjacency = [col_indices[row_ptr[i] : row_ptr[i + 1]] for i in range(size)]
+        if ordering is None:
+            ordering = minimum_degree(adjacency)
+
+        if sorted(ordering) != list(range(size)):
+            raise ValueError("The ordering must be a permutation of the unknowns")
+
+        new_index = [0] * size
+        for index, old_index in enumerate(ordering):
+            new_index[old_index] = index
+
+        self.__size = size
+        self.__ordering = list(ordering)
+        self.__row_ptr = list(row_ptr)
+        self.__col_indices = list(col_indices)
+
+        # Lower triangle of the permuted matrix: the columns of every
+        # row and where their values are in the original matrix
+        self.__a_ptr = [0]
+        self.__a_cols = []
+        self.__a_positions = []
+        permuted_adjacency = []
+        for old_row in ordering:
+            row = new_index[old_row]
+            entries = sorted(
+                (new_index[col_indices[position]], position)
+                for position in range(row_ptr[old_row], row_ptr[old_row + 1])
+                if new_index[col_indices[position]] <= row
+            )
+            self.__a_cols.extend(col for col, _ in entries)
+            self.__a_positions.extend(position for _, position in entries)
+            self.__a_ptr.append(len(self.__a_cols))
+            permuted_adjacency.append([col for col, _ in entries])
+
+        self.__parent = elimination_tree(permuted_adjacency)
+        self.__compute_factor_pattern(permuted_adjacency)
+
+    def __compute_factor_pattern(self, permuted_adjacency: List[List[int]]):
+        size = self.__size
+        parent = self.__parent
+        marks = [-1] * size
+        row_patterns = []
+        col_counts = [1] * size
+
+        for row in range(size):
+            # The non-zeros of the row are the vertices found walking
+            # up the elimination tree from the row's original values
+            marks[row] = row
+            pattern = []
+            for col in permuted_adjacency[row]:
+                while col != -1 and marks[col] != row:
+                    pattern.append(col)
+                    marks[col] = row
+                    col = parent[col]
+
+            pattern.sort()
+            row_patterns.append(pattern)
+            for col in pattern:
+                col_counts[col] += 1
+
+        # [L] is stored by columns, the diagonal value first
+        col_ptr = [0]
+        for count in col_counts:
+            col_ptr.append(col_ptr[-1] + count)
+
+        next_position = [col_ptr[col] + 1 for col in range(size)]
+        row_indices = [0] * col_ptr[-1]
+        positions = []
+        for row, pattern in enumerate(row_patterns):
+            row_indices[col_ptr[row]] = row
+            row_positions = []
+            for col in pattern:
+                row_indices[next_position[col]] = row
+                row_positions.append(next_position[col])
+                next_position[col] += 1
+
+            positions.append(row_positions)
+
+        self.__row_patterns = row_patterns
+        self.__row_positions = positions
+        self.__l_col_ptr = col_ptr
+        self.__l_row_indices = row_indices
+
+    @property
+    def size(self):
+        """
+        Number of equations in the analyzed system.
+
+        :return: `int`
+        """
+        return self.__size
+
+    @property
+    def ordering(self):
+        """
+        The unknowns in their elimination order: the unknown at index
+        `k` is the `k`-th one to be eliminated.
+
+        :return: `List[int]`
+        """
+        return list(self.__ordering)
+
+    @property
+    def elimination_tree(self):
+        """
+        The parent of every unknown, in elimination order, in the
+        elimination tree of the permuted matrix.
+
+        :return: `List[int]`
+        """
+        return list(self.__parent)
+
+    @property
+    def factor_non_zeros_count(self):
+        """
+        Number of values stored in the factor [L], including the
+        fill-in and the main diagonal.
+
+        :return: `int`
+        """
+        return self.__l_col_ptr[-1]
+
+    def matches(self, sys_mat: CsrMatrix):
+        """
+        Whether `sys_mat` has the sparsity pattern this analysis
+        was made for, and thus can be factorized with it.
+
+        :param sys_mat: `CsrMatrix`
+        :return: `bool`
+        """
+        return (
+            list(sys_mat.row_ptr) == self.__row_ptr
+            and list(sys_mat.col_indices) == self.__col_indices
+        )
+
+    def factorize(self, sys_mat: CsrMatrix):
+        """
+        Computes the numeric Cholesky factorization of `sys_mat`,
+        which must have the sparsity pattern this analysis was made
+        for.
+
+        The factorization fills the factor's pattern row by row: each
+        row of [L] is the solution of a sparse triangular system
+        whose non-zeros are the ones found by the analysis.
+
+        A non-positive pivot raises a `NonPositivePivotError` with
+        its unknown in the original numbering.
+
+        :param sys_mat: positive-definite `CsrMatrix`
+        :return: `SparseCholeskyFactorization`
+        """
+        if not self.matches(sys_mat):
+            raise ValueError("The matrix' pattern doesn't match the analysis")
+
+        size = self.__size
+        (col_ptr, row_indices) = (self.__l_col_ptr, self.__l_row_indices)
+        (a_ptr, a_cols, a_positions) = (self.__a_ptr, self.__a_cols, self.__a_positions)
+        a_values = sys_mat.values
+        values = array("d", [0.0]) * col_ptr[-1]
+        work = [0.0] * size
+
+        for row in range(size):
+            for index in range(a_ptr[row], a_ptr[row + 1]):
+                work[a_cols[index]] = a_values[a_positions[index]]
+
+            (a_rr, diagonal) = (work[row], work[row])
+            work[row] = 0.0
+
+            for col, position in zip(
+                self.__row_patterns[row], self.__row_positions[row], strict=True
+            ):
+                l_rc = work[col] / values[col_ptr[col]]
+                work[col] = 0.0
+
+                # the rows of column `col` already computed
+                for index in range(col_ptr[col] + 1, position):
+                    work[row_indices[index]] -= values[index] * l_rc
+
+                diagonal -= l_rc * l_rc
+                values[position] = l_rc
+
+            check_pivot(diagonal, a_rr, self.__ordering[row])
+            values[col_ptr[row]] = math.sqrt(diagonal)
+
+        return SparseCholeskyFactorization(
+            self.__ordering, col_ptr, row_indices, values
+        )
+
+
+class SparseCholeskyFactorization:
+    """
+    The sparse Cholesky factorization of a positive-definite matrix,
+    [P][A][P]' = [L][L]', where [P] is the permutation given by the
+    analysis' ordering.
+
+    The lower triangular matrix [L] is stored by columns, and only
+    the values in its sparsity pattern. Each resolution only takes a
+    forward and a backward substitution over those values.
+
+    Instances are created by `SparseCholeskyAnalysis.factorize`.
+    """
+
+    def __init__(
+        self,
+        ordering: List[int],
+        col_ptr: List[int],
+        row_indices: List[int],
+        values: array,
+    ):
+        self.__ordering = ordering
+        self.__col_ptr = col_ptr
+        self.__row_indices = row_indices
+        self.__values = values
+
+    @property
+    def size(self):
+        """
+        Number of equations in the factorized system.
+
+        :return: `int`
+        """
+        return len(self.__ordering)
+
+    @property
+    def non_zeros_count(self):
+        """
+        Number of values stored in the factor [L].
+
+        :return: `int`
+        """
+        return len(self.__values)
+
+    def solve(self, sys_vec: Vector) -> Vector:
+        """
+        Solves the system for the given vector, using forward and
+        backward substitution on the factorized matrix.
+
+        :param sys_vec: system's `Vector`
+        :return: result `Vector`
+        """
+        (solution,) = self.solve_many([sys_vec])
+        return solution
+
+    def solve_many(self, sys_vectors: List[Vector]) -> List[Vector]:
+        """
+        Solves the system for every one of the given vectors,
+        sweeping the factor once for all of them in each
+        substitution.
+
+        :param sys_vectors: systems' `Vector`s
+        :return: result `Vector`s, in the same order
+        """
+        size = self.size
+        for vector in sys_vectors:
+            if vector.length != size:
+                raise ValueError("Size mismatch between matrix and vector")
+
+        (col_ptr, row_indices, values) = (
+            self.__col_ptr,
+            self.__row_indices,
+            self.__values,
+        )
+        ordering = self.__ordering
+        solutions = [
+            [vector.value_at(old_index) for old_index in ordering]
+            for vector in sys_vectors
+        ]
+
+        # [L][y] = [P][b], sweeping [L] by columns
+        for col in range(size):
+            l_cc = values[col_ptr[col]]
+            for solution in solutions:
+                solution[col] /= l_cc
+
+            for index in range(col_ptr[col] + 1, col_ptr[col + 1]):
+                (row, l_rc) = (row_indices[index], values[index])
+                for solution in solutions:
+                    solution[row] -= l_rc * solution[col]
+
+        # [L]'[z] = [y], the columns of [L] being the rows of [L]'
+        for col in range(size - 1, -1, -1):
+            for index in range(col_ptr[col] + 1, col_ptr[col + 1]):
+                (row, l_rc) = (row_indices[index], values[index])
+                for solution in solutions:
+                    solution[col] -= l_rc * solution[row]
+
+            l_cc = values[col_ptr[col]]
+            for solution in solutions:
+                solution[col] /= l_cc
+
+        results = []
+        for solution in solutions:
+            result = Vector(size)
+            for index, old_index in enumerate(ordering):
+                result.set_value(solution[index], old_index)
+
+            results.append(result)
+
+        return results
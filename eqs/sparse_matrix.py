@@ -0,0 +1,472 @@
+from bisect import bisect_left
+from itertools import compress
+from typing import List
+
+from eqs.matrix import Matrix
+from eqs.vector import Vector
+
+
+class CooMatrix:
+    """
+    A sparse matrix in coordinate (COO) format: the non-zero values
+    are stored as (row, column, value) triplets.
+
+    This format is meant for assembly: adding to a value appends a
+    new triplet, and the values at repeated positions are summed
+    when the matrix is converted to the compressed `CsrMatrix`
+    format, which is the one to use for computation.
+
+    Upon initialization, the matrix has no triplets, that is, it's
+    full of zeroes.
+    """
+
+    def __init__(self, rows_count: int, cols_count: int):
+        self.__rows_count = rows_count
+        self.__cols_count = cols_count
+        self.__rows = []
+        self.__cols = []
+        self.__values = []
+
+    @property
+    def rows_count(self):
+        """
+        Number of rows in the matrix.
+
+        :return: `int`
+        """
+        return self.__rows_count
+
+    @property
+    def cols_count(self):
+        """
+        Number of columns in the matrix.
+
+        :return: `int`
+        """
+        return self.__cols_count
+
+    @property
+    def is_square(self):
+        """
+        A matrix is square if it has the same number of rows and
+        columns.
+
+        :return: `bool`
+        """
+        return self.__rows_count == self.__cols_count
+
+    @property
+    def triplets_count(self):
+        """
+        Number of stored (row, column, value) triplets. Repeated
+        positions count once per triplet.
+
+        :return: `int`
+        """
+        return len(self.__values)
+
+    def add_to_value(self, amount: float, row: int, col: int):
+        """
+        Adds the given `amount` to the value at the position
+        indicated by `row` and `col` indices by appending a new
+        triplet.
+
+        If any of the row or column indices is out of bounds, an
+        error is raised.
+
+        :param amount: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__ensure_in_bounds(row, col)
+
+        self.__rows.append(row)
+        self.__cols.append(col)
+        self.__values.append(amount)
+        return self
+
+    def add_to_values(self, amounts: List[float], rows: List[int], cols: List[int]):
+        """
+        Adds every one of the given `amounts` to the value at the
+        position indicated by the same index in `rows` and `cols`,
+        appending all the triplets at once.
+
+        This is the assembly operation for many values, like the
+        stiffness terms of all the elements of a model, which only
+        checks the bounds once for the whole batch.
+
+        :param amounts: `float` amounts to add
+        :param rows: `int` row index of every amount
+        :param cols: `int` column index of every amount
+        :return: this matrix
+        """
+        if not len(amounts) == len(rows) == len(cols):
+            raise ValueError("Amounts, rows and columns size mismatch")
+
+        if amounts:
+            self.__ensure_in_bounds(min(rows), min(cols))
+            self.__ensure_in_bounds(max(rows), max(cols))
+
+        self.__rows.extend(rows)
+        self.__cols.extend(cols)
+        self.__values.extend(amounts)
+        return self
+
+    def set_value(self, value: float, row: int, col: int):
+        """
+        Sets the given `value` at the position indicated by `row`
+        and `col` indices, discarding the triplets previously added
+        for that position.
+
+        This operation has a linear time complexity on the number
+        of triplets.
+
+        :param value: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__zero_where(lambda r, c: r == row and c == col)
+        return self.add_to_value(value, row, col)
+
+    def set_identity_row(self, row: int):
+        """
+        Sets the row at index `row` as the identity vector, that
+        is, all 0s except for a 1 in the main diagonal position
+        (`index = row`).
+
+        :param row: `int` row index
+        :return: this matrix
+        """
+        self.__zero_where(lambda r, _: r == row)
+        return self.add_to_value(1.0, row, row)
+
+    def set_identity_col(self, col: int):
+        """
+        Sets the column at index `col` as the identity vector, that
+        is, all 0s except for a 1 in the main diagonal position
+        (`index == column`).
+
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__zero_where(lambda _, c: c == col)
+        return self.add_to_value(1.0, col, col)
+
+    def set_identity(self, indices: List[int]):
+        """
+        Sets the rows and columns at the given `indices` as the
+        identity vectors, as `set_identity_row` and
+        `set_identity_col` do for each index, but in a single pass
+        over the triplets.
+
+        The triplets in those rows and columns are removed, instead
+        of zeroed, and one triplet with a 1 in the main diagonal is
+        added per index. This operation has a linear time complexity
+        on the number of triplets, however many indices are given.
+
+        :param indices: `int` indices of the rows and columns
+        :return: this matrix
+        """
+        indices = set(indices)
+        if not indices:
+            return self
+
+        self.__ensure_in_bounds(min(indices), min(indices))
+        self.__ensure_in_bounds(max(indices), max(indices))
+
+        kept = [
+            r not in indices and c not in indices
+            for r, c in zip(self.__rows, self.__cols, strict=True)
+        ]
+        self.__rows = list(compress(self.__rows, kept))
+        self.__cols = list(compress(self.__cols, kept))
+        self.__values = list(compress(self.__values, kept))
+
+        diagonal = sorted(indices)
+        self.__rows.extend(diagonal)
+        self.__cols.extend(diagonal)
+        self.__values.extend([1.0] * len(diagonal))
+        return self
+
+    def value_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col`: the sum of all the triplets added for that
+        position.
+
+        This operation has a linear time complexity on the number
+        of triplets; convert the matrix to `CsrMatrix` for faster
+        random access.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        self.__ensure_in_bounds(row, col)
+
+        value = 0.0
+        for r, c, v in zip(self.__rows, self.__cols, self.__values, strict=True):
+            if r == row and c == col:
+                value += v
+
+        return value
+
+    def to_csr(self):
+        """
+        Creates a new `CsrMatrix` with the values of this matrix,
+        summing the triplets that share the same position.
+
+        Positions whose value adds up to exactly zero are kept, as
+        they are part of the assembled sparsity pattern.
+
+        :return: `CsrMatrix`
+        """
+        rows_entries = [{} for _ in range(self.__rows_count)]
+        for r, c, v in zip(self.__rows, self.__cols, self.__values, strict=True):
+            entries = rows_entries[r]
+            entries[c] = entries.get(c, 0.0) + v
+
+        row_ptr = [0]
+        col_indices = []
+        values = []
+        for entries in rows_entries:
+            for col in sorted(entries):
+                col_indices.append(col)
+                values.append(entries[col])
+
+            row_ptr.append(len(values))
+
+        return CsrMatrix(
+            self.__rows_count, self.__cols_count, row_ptr, col_indices, values
+        )
+
+    def to_matrix(self):
+        """
+        Creates a new dense `Matrix` with the values of this one.
+
+        :return: `Matrix`
+        """
+        matrix = Matrix(self.__rows_count, self.__cols_count)
+        for r, c, v in zip(self.__rows, self.__cols, self.__values, strict=True):
+            matrix.add_to_value(v, r, c)
+
+        return matrix
+
+    def __zero_where(self, predicate):
+        values = self.__values
+        for i, (r, c) in enumerate(zip(self.__rows, self.__cols, strict=True)):
+            if predicate(r, c):
+                values[i] = 0.0
+
+    def __ensure_in_bounds(self, row: int, col: int):
+        if not (0 <= row < self.__rows_count and 0 <= col < self.__cols_count):
+            raise IndexError(f"Position ({row}, {col}) out of bounds")
+
+
+class CsrMatrix:
+    """
+    A sparse matrix in compressed sparse row (CSR) format.
+
+    The stored values are kept row by row in the `values` list, and
+    their column indices, sorted within each row, in `col_indices`.
+    The values of row `i` are found between the positions
+    `row_ptr[i]` and `row_ptr[i + 1]`.
+
+    Both memory and the product with a vector grow with the number
+    of stored values, not with the square of the matrix size.
+    CSR matrices are usually created by assembling a `CooMatrix`
+    and converting it using its `to_csr` method.
+    """
+
+    def __init__(
+        self,
+        rows_count: int,
+        cols_count: int,
+        row_ptr: List[int],
+        col_indices: List[int],
+        values: List[float],
+    ):
+        if len(row_ptr) != rows_count + 1:
+            raise ValueError("Row pointers don't match the rows count")
+
+        if len(col_indices) != len(values) or row_ptr[-1] != len(values):
+            raise ValueError("Column indices and values size mismatch")
+
+        self.__rows_count = rows_count
+        self.__cols_count = cols_count
+        self.__row_ptr = row_ptr
+        self.__col_indices = col_indices
+        self.__values = values
+
+    @property
+    def rows_count(self):
+        """
+        Number of rows in the matrix.
+
+        :return: `int`
+        """
+        return self.__rows_count
+
+    @property
+    def cols_count(self):
+        """
+        Number of columns in the matrix.
+
+        :return: `int`
+        """
+        return self.__cols_count
+
+    @property
+    def is_square(self):
+        """
+        A matrix is square if it has the same number of rows and
+        columns.
+
+        :return: `bool`
+        """
+        return self.__rows_count == self.__cols_count
+
+    @property
+    def non_zeros_count(self):
+        """
+        Number of stored values in the matrix.
+
+        :return: `int`
+        """
+        return len(self.__values)
+
+    @property
+    def row_ptr(self):
+        """
+        Positions in `col_indices` and `values` where each row
+        starts, plus the total number of stored values at the end.
+
+        :return: `List[int]`
+        """
+        return self.__row_ptr
+
+    @property
+    def col_indices(self):
+        """
+        Column index of every stored value.
+
+        :return: `List[int]`
+        """
+        return self.__col_indices
+
+    @property
+    def values(self):
+        """
+        Stored values, row by row.
+
+        :return: `List[float]`
+        """
+        return self.__values
+
+    def value_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col`, or zero if there's no stored value there.
+
+        The lookup is a binary search within the row's values.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        start = self.__row_ptr[row]
+        end = self.__row_ptr[row + 1]
+        index = bisect_left(self.__col_indices, col, start, end)
+
+        if index < end and self.__col_indices[index] == col:
+            return self.__values[index]
+
+        return 0.0
+
+    def value_transposed_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col` as if this matrix was transposed, without
+        creating the transposed matrix.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        return self.value_at(col, row)
+
+    def times_vector(self, v: Vector, out: Vector = None):
+        """
+        Creates a new `Vector` result of multiplying this matrix
+        times the passed `Vector`.
+
+        Only the stored values are visited, so the product has a
+        linear time complexity on the number of non-zeros.
+
+        The product can be written into an existing `out` vector,
+        which must not be `v`, instead of a new one.
+
+        :param v: `Vector`
+        :param out: optional `Vector` where the result is written
+        :return: `Vector`
+        """
+        if self.__cols_count != v.length:
+            raise ValueError("Size mismatch")
+
+        if out is not None and out.length != self.__rows_count:
+            raise ValueError("Size mismatch with the output vector")
+
+        row_ptr = self.__row_ptr
+        col_indices = self.__col_indices
+        values = self.__values
+        v_data = v.data
+        result = Vector(self.__rows_count) if out is None else out
+        result_data = result.data
+
+        for i in range(self.__rows_count):
+            product_sum = 0.0
+            for k in range(row_ptr[i], row_ptr[i + 1]):
+                product_sum += values[k] * v_data[col_indices[k]]
+
+            result_data[i] = product_sum
+
+        return result
+
+    def to_matrix(self):
+        """
+        Creates a new dense `Matrix` with the values of this one.
+
+        :return: `Matrix`
+        """
+        matrix = Matrix(self.__rows_count, self.__cols_count)
+        for i in range(self.__rows_count):
+            for k in range(self.__row_ptr[i], self.__row_ptr[i + 1]):
+                matrix.set_value(self.__values[k], i, self.__col_indices[k])
+
+        return matrix
+
+
+def make_csr_from_matrix(matrix: Matrix) -> CsrMatrix:
+    """
+    Creates a `CsrMatrix` storing the non-zero values of the given
+    dense `matrix`.
+
+    :param matrix: `Matrix`
+    :return: `CsrMatrix`
+    """
+    row_ptr = [0]
+    col_indices = []
+    values = []
+
+    for i in range(matrix.rows_count):
+        for j in range(matrix.cols_count):
+            value = matrix.value_at(i, j)
+            if value != 0:
+                col_indices.append(j)
+                values.append(value)
+
+        row_ptr.append(len(values))
+
+    return CsrMatrix(matrix.rows_count, matrix.cols_count, row_ptr, col_indices, values)
@@ -0,0 +1,298 @@
+import math
+from array import array
+from operator import mul
+
+from eqs.buffers import as_array, doubles_view
+from eqs.matrix import Matrix
+from eqs.vector import Vector
+
+
+class SymmetricMatrix:
+    """
+    A symmetric square matrix which only stores its lower triangle,
+    packed row by row in a contiguous array of doubles.
+
+    Being symmetric, the value at a position (i, j) is the same as
+    the value at the position (j, i), so setting or adding to any of
+    them modifies the single stored value. A matrix of size n stores
+    n(n + 1)/2 values instead of n².
+
+    Upon initialization, the matrix is filled with zeroes.
+    """
+
+    __slots__ = ("__size", "__data")
+
+    def __init__(self, size: int):
+        self.__size = size
+        self.__data = array("d", [0.0]) * (size * (size + 1) // 2)
+
+    @staticmethod
+    def from_buffer(buffer):
+        """
+        Creates a symmetric matrix whose packed lower triangle is
+        stored in the given `buffer`, any object supporting the
+        buffer protocol that holds doubles or raw bytes, without
+        copying it: modifying the matrix modifies the buffer, and
+        vice versa.
+
+        The size of the matrix is deduced from the number of values,
+        which must be n(n + 1)/2 for a matrix of size n.
+
+        :param buffer: object supporting the buffer protocol
+        :return: `SymmetricMatrix`
+        """
+        data = doubles_view(buffer)
+        size = (math.isqrt(8 * len(data) + 1) - 1) // 2
+        if size * (size + 1) // 2 != len(data):
+            raise ValueError(f"{len(data)} values don't pack a lower triangle")
+
+        matrix = SymmetricMatrix(0)
+        matrix.__size = size
+        matrix.__data = data
+        return matrix
+
+    @property
+    def rows_count(self):
+        """
+        Number of rows in the matrix.
+
+        :return: `int`
+        """
+        return self.__size
+
+    @property
+    def cols_count(self):
+        """
+        Number of columns in the matrix.
+
+        :return: `int`
+        """
+        return self.__size
+
+    @property
+    def is_square(self):
+        """
+        A symmetric matrix is always square.
+
+        :return: `bool`
+        """
+        return True
+
+    @property
+    def data(self):
+        """
+        The packed values of the lower triangle, row by row. The
+        value at the position (`row`, `col`), with `col` <= `row`,
+        is stored at the index `row_start(row) + col`.
+
+        This array is meant for hot loops that want to avoid a
+        method call per value; modifying it modifies the matrix.
+
+        :return: `array` or `memoryview` of doubles
+        """
+        return self.__data
+
+    @staticmethod
+    def row_start(row: int):
+        """
+        Returns the offset of the given `row` in `data`: the value
+        at the position (`row`, `col`) is stored at the index
+        `row_start(row) + col`.
+
+        :param row: `int` row index
+        :return: `int` offset in `data`
+        """
+        return row * (row + 1) // 2
+
+    def set_value(self, value: float, row: int, col: int):
+        """
+        Sets the given `value` in the matrix at the position
+        indicated by `row` and `col` indices, and thus also at the
+        symmetric (`col`, `row`) position.
+
+        :param value: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__data[self.__index_of(row, col)] = value
+        return self
+
+    def add_to_value(self, amount: float, row: int, col: int):
+        """
+        Adds the given `amount` to the existing value at the
+        position indicated by `row` and `col` indices, and thus also
+        at the symmetric (`col`, `row`) position.
+
+        :param amount: `float`
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: this matrix
+        """
+        self.__data[self.__index_of(row, col)] += amount
+        return self
+
+    def set_identity_row(self, row: int):
+        """
+        Sets the row at index `row` as the identity vector, that
+        is, all 0s except for a 1 in the main diagonal position.
+
+        The matrix being symmetric, the column at index `row` is
+        also set as the identity vector.
+
+        :param row: `int` row index
+        :return: this matrix
+        """
+        self.__ensure_in_bounds(row, row)
+        data = self.__data
+        start = row * (row + 1) // 2
+
+        data[start : start + row] = array("d", [0.0]) * row
+        data[start + row] = 1.0
+
+        for other_row in range(row + 1, self.__size):
+            data[other_row * (other_row + 1) // 2 + row] = 0.0
+
+        return self
+
+    def set_identity_col(self, col: int):
+        """
+        Sets the column at index `col` as the identity vector, that
+        is, all 0s except for a 1 in the main diagonal position.
+
+        The matrix being symmetric, this is the same as setting the
+        row at index `col` as the identity vector.
+
+        :param col: `int` column index
+        :return: this matrix
+        """
+        return self.set_identity_row(col)
+
+    def value_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col`.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        return self.__data[self.__index_of(row, col)]
+
+    def value_transposed_at(self, row: int, col: int):
+        """
+        Returns the value at the position indicated by indices
+        `row` and `col` as if this matrix was transposed.
+
+        When the lower triangle holds a triangular matrix [L], as
+        after a Cholesky factorization, this reads [L]'.
+
+        :param row: `int` row index
+        :param col: `int` column index
+        :return: `float`
+        """
+        return self.__data[self.__index_of(col, row)]
+
+    def row_values(self, row: int, start_col=0, stop_col: int = None):
+        """
+        Returns a new array with the values of the given `row`, or
+        only the ones in the columns from `start_col` up to, but not
+        including, `stop_col`.
+
+        The values up to the main diagonal are a single slice of the
+        `data` array; the ones after it are read from the column.
+
+        :param row: `int` row index
+        :param start_col: `int` first column index
+        :param stop_col: `int` column index after the last one
+        :return: `array` of doubles
+        """
+        if stop_col is None:
+            stop_col = self.__size
+
+        row_start = SymmetricMatrix.row_start(row)
+        values = as_array(
+            self.__data[
+                row_start + min(start_col, row + 1) : row_start + min(stop_col, row + 1)
+            ]
+        )
+        values.extend(
+            self.__data[SymmetricMatrix.row_start(col) + row]
+            for col in range(max(start_col, row + 1), stop_col)
+        )
+
+        return values
+
+    def times_vector(self, v: Vector, out: Vector = None):
+        """
+        Creates a new `Vector` result of multiplying this matrix
+        times the passed `Vector`.
+
+        Every stored value is visited once: values below the
+        diagonal contribute to both their row and their column.
+
+        The product can be written into an existing `out` vector,
+        which must not be `v`, instead of a new one.
+
+        :param v: `Vector`
+        :param out: optional `Vector` where the result is written
+        :return: `Vector`
+        """
+        if self.__size != v.length:
+            raise ValueError("Size mismatch")
+
+        if out is not None and out.length != self.__size:
+            raise ValueError("Size mismatch with the output vector")
+
+        data = self.__data
+        v_data = v.data
+        result = Vector(self.__size) if out is None else out
+        result_data = result.data
+        result_data[:] = array("d", [0.0]) * self.__size
+
+        for i in range(self.__size):
+            start = i * (i + 1) // 2
+            v_i = v_data[i]
+            result_data[i] += sum(map(mul, data[start : start + i + 1], v_data))
+
+            for j in range(i):
+                result_data[j] += data[start + j] * v_i
+
+        return result
+
+    def to_matrix(self):
+        """
+        Creates a dense `Matrix` with the values of this one.
+
+        :return: `Matrix`
+        """
+        matrix = Matrix(self.__size, self.__size)
+
+        for i in range(self.__size):
+            for j in range(self.__size):
+                matrix.set_value(self.value_at(i, j), i, j)
+
+        return matrix
+
+    def copy(self):
+        """
+        Creates a new `SymmetricMatrix` with the exact same size and
+        values as this one.
+
+        :return: `SymmetricMatrix`
+        """
+        matrix = SymmetricMatrix(self.__size)
+        memoryview(matrix.__data)[:] = self.__data
+        return matrix
+
+    def __index_of(self, row: int, col: int):
+        self.__ensure_in_bounds(row, col)
+
+        if col > row:
+            row, col = col, row
+
+        return row * (row + 1) // 2 + col
+
+    def __ensure_in_bounds(self, row: int, col: int):
+        if not (0 <= row < self.__size and 0 <= col < self.__size):
+            raise IndexError(f"Position ({row}, {col}) out of bounds")
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from eqs.binary import load, save
+from eqs.matrix import Matrix
+from eqs.sparse_cholesky import SparseCholeskyAnalysis, sparse_cholesky_solve
+from eqs.sparse_matrix import CsrMatrix, make_csr_from_matrix
+from eqs.symmetric_matrix import SymmetricMatrix
+from eqs.vector import Vector
+
+
+class BinaryTest(unittest.TestCase):
+    sys_matrix = Matrix(3, 3).set_data([4, -2, 0, -2, 10, 1, 0, 1, 5])
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.file_path = os.path.join(directory.name, "saved.eqs")
+
+    def test_vector(self):
+        vector = Vector(3).set_data([1, -2.5, 3])
+        save(self.file_path, vector)
+        self.assertEqual(vector, load(self.file_path))
+
+    def test_matrix(self):
+        matrix = Matrix(2, 3).set_data([1, 2, 3, 4, 5, 6])
+        save(self.file_path, matrix)
+        loaded = load(self.file_path)
+
+        self.assertIsInstance(loaded, Matrix)
+        self.assertFalse(loaded.is_column_major)
+        self.assertEqual(matrix, loaded)
+
+    def test_column_major_matrix(self):
+        matrix = Matrix(2, 3, column_major=True).set_data([1, 2, 3, 4, 5, 6])
+        save(self.file_path, matrix)
+        loaded = load(self.file_path)
+
+        self.assertTrue(loaded.is_column_major)
+        self.assertEqual(matrix, loaded)
+
+    def test_symmetric_matrix(self):
+        matrix = SymmetricMatrix(3)
+        matrix.set_value(4, 0, 0).set_value(-2, 1, 0).set_value(10, 1, 1)
+        matrix.set_value(1, 2, 1).set_value(5, 2, 2)
+        save(self.file_path, matrix)
+        loaded = load(self.file_path)
+
+        self.assertIsInstance(loaded, SymmetricMatrix)
+        self.assertEqual(3, loaded.rows_count)
+        self.assertEqual(list(matrix.data), list(loaded.data))
+
+    def test_csr_matrix(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        save(self.file_path, csr)
+        loaded = load(self.file_path)
+
+        self.assertIsInstance(loaded, CsrMatrix)
+        self.assertEqual(list(csr.row_ptr), list(loaded.row_ptr))
+        self.assertEqual(list(csr.col_indices), list(loaded.col_indices))
+        self.assertEqual(self.sys_matrix, loaded.to_matrix())
+
+    def test_solve_loaded_csr_matrix(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        save(self.file_path, csr)
+        loaded = load(self.file_path)
+        vector = Vector(3).set_data([0, 21, 17])
+
+        self.assertTrue(SparseCholeskyAnalysis(csr).matches(loaded))
+        self.assertEqual(
+            Vector(3).set_data([1, 2, 3]), sparse_cholesky_solve(loaded, vector)
+        )
+
+    def test_loaded_matrix_is_writable_but_file_is_not_modified(self):
+        save(self.file_path, self.sys_matrix)
+
+        load(self.file_path).set_value(100, 0, 0)
+        self.assertEqual(self.sys_matrix, load(self.file_path))
+
+    def test_empty_matrix(self):
+        save(self.file_path, Matrix(0, 0))
+        loaded = load(self.file_path)
+
+        self.assertEqual(0, loaded.rows_count)
+        self.assertEqual(0, loaded.cols_count)
+
+    def test_cant_save_other_types(self):
+        with self.assertRaises(ValueError):
+            save(self.file_path, [1, 2, 3])
+
+    def test_load_other_file(self):
+        with open(self.file_path, "wb") as file:
+            file.write(b"not an eqs binary file, but long enough")
+
+        with self.assertRaises(ValueError):
+            load(self.file_path)
+
+    def test_load_truncated_file(self):
+        save(self.file_path, Vector(4))
+        with open(self.file_path, "r+b") as file:
+            file.truncate(40)
+
+        with self.assertRaises(ValueError):
+            load(self.file_path)
@@ -0,0 +1,48 @@
+import unittest
+from array import array
+
+from eqs.blocked import cholesky_in_place, dot
+from eqs.pivots import NonPositivePivotError
+
+
+class BlockedTest(unittest.TestCase):
+    # [A] = [L][L]', with the lower triangle of [L] packed in `low_packed`
+    sys_values = [4, -2, 4, 2, -2, 10, -2, -7, 4, -2, 8, 4, 2, -7, 4, 7]
+    low_packed = [2, -1, 3, 2, 0, 2, 1, -2, 1, 1]
+
+    def test_dot(self):
+        self.assertEqual(32.0, dot([1, 2, 3], [4, 5, 6]))
+
+    def test_cholesky_packed(self):
+        for block_size in (1, 2, 3, 4):
+            with self.subTest(block_size=block_size):
+                data = array("d", self.__packed(self.sys_values))
+                cholesky_in_place(data, [0, 1, 3, 6], block_size=block_size)
+
+                self.assertEqual(array("d", self.low_packed), data)
+
+    def test_cholesky_row_major(self):
+        data = array("d", self.sys_values)
+        cholesky_in_place(data, [0, 4, 8, 12], block_size=3)
+
+        self.assertEqual(self.low_packed, self.__packed(data))
+
+    def test_cholesky_column_major(self):
+        # the matrix is symmetric, so its column-major data is the same
+        data = array("d", self.sys_values)
+        cholesky_in_place(data, [0, 1, 2, 3], col_stride=4, block_size=3)
+
+        low_values = [data[i + 4 * j] for i in range(4) for j in range(i + 1)]
+        self.assertEqual(self.low_packed, low_values)
+
+    def test_cholesky_non_positive_pivot(self):
+        data = array("d", [1, 2, 2, 1])
+
+        with self.assertRaises(NonPositivePivotError) as context:
+            cholesky_in_place(data, [0, 2], block_size=1)
+
+        self.assertEqual(1, context.exception.index)
+
+    @staticmethod
+    def __packed(values):
+        return [values[4 * i + j] for i in range(4) for j in range(i + 1)]
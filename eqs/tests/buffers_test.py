@@ -0,0 +1,143 @@
+import sys
+import unittest
+from array import array
+
+from eqs.buffers import doubles_view
+from eqs.matrix import Matrix
+from eqs.vector import Vector
+
+needs_buffer_protocol = unittest.skipIf(
+    sys.version_info < (3, 12), "Python classes export buffers since 3.12"
+)
+
+
+class DoublesViewTest(unittest.TestCase):
+    def test_view_of_doubles_array(self):
+        values = array("d", [1, 2, 3])
+        view = doubles_view(values)
+
+        view[0] = 10
+        self.assertEqual(10, values[0])
+
+    def test_view_of_bytes(self):
+        data = bytearray(array("d", [1, 2]).tobytes())
+        self.assertEqual([1, 2], doubles_view(data).tolist())
+
+    def test_flattens_multidimensional_buffer(self):
+        view = memoryview(array("d", [1, 2, 3, 4])).cast("B").cast("d", [2, 2])
+        self.assertEqual([1, 2, 3, 4], doubles_view(view).tolist())
+
+    def test_wrong_format(self):
+        with self.assertRaises(ValueError):
+            doubles_view(array("i", [1, 2]))
+
+    def test_wrong_size(self):
+        with self.assertRaises(ValueError):
+            doubles_view(bytearray(12))
+
+    def test_not_contiguous(self):
+        with self.assertRaises(ValueError):
+            doubles_view(memoryview(array("d", [1, 2, 3, 4]))[::2])
+
+
+class VectorBufferTest(unittest.TestCase):
+    def test_from_buffer_shares_storage(self):
+        values = array("d", [1, 2, 3])
+        vector = Vector.from_buffer(values)
+
+        self.assertEqual(3, vector.length)
+        vector.set_value(10, 1)
+        self.assertEqual(10, values[1])
+        values[2] = 20
+        self.assertEqual(20, vector.value_at(2))
+
+    def test_operations_on_buffer_vector(self):
+        vector = Vector.from_buffer(bytearray(array("d", [3, 4]).tobytes()))
+
+        self.assertEqual(5, vector.norm)
+        self.assertEqual([6, 8], list((vector + vector).data))
+        self.assertEqual([3, 4], list(vector.copy().data))
+
+    @needs_buffer_protocol
+    def test_exports_buffer(self):
+        vector = Vector(3).set_data([1, 2, 3])
+        view = memoryview(vector)
+
+        self.assertEqual("d", view.format)
+        self.assertEqual((3,), view.shape)
+        view[0] = 10
+        self.assertEqual(10, vector.value_at(0))
+
+
+class MatrixBufferTest(unittest.TestCase):
+    def test_from_buffer_shares_storage(self):
+        values = array("d", [1, 2, 3, 4, 5, 6])
+        matrix = Matrix.from_buffer(values, 2, 3)
+
+        self.assertEqual(2, matrix.rows_count)
+        self.assertEqual(3, matrix.cols_count)
+        self.assertEqual(6, matrix.value_at(1, 2))
+        matrix.set_value(10, 0, 1)
+        self.assertEqual(10, values[1])
+
+    def test_from_column_major_buffer(self):
+        values = array("d", [1, 4, 2, 5, 3, 6])
+        matrix = Matrix.from_buffer(values, 2, 3, column_major=True)
+
+        self.assertTrue(matrix.is_column_major)
+        self.assertEqual([4, 5, 6], list(matrix.row_values(1)))
+
+    def test_from_two_dimensional_buffer(self):
+        values = array("d", [1, 2, 3, 4, 5, 6])
+        view = memoryview(values).cast("B").cast("d", [3, 2])
+        matrix = Matrix.from_buffer(view)
+
+        self.assertEqual(3, matrix.rows_count)
+        self.assertEqual(2, matrix.cols_count)
+        self.assertEqual(3, matrix.value_at(1, 0))
+
+    def test_from_flat_buffer_needs_shape(self):
+        with self.assertRaises(ValueError):
+            Matrix.from_buffer(array("d", [1, 2, 3, 4]))
+
+    def test_from_buffer_size_mismatch(self):
+        with self.assertRaises(ValueError):
+            Matrix.from_buffer(array("d", [1, 2, 3, 4]), 2, 3)
+
+    def test_row_values_are_copies(self):
+        values = array("d", [1, 2, 3, 4])
+        row = Matrix.from_buffer(values, 2, 2).row_values(0)
+
+        row[0] = 10
+        self.assertEqual(1, values[0])
+
+    def test_operations_on_buffer_matrix(self):
+        values = array("d", [4, 1, 1, 3])
+        matrix = Matrix.from_buffer(bytearray(values.tobytes()), 2, 2)
+        expected = Matrix(2, 2).set_data(values)
+
+        self.assertEqual(expected * expected, matrix * matrix)
+        self.assertEqual(expected.transposed(), matrix.transposed())
+        self.assertEqual(expected, matrix.copy())
+
+    @needs_buffer_protocol
+    def test_exports_two_dimensional_buffer(self):
+        matrix = Matrix(2, 3).set_data([1, 2, 3, 4, 5, 6])
+        view = memoryview(matrix)
+
+        self.assertEqual("d", view.format)
+        self.assertEqual((2, 3), view.shape)
+        self.assertEqual([[1, 2, 3], [4, 5, 6]], view.tolist())
+
+    @needs_buffer_protocol
+    def test_round_trip_without_copy(self):
+        matrix = Matrix(2, 2).set_data([1, 2, 3, 4])
+        other = Matrix.from_buffer(matrix)
+
+        other.set_value(10, 1, 0)
+        self.assertEqual(10, matrix.value_at(1, 0))
+
+    @needs_buffer_protocol
+    def test_column_major_matrix_cant_be_exported(self):
+        with self.assertRaises(BufferError):
+            memoryview(Matrix(2, 2, column_major=True))
@@ -1,6 +1,12 @@
 import unittest
 
-from eqs.cholesky import lower_matrix_decomposition, cholesky_solve
+from eqs.cholesky import (
+    CholeskyFactorization,
+    cholesky_solve,
+    cholesky_solve_in_place,
+    lower_matrix_decomposition,
+    lower_matrix_decomposition_in_place,
+)
 from eqs.matrix import Matrix
 from eqs.vector import Vector
 
@@ -57,3 +63,46 @@ class CholeskyTest(unittest.TestCase):
     def test_solve_system(self):
         actual = cholesky_solve(self.sys_matrix, self.sys_vec)
         self.assertEqual(self.solution, actual)
+
+    def test_factorization_lower_matrix(self):
+        actual = CholeskyFactorization(self.sys_matrix).lower_matrix
+        self.assertEqual(self.low_matrix, actual)
+
+    def test_factorization_solves_many_vectors(self):
+        factorization = CholeskyFactorization(self.sys_matrix)
+
+        self.assertEqual(self.solution, factorization.solve(self.sys_vec))
+        self.assertEqual(
+            self.solution.scaled(2), factorization.solve(self.sys_vec.scaled(2))
+        )
+
+    def test_factorization_solve_many(self):
+        factorization = CholeskyFactorization(self.sys_matrix)
+        actual = factorization.solve_many([self.sys_vec, self.sys_vec.scaled(2)])
+
+        self.assertEqual([self.solution, self.solution.scaled(2)], actual)
+
+    def test_lower_matrix_decomposition_in_place(self):
+        sys_matrix = self.sys_matrix.copy()
+        actual = lower_matrix_decomposition_in_place(sys_matrix)
+
+        self.assertIs(sys_matrix, actual)
+        self.assertEqual(self.low_matrix, actual)
+
+    def test_lower_matrix_decomposition_in_place_column_major(self):
+        sys_matrix = Matrix(4, 4, column_major=True).set_data(self.sys_matrix.data)
+        actual = lower_matrix_decomposition_in_place(sys_matrix)
+        self.assertEqual(self.low_matrix, actual)
+
+    def test_solve_system_in_place(self):
+        sys_matrix = self.sys_matrix.copy()
+        actual = cholesky_solve_in_place(sys_matrix, self.sys_vec)
+
+        self.assertEqual(self.solution, actual)
+        self.assertEqual(self.low_matrix, sys_matrix)
+
+    def test_overwriting_factorization_solve_many(self):
+        factorization = CholeskyFactorization(self.sys_matrix.copy(), overwrite=True)
+        actual = factorization.solve_many([self.sys_vec, self.sys_vec.scaled(2)])
+
+        self.assertEqual([self.solution, self.solution.scaled(2)], actual)
@@ -1,7 +1,10 @@
 import unittest
 
 from eqs import Matrix, Vector
-from eqs.conjugate_gradient import conjugate_gradient_solve
+from eqs.conjugate_gradient import (
+    conjugate_gradient_solve,
+    conjugate_gradient_solve_with_record,
+)
 
 
 class ConjugateGradientTest(unittest.TestCase):
@@ -31,3 +34,87 @@ class ConjugateGradientTest(unittest.TestCase):
     def test_solve(self):
         actual = conjugate_gradient_solve(self.sys_matrix, self.sys_vec)
         self.assertEqual(self.solution, actual)
+
+    def test_solve_from_initial_guess(self):
+        guess = Vector(4).set_data([1.0, 2.0, 3.0, 3.9])
+        actual = conjugate_gradient_solve(
+            self.sys_matrix, self.sys_vec, initial_guess=guess
+        )
+
+        self.assertEqual(self.solution, actual)
+        self.assertEqual(3.9, guess.value_at(3))
+
+    def test_exact_initial_guess_takes_no_iterations(self):
+        (_, record) = conjugate_gradient_solve_with_record(
+            self.sys_matrix, self.sys_vec, initial_guess=self.solution
+        )
+
+        self.assertEqual(0, record.iterations)
+        self.assertEqual([0.0], record.residual_norms)
+
+    def test_relative_tolerance_is_scale_independent(self):
+        scaled_matrix = self.sys_matrix.copy().scale(1e6)
+        scaled_vec = self.sys_vec.scaled(1e6)
+
+        (_, record) = conjugate_gradient_solve_with_record(
+            self.sys_matrix, self.sys_vec, relative_tolerance=1e-12
+        )
+        (_, scaled_record) = conjugate_gradient_solve_with_record(
+            scaled_matrix, scaled_vec, relative_tolerance=1e-12
+        )
+
+        self.assertEqual(record.iterations, scaled_record.iterations)
+
+    def test_convergence_record(self):
+        (actual, record) = conjugate_gradient_solve_with_record(
+            self.sys_matrix, self.sys_vec
+        )
+
+        self.assertEqual(self.solution, actual)
+        self.assertEqual(record.iterations + 1, len(record.residual_norms))
+        self.assertAlmostEqual(self.sys_vec.norm, record.initial_residual_norm)
+        self.assertLess(record.final_residual_norm, 1e-8)
+
+    def test_initial_guess_size_mismatch(self):
+        self.assertRaises(
+            ValueError,
+            lambda: conjugate_gradient_solve(
+                self.sys_matrix, self.sys_vec, initial_guess=Vector(3)
+            ),
+        )
+
+    def test_zero_vector_ignores_initial_guess(self):
+        (actual, record) = conjugate_gradient_solve_with_record(
+            self.sys_matrix,
+            Vector(4),
+            max_iter=5,
+            initial_guess=self.solution,
+            relative_tolerance=1e-10,
+        )
+
+        self.assertEqual(Vector(4), actual)
+        self.assertEqual(0, record.iterations)
+
+    def test_zero_max_iterations_with_solved_system(self):
+        actual = conjugate_gradient_solve(
+            self.sys_matrix, self.sys_vec, max_iter=0, initial_guess=self.solution
+        )
+        self.assertEqual(self.solution, actual)
+
+    def test_zero_max_iterations_with_unsolved_system(self):
+        self.assertRaises(
+            ArithmeticError,
+            lambda: conjugate_gradient_solve(self.sys_matrix, self.sys_vec, max_iter=0),
+        )
+
+    def test_empty_system(self):
+        actual = conjugate_gradient_solve(
+            Matrix(0, 0), Vector(0), max_iter=0, relative_tolerance=1e-10
+        )
+        self.assertEqual(0, actual.length)
+
+    def test_max_iterations_reached(self):
+        self.assertRaises(
+            ArithmeticError,
+            lambda: conjugate_gradient_solve(self.sys_matrix, self.sys_vec, max_iter=1),
+        )
@@ -1,7 +1,8 @@
 import unittest
+from array import array
 
 from eqs import Vector
-from eqs.doolitle import doolitle_decomposition, doolitle_solve
+from eqs.doolitle import LUFactorization, doolitle_decomposition, doolitle_solve
 from eqs.matrix import Matrix
 
 
@@ -30,3 +31,73 @@ class DoolitleTest(unittest.TestCase):
     def test_solve_system(self):
         actual = doolitle_solve(self.sys_matrix, self.sys_vec)
         self.assertEqual(self.expected_solution, actual)
+
+    def test_solve_system_with_zero_in_diagonal(self):
+        matrix = Matrix(3, 3).set_data([0, 1, 2, 3, 4, 5, 6, 7, 9])
+        vector = Vector(3).set_data([8, 26, 47])
+        actual = doolitle_solve(matrix, vector)
+        self.assertEqual(self.expected_solution, actual)
+
+
+class LUFactorizationTest(unittest.TestCase):
+    sys_matrix = Matrix(3, 3).set_data([0, 1, 2, 3, 4, 5, 6, 7, 9])
+    sys_vec = Vector(3).set_data([8, 26, 47])
+    expected_solution = Vector(3).set_data([1.0, 2.0, 3.0])
+
+    def test_permutation(self):
+        factorization = LUFactorization(self.sys_matrix)
+        self.assertEqual([2, 0, 1], factorization.permutation)
+
+    def test_lu_matrix(self):
+        # [U] in the upper triangle, the multipliers of [L] below it
+        expected = Matrix(3, 3).set_data([6, 7, 9, 0, 1, 2, 0.5, 0.5, -0.5])
+        actual = LUFactorization(self.sys_matrix).lu_matrix
+        self.assertEqual(expected, actual)
+
+    def test_does_not_modify_matrix(self):
+        original = self.sys_matrix.copy()
+        LUFactorization(self.sys_matrix)
+        self.assertEqual(original, self.sys_matrix)
+
+    def test_overwrite(self):
+        matrix = self.sys_matrix.copy()
+        factorization = LUFactorization(matrix, overwrite=True)
+
+        self.assertIs(matrix, factorization.lu_matrix)
+        self.assertEqual(self.expected_solution, factorization.solve(self.sys_vec))
+
+    def test_column_major(self):
+        matrix = Matrix(3, 3, column_major=True).set_data([0, 1, 2, 3, 4, 5, 6, 7, 9])
+        actual = LUFactorization(matrix, overwrite=True).solve(self.sys_vec)
+        self.assertEqual(self.expected_solution, actual)
+
+    def test_overwrite_buffer_backed(self):
+        # the rows are swapped in the buffer, through memoryview slices
+        for column_major in (False, True):
+            buffer = array("d", [0, 1, 2, 3, 4, 5, 6, 7, 9])
+            matrix = Matrix.from_buffer(buffer, 3, 3, column_major=column_major)
+            expected = LUFactorization(matrix)
+            factorization = LUFactorization(matrix, overwrite=True)
+
+            self.assertEqual(expected.lu_matrix, factorization.lu_matrix)
+            self.assertEqual(
+                expected.solve(self.sys_vec), factorization.solve(self.sys_vec)
+            )
+
+    def test_solve_many(self):
+        factorization = LUFactorization(self.sys_matrix)
+        other_vec = Vector(3).set_data([1, 4, 7])
+        expected = [self.expected_solution, Vector(3).set_data([0, 1, 0])]
+
+        self.assertEqual(expected, factorization.solve_many([self.sys_vec, other_vec]))
+
+    def test_pivot_growth(self):
+        matrix = Matrix(2, 2).set_data([1, 1, 1, -1])
+        self.assertEqual(2.0, LUFactorization(matrix).pivot_growth)
+
+    def test_singular_matrix(self):
+        matrix = Matrix(2, 2).set_data([1, 2, 2, 4])
+        self.assertRaises(ValueError, LUFactorization, matrix)
+
+    def test_non_square_matrix(self):
+        self.assertRaises(ValueError, LUFactorization, Matrix(2, 3))
@@ -0,0 +1,78 @@
+import unittest
+
+from eqs.ldlt import LDLFactorization, ldlt_solve
+from eqs.matrix import Matrix
+from eqs.pivots import NonPositivePivotError
+from eqs.symmetric_matrix import SymmetricMatrix
+from eqs.vector import Vector
+
+
+class LDLTest(unittest.TestCase):
+    sys_matrix = Matrix(4, 4).set_data(
+        [4, -2, 4, 2, -2, 10, -2, -7, 4, -2, 8, 4, 2, -7, 4, 7]
+    )
+    sys_vec = Vector(4).set_data([20, -16, 40, 28])
+    solution = Vector(4).set_data([1.0, 2.0, 3.0, 4.0])
+
+    def test_pivots(self):
+        # the squares of the diagonal of the Cholesky factor
+        factorization = LDLFactorization(self.sys_matrix)
+        self.assertEqual([4.0, 9.0, 4.0, 1.0], factorization.pivots)
+
+    def test_solve_system(self):
+        self.assertEqual(self.solution, ldlt_solve(self.sys_matrix, self.sys_vec))
+
+    def test_solve_many(self):
+        factorization = LDLFactorization(self.sys_matrix)
+        other_vec = Vector(4).set_data([4, -2, 4, 2])
+        expected = [self.solution, Vector(4).set_data([1, 0, 0, 0])]
+
+        self.assertEqual(expected, factorization.solve_many([self.sys_vec, other_vec]))
+
+    def test_overwrite_symmetric_matrix(self):
+        matrix = self.__symmetric_matrix()
+        factorization = LDLFactorization(matrix, overwrite=True)
+
+        self.assertEqual(4.0, matrix.value_at(0, 0))
+        self.assertEqual(-0.5, matrix.value_at(1, 0))
+        self.assertEqual(self.solution, factorization.solve(self.sys_vec))
+
+    def test_does_not_modify_symmetric_matrix(self):
+        matrix = self.__symmetric_matrix()
+        LDLFactorization(matrix)
+        self.assertEqual(-2.0, matrix.value_at(1, 0))
+
+    def test_singular_matrix(self):
+        # the third row is the sum of the first two
+        matrix = Matrix(3, 3).set_data([2, -1, 1, -1, 2, 1, 1, 1, 2])
+
+        with self.assertRaises(NonPositivePivotError) as context:
+            LDLFactorization(matrix)
+
+        self.assertEqual(2, context.exception.index)
+
+    def test_negative_pivot(self):
+        matrix = Matrix(2, 2).set_data([1, 2, 2, 1])
+
+        with self.assertRaises(NonPositivePivotError) as context:
+            LDLFactorization(matrix)
+
+        self.assertEqual(1, context.exception.index)
+        self.assertEqual(-3.0, context.exception.pivot)
+
+    def test_relative_tolerance(self):
+        matrix = Matrix(2, 2).set_data([1, 1, 1, 1 + 1e-6])
+
+        self.assertRaises(
+            NonPositivePivotError,
+            lambda: LDLFactorization(matrix, relative_tolerance=1e-4),
+        )
+        self.assertAlmostEqual(1e-6, LDLFactorization(matrix).pivots[1])
+
+    def __symmetric_matrix(self):
+        matrix = SymmetricMatrix(4)
+        for i in range(4):
+            for j in range(i + 1):
+                matrix.set_value(self.sys_matrix.value_at(i, j), i, j)
+
+        return matrix
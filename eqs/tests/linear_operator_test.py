@@ -0,0 +1,79 @@
+import unittest
+
+from eqs.conjugate_gradient import conjugate_gradient_solve
+from eqs.linear_operator import LinearOperator
+from eqs.preconditioners import JacobiPreconditioner
+from eqs.vector import Vector
+
+
+class TridiagonalOperator(LinearOperator):
+    """
+    The matrix with 4 in the main diagonal and -1 next to it.
+    """
+
+    def __init__(self, size: int):
+        LinearOperator.__init__(self, size, size)
+
+    def matvec(self, v: Vector, out: Vector) -> Vector:
+        size = self.rows_count
+        for i in range(size):
+            value = 4 * v.value_at(i)
+            if i > 0:
+                value -= v.value_at(i - 1)
+            if i < size - 1:
+                value -= v.value_at(i + 1)
+
+            out.set_value(value, i)
+
+        return out
+
+    def diagonal(self) -> Vector:
+        return Vector(self.rows_count).set_data([4.0] * self.rows_count)
+
+
+class LinearOperatorTest(unittest.TestCase):
+    operator = TridiagonalOperator(3)
+    solution = Vector(3).set_data([1, 2, 3])
+    sys_vec = Vector(3).set_data([2, 4, 10])
+
+    def test_operator_without_diagonal_cant_be_created(self):
+        class IdentityOperator(LinearOperator):
+            def matvec(self, v: Vector, out: Vector) -> Vector:
+                return out.set_data(v.data)
+
+        self.assertRaises(TypeError, lambda: IdentityOperator(2, 2))
+
+    def test_shape(self):
+        self.assertEqual((3, 3), self.operator.shape)
+        self.assertTrue(self.operator.is_square)
+
+    def test_times_vector(self):
+        self.assertEqual(self.sys_vec, self.operator.times_vector(self.solution))
+
+    def test_times_vector_into_out(self):
+        out = Vector(3)
+        result = self.operator.times_vector(self.solution, out=out)
+
+        self.assertIs(out, result)
+        self.assertEqual(self.sys_vec, out)
+
+    def test_times_vector_size_mismatch(self):
+        self.assertRaises(ValueError, self.operator.times_vector, Vector(2))
+        self.assertRaises(
+            ValueError, self.operator.times_vector, self.solution, Vector(2)
+        )
+
+    def test_abstract_operator_cant_be_created(self):
+        self.assertRaises(TypeError, lambda: LinearOperator(2, 2))
+
+    def test_conjugate_gradient_solve(self):
+        actual = conjugate_gradient_solve(self.operator, self.sys_vec)
+        self.assertEqual(self.solution, actual)
+
+    def test_conjugate_gradient_solve_with_jacobi(self):
+        actual = conjugate_gradient_solve(
+            self.operator,
+            self.sys_vec,
+            preconditioner=JacobiPreconditioner(self.operator),
+        )
+        self.assertEqual(self.solution, actual)
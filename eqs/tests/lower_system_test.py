@@ -1,6 +1,6 @@
 import unittest
 
-from eqs.lower_system import solve_lower_sys
+from eqs.lower_system import solve_lower_sys, solve_lower_sys_many
 from eqs.matrix import Matrix
 from eqs.vector import Vector
 
@@ -32,3 +32,18 @@ class LowerSystemResolutionTest(unittest.TestCase):
     def test_lower_system_resolution(self):
         actual = solve_lower_sys(self.low_matrix, self.sys_vec)
         self.assertEqual(self.expected_solution, actual)
+
+    def test_many_systems_resolution(self):
+        vectors = [self.sys_vec, self.sys_vec.scaled(2), self.sys_vec.scaled(-1)]
+        expected = [
+            self.expected_solution,
+            self.expected_solution.scaled(2),
+            self.expected_solution.scaled(-1),
+        ]
+
+        self.assertEqual(expected, solve_lower_sys_many(self.low_matrix, vectors))
+
+    def test_many_systems_size_mismatch(self):
+        self.assertRaises(
+            ValueError, lambda: solve_lower_sys_many(self.low_matrix, [Vector(3)])
+        )
@@ -1,6 +1,7 @@
 import unittest
 
 from eqs import Vector
+from eqs.blocked import BLOCK_SIZE
 from eqs.matrix import Matrix
 
 
@@ -52,6 +53,20 @@ class MatrixTest(unittest.TestCase):
 
         self.assertEqual(expected, matrix.times_vector(vector))
 
+    def test_multiply_vector_into_output(self):
+        vector = Vector(3).set_data([1, 2, 3])
+        matrix = Matrix(2, 3).set_data([1, 2, 3, 4, 5, 6])
+        out = Vector(2).set_data([7, 7])
+
+        self.assertIs(out, matrix.times_vector(vector, out=out))
+        self.assertEqual(Vector(2).set_data([14, 32]), out)
+
+    def test_multiply_vector_wrong_output(self):
+        matrix = Matrix(2, 3)
+        self.assertRaises(
+            ValueError, lambda: matrix.times_vector(Vector(3), out=Vector(3))
+        )
+
     def test_cant_add_matrices(self):
         m1 = Matrix(1, 2)
         m2 = Matrix(2, 3)
@@ -91,6 +106,53 @@ class MatrixTest(unittest.TestCase):
 
         self.assert_matrix_has_data(m1 * m2, expected_data)
 
+    def test_column_major_set_data(self):
+        data = [1, 2, 3, 4, 5, 6]
+        matrix = Matrix(2, 3, column_major=True).set_data(data)
+
+        self.assert_matrix_has_data(matrix, data)
+        self.assertEqual([1, 4, 2, 5, 3, 6], list(matrix.data))
+
+    def test_column_major_equals_row_major(self):
+        data = [1, 2, 3, 4, 5, 6]
+        self.assertEqual(
+            Matrix(2, 3).set_data(data), Matrix(2, 3, column_major=True).set_data(data)
+        )
+
+    def test_flat_data_index(self):
+        matrix = Matrix(2, 3).set_data([1, 2, 3, 4, 5, 6])
+        self.assertEqual(6, matrix.data[matrix.index_of(1, 2)])
+
+    def test_row_and_col_values(self):
+        matrix = Matrix(2, 3, column_major=True).set_data([1, 2, 3, 4, 5, 6])
+
+        self.assertEqual([4, 5, 6], list(matrix.row_values(1)))
+        self.assertEqual([3, 6], list(matrix.col_values(2)))
+
+    def test_row_values_in_columns_range(self):
+        matrix = Matrix(2, 3, column_major=True).set_data([1, 2, 3, 4, 5, 6])
+
+        self.assertEqual([5, 6], list(matrix.row_values(1, 1)))
+        self.assertEqual([4, 5], list(matrix.row_values(1, 0, 2)))
+
+    def test_multiply_wider_than_a_block(self):
+        size = BLOCK_SIZE + 3
+        m1 = Matrix(1, 2).set_data([1, 2])
+        m2 = Matrix(2, size).set_data(list(range(2 * size)))
+        expected = Matrix(1, size).set_data([2 * size + 3 * j for j in range(size)])
+
+        self.assertEqual(expected, m1 * m2)
+
+    def test_value_out_of_bounds(self):
+        self.assertRaises(IndexError, lambda: Matrix(2, 2).value_at(0, 2))
+
+    def test_multiply_column_major_matrices(self):
+        m1 = Matrix(2, 3, column_major=True).set_data([1, 2, 3, 4, 5, 6])
+        m2 = Matrix(3, 2).set_data([1, 2, 3, 4, 5, 6])
+        expected_data = [22, 28, 49, 64]
+
+        self.assert_matrix_has_data(m1 * m2, expected_data)
+
     def test_transpose_matrix(self):
         mat = Matrix(2, 3).set_data([1, 2, 3, 4, 5, 6]).transposed()
         expected = Matrix(3, 2).set_data([1, 4, 2, 5, 3, 6])
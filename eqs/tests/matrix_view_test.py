@@ -0,0 +1,99 @@
+import unittest
+
+from eqs.cholesky import CholeskyFactorization, lower_matrix_decomposition_in_place
+from eqs.matrix import Matrix
+from eqs.matrix_view import MatrixView
+from eqs.vector import Vector
+
+
+class MatrixViewTest(unittest.TestCase):
+    def setUp(self):
+        self.matrix = Matrix(3, 4).set_data([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+    def test_size(self):
+        view = MatrixView(self.matrix, range(1, 3), range(0, 4, 2))
+
+        self.assertEqual(2, view.rows_count)
+        self.assertEqual(2, view.cols_count)
+        self.assertTrue(view.is_square)
+
+    def test_value_at(self):
+        view = MatrixView(self.matrix, range(1, 3), range(0, 4, 2))
+
+        self.assertEqual(5, view.value_at(0, 0))
+        self.assertEqual(11, view.value_at(1, 1))
+
+    def test_value_out_of_bounds(self):
+        view = MatrixView(self.matrix, range(1, 3), range(1, 3))
+        self.assertRaises(IndexError, lambda: view.value_at(2, 0))
+
+    def test_range_out_of_bounds(self):
+        self.assertRaises(IndexError, lambda: MatrixView(self.matrix, range(2, 4)))
+
+    def test_negative_step(self):
+        self.assertRaises(ValueError, lambda: MatrixView(self.matrix, range(2, 0, -1)))
+
+    def test_writes_to_the_matrix(self):
+        view = MatrixView(self.matrix, range(1, 3), range(1, 3))
+        view.set_value(60, 0, 0).add_to_value(4, 1, 1)
+
+        self.assertEqual(60, self.matrix.value_at(1, 1))
+        self.assertEqual(15, self.matrix.value_at(2, 2))
+
+    def test_sees_changes_in_the_matrix(self):
+        view = MatrixView(self.matrix, range(1, 3), range(1, 3))
+        self.matrix.set_value(60, 1, 1)
+
+        self.assertEqual(60, view.value_at(0, 0))
+
+    def test_transposed(self):
+        view = MatrixView(self.matrix, range(0, 2), range(1, 4), transposed=True)
+
+        self.assertEqual((3, 2), (view.rows_count, view.cols_count))
+        self.assertEqual(7, view.value_at(1, 1))
+        self.assertEqual(view.transposed().to_matrix(), self.matrix_block())
+
+    def test_view_of_view(self):
+        view = MatrixView(self.matrix, range(1, 3), range(1, 4))
+        inner = MatrixView(view, range(1, 2), range(0, 3, 2))
+
+        self.assertEqual(Matrix(1, 2).set_data([10, 12]), inner.to_matrix())
+
+    def test_row_and_col_values(self):
+        view = MatrixView(self.matrix, range(0, 3, 2), range(1, 4))
+
+        self.assertEqual([10, 11, 12], list(view.row_values(1)))
+        self.assertEqual([11], list(view.row_values(1, 1, 2)))
+        self.assertEqual([4, 12], list(view.col_values(2)))
+
+    def test_column_major_matrix(self):
+        matrix = Matrix(3, 4, column_major=True).set_data(list(self.matrix.data))
+        view = MatrixView(matrix, range(1, 3), range(1, 3))
+
+        self.assertEqual(Matrix(2, 2).set_data([6, 7, 10, 11]), view.to_matrix())
+
+    def test_times_vector(self):
+        view = MatrixView(self.matrix, range(1, 3), range(1, 3))
+        vector = Vector(2).set_data([1, -1])
+        expected = Vector(2).set_data([-1, -1])
+
+        self.assertEqual(expected, view.times_vector(vector))
+
+    def test_cholesky_in_place_of_a_block(self):
+        # the lower right block is [[4, -2], [-2, 10]]
+        matrix = Matrix(3, 3).set_data([1, 2, 3, 4, 4, -2, 5, -2, 10])
+        block = MatrixView(matrix, range(1, 3), range(1, 3))
+        lower_matrix_decomposition_in_place(block)
+
+        expected = Matrix(3, 3).set_data([1, 2, 3, 4, 2, 0, 5, -1, 3])
+        self.assertEqual(expected, matrix)
+
+    def test_cholesky_factorization_of_a_block(self):
+        matrix = Matrix(3, 3).set_data([1, 2, 3, 4, 4, -2, 5, -2, 10])
+        block = MatrixView(matrix, range(1, 3), range(1, 3))
+        solution = CholeskyFactorization(block).solve(Vector(2).set_data([0, 18]))
+
+        self.assertEqual(Vector(2).set_data([1, 2]), solution)
+
+    def matrix_block(self):
+        return Matrix(2, 3).set_data([2, 3, 4, 6, 7, 8])
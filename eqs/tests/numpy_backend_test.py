@@ -0,0 +1,70 @@
+import importlib.util
+import unittest
+
+from eqs.backend import NUMPY_BACKEND, get_backend, set_backend
+from eqs.tests import (
+    cholesky_test,
+    conjugate_gradient_test,
+    doolitle_test,
+    lower_system_test,
+    matrix_test,
+    upper_system_test,
+)
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class NumpyBackendMixin:
+    """
+    Runs the tests of the class it's mixed into with the NumPy
+    backend selected, so both backends pass the same tests.
+    """
+
+    def setUp(self):
+        self.__previous_backend = get_backend()
+        set_backend(NUMPY_BACKEND)
+
+    def tearDown(self):
+        set_backend(self.__previous_backend)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy isn't installed")
+class NumpyMatrixTest(NumpyBackendMixin, matrix_test.MatrixTest):
+    pass
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy isn't installed")
+class NumpyCholeskyTest(NumpyBackendMixin, cholesky_test.CholeskyTest):
+    pass
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy isn't installed")
+class NumpyDoolitleTest(NumpyBackendMixin, doolitle_test.DoolitleTest):
+    pass
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy isn't installed")
+class NumpyLowerSystemTest(
+    NumpyBackendMixin, lower_system_test.LowerSystemResolutionTest
+):
+    pass
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy isn't installed")
+class NumpyUpperSystemTest(
+    NumpyBackendMixin, upper_system_test.UpperSystemResolutionTest
+):
+    pass
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy isn't installed")
+class NumpyConjugateGradientTest(
+    NumpyBackendMixin, conjugate_gradient_test.ConjugateGradientTest
+):
+    pass
+
+
+class BackendTest(unittest.TestCase):
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            set_backend("fortran")
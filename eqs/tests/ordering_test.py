@@ -0,0 +1,43 @@
+import unittest
+
+from eqs.ordering import minimum_degree, reverse_cuthill_mckee
+
+
+class ReverseCuthillMcKeeTest(unittest.TestCase):
+    # Path graph 0 - 4 - 1 - 3 - 2, numbered out of order
+    path = [[4], [4, 3], [3], [1, 2], [0, 1]]
+
+    def test_orders_every_vertex_once(self):
+        order = reverse_cuthill_mckee(self.path)
+        self.assertEqual([0, 1, 2, 3, 4], sorted(order))
+
+    def test_path_graph_has_unit_bandwidth(self):
+        order = reverse_cuthill_mckee(self.path)
+        position = {vertex: i for i, vertex in enumerate(order)}
+
+        for vertex, neighbours in enumerate(self.path):
+            for neighbour in neighbours:
+                self.assertEqual(1, abs(position[vertex] - position[neighbour]))
+
+    def test_disconnected_components(self):
+        order = reverse_cuthill_mckee([[1], [0], [], [4], [3]])
+        self.assertEqual([0, 1, 2, 3, 4], sorted(order))
+
+    def test_empty_graph(self):
+        self.assertEqual([], reverse_cuthill_mckee([]))
+
+
+class MinimumDegreeTest(unittest.TestCase):
+    # Star graph: the center 0 is connected to every other vertex
+    star = [[1, 2, 3, 4], [0], [0], [0], [0]]
+
+    def test_orders_every_vertex_once(self):
+        order = minimum_degree(self.star)
+        self.assertEqual([0, 1, 2, 3, 4], sorted(order))
+
+    def test_star_center_is_eliminated_after_leaves(self):
+        # Eliminating the center first would connect every leaf
+        self.assertIn(0, minimum_degree(self.star)[-2:])
+
+    def test_empty_graph(self):
+        self.assertEqual([], minimum_degree([]))
@@ -0,0 +1,83 @@
+import unittest
+
+from eqs.conjugate_gradient import conjugate_gradient_solve
+from eqs.matrix import Matrix
+from eqs.preconditioners import (
+    IncompleteCholeskyPreconditioner,
+    JacobiPreconditioner,
+    Preconditioner,
+    SsorPreconditioner,
+)
+from eqs.sparse_matrix import make_csr_from_matrix
+from eqs.vector import Vector
+
+
+class PreconditionersTest(unittest.TestCase):
+    sys_matrix = Matrix(4, 4).set_data(
+        [4, -2, 4, 2, -2, 10, -2, -7, 4, -2, 8, 4, 2, -7, 4, 7]
+    )
+    sys_vec = Vector(4).set_data([20, -16, 40, 28])
+    solution = Vector(4).set_data([1.0, 2.0, 3.0, 4.0])
+
+    # Tridiagonal matrix, where IC(0) is the exact Cholesky factorization
+    tridiagonal = Matrix(3, 3).set_data([4, -1, 0, -1, 4, -1, 0, -1, 4])
+
+    def test_abstract_preconditioner_cant_be_created(self):
+        class NoApplyPreconditioner(Preconditioner):
+            pass
+
+        self.assertRaises(TypeError, lambda: Preconditioner())
+        self.assertRaises(TypeError, lambda: NoApplyPreconditioner())
+
+    def test_jacobi_apply(self):
+        preconditioner = JacobiPreconditioner(self.sys_matrix)
+        expected = Vector(4).set_data([5, -1.6, 5, 4])
+
+        self.assertEqual(expected, preconditioner.apply(self.sys_vec))
+
+    def test_jacobi_zero_diagonal(self):
+        self.assertRaises(ValueError, lambda: JacobiPreconditioner(Matrix(2, 2)))
+
+    def test_ssor_apply_inverts_its_matrix(self):
+        # with w = 1: [M] = ([D] + [L]) [D]^-1 ([D] + [L]')
+        matrix = Matrix(2, 2).set_data([2, 1, 1, 2])
+        vector = Vector(2).set_data([3, 3.5])
+        expected = Vector(2).set_data([1, 1])
+
+        self.assertEqual(expected, SsorPreconditioner(matrix).apply(vector))
+
+    def test_ssor_wrong_omega(self):
+        self.assertRaises(
+            ValueError, lambda: SsorPreconditioner(self.sys_matrix, omega=2)
+        )
+
+    def test_incomplete_cholesky_without_fill_is_exact(self):
+        preconditioner = IncompleteCholeskyPreconditioner(self.tridiagonal)
+        expected = Vector(3).set_data([1, 2, 3])
+        vector = self.tridiagonal.times_vector(expected)
+
+        self.assertEqual(expected, preconditioner.apply(vector))
+
+    def test_preconditioned_conjugate_gradient(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        preconditioners = [
+            JacobiPreconditioner(csr),
+            SsorPreconditioner(csr, omega=1.2),
+            IncompleteCholeskyPreconditioner(csr),
+        ]
+
+        for preconditioner in preconditioners:
+            actual = conjugate_gradient_solve(
+                csr, self.sys_vec, preconditioner=preconditioner
+            )
+            self.assertEqual(self.solution, actual)
+
+    def test_exact_preconditioner_converges_in_one_iteration(self):
+        preconditioner = IncompleteCholeskyPreconditioner(self.tridiagonal)
+        vector = Vector(3).set_data([3, 0, 11])
+
+        # the second iteration only checks the solution
+        actual = conjugate_gradient_solve(
+            self.tridiagonal, vector, max_iter=2, preconditioner=preconditioner
+        )
+        self.assertEqual(Vector(3).set_data([1, 1, 3]), actual)
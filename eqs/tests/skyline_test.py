@@ -0,0 +1,150 @@
+import unittest
+from array import array
+
+from eqs.matrix import Matrix
+from eqs.pivots import NonPositivePivotError
+from eqs.skyline import (
+    SkylineCholeskyFactorization,
+    SkylineMatrix,
+    skyline_cholesky_decomposition,
+    skyline_cholesky_solve,
+    solve_skyline_lower_sys,
+    solve_skyline_upper_sys,
+)
+from eqs.vector import Vector
+
+
+class SkylineMatrixTest(unittest.TestCase):
+    def test_profile_size(self):
+        self.assertEqual(7, SkylineMatrix([0, 0, 1, 2]).profile_size)
+
+    def test_wrong_first_col(self):
+        self.assertRaises(ValueError, lambda: SkylineMatrix([0, 2]))
+
+    def test_value_is_symmetric(self):
+        matrix = SkylineMatrix([0, 0]).set_value(5, 1, 0)
+
+        self.assertEqual(5, matrix.value_at(1, 0))
+        self.assertEqual(5, matrix.value_at(0, 1))
+
+    def test_value_outside_profile_is_zero(self):
+        self.assertEqual(0.0, SkylineMatrix([0, 1, 1]).value_at(2, 0))
+
+    def test_cant_set_value_outside_profile(self):
+        matrix = SkylineMatrix([0, 1, 1])
+        self.assertRaises(ValueError, lambda: matrix.add_to_value(1, 0, 2))
+
+    def test_set_identity_row(self):
+        matrix = make_skyline([0, 0, 1], [4, 1, 5, 2, 6])
+        matrix.set_identity_row(1)
+
+        self.assertEqual(1, matrix.value_at(1, 1))
+        self.assertEqual(0, matrix.value_at(1, 0))
+        self.assertEqual(0, matrix.value_at(2, 1))
+        self.assertEqual(4, matrix.value_at(0, 0))
+
+    def test_multiply_vector(self):
+        matrix = make_skyline([0, 0, 1], [4, 1, 5, 2, 6])
+        vector = Vector(3).set_data([1, 2, 3])
+        expected = Vector(3).set_data([6, 17, 22])
+
+        self.assertEqual(expected, matrix.times_vector(vector))
+
+    def test_multiply_vector_into_out(self):
+        matrix = make_skyline([0, 0, 1], [4, 1, 5, 2, 6])
+        vector = Vector(3).set_data([1, 2, 3])
+        out = Vector(3).set_data([9, 9, 9])
+
+        self.assertIs(out, matrix.times_vector(vector, out=out))
+        self.assertEqual(Vector(3).set_data([6, 17, 22]), out)
+
+    def test_multiply_vector_out_size_mismatch(self):
+        matrix = make_skyline([0, 0, 1], [4, 1, 5, 2, 6])
+        vector = Vector(3).set_data([1, 2, 3])
+
+        self.assertRaises(ValueError, matrix.times_vector, vector, Vector(2))
+
+    def test_data_is_flat_array(self):
+        matrix = make_skyline([0, 0, 1], [4, 1, 5, 2, 6])
+
+        self.assertEqual(array("d", [4, 1, 5, 2, 6]), matrix.data)
+        self.assertEqual(2, matrix.row_start(2))
+        self.assertEqual(matrix.data, matrix.copy().data)
+
+
+class SkylineCholeskyTest(unittest.TestCase):
+    # Same system as the dense Cholesky test, with the profile [0, 0, 0, 0]
+    sys_matrix = Matrix(4, 4).set_data(
+        [4, -2, 4, 2, -2, 10, -2, -7, 4, -2, 8, 4, 2, -7, 4, 7]
+    )
+    low_matrix = Matrix(4, 4).set_data(
+        [2, 0, 0, 0, -1, 3, 0, 0, 2, 0, 2, 0, 1, -2, 1, 1]
+    )
+    sys_vec = Vector(4).set_data([20, -16, 40, 28])
+    low_solution = Vector(4).set_data([10, -2, 10, 4])
+    solution = Vector(4).set_data([1.0, 2.0, 3.0, 4.0])
+
+    def setUp(self):
+        self.skyline = SkylineMatrix([0, 0, 0, 0])
+        for i in range(4):
+            for j in range(i + 1):
+                self.skyline.set_value(self.sys_matrix.value_at(i, j), i, j)
+
+    def test_decomposition(self):
+        actual = skyline_cholesky_decomposition(self.skyline)
+
+        for i in range(4):
+            for j in range(i + 1):
+                self.assertAlmostEqual(
+                    self.low_matrix.value_at(i, j), actual.value_at(i, j)
+                )
+
+    def test_lower_system_resolution(self):
+        lower = skyline_cholesky_decomposition(self.skyline)
+        actual = solve_skyline_lower_sys(lower, self.sys_vec)
+        self.assertEqual(self.low_solution, actual)
+
+    def test_upper_system_resolution(self):
+        lower = skyline_cholesky_decomposition(self.skyline)
+        actual = solve_skyline_upper_sys(lower, self.low_solution)
+        self.assertEqual(self.solution, actual)
+
+    def test_solve_banded_system(self):
+        matrix = make_skyline([0, 0, 1], [4, 1, 5, 2, 6])
+        vector = Vector(3).set_data([6, 17, 22])
+        expected = Vector(3).set_data([1, 2, 3])
+
+        self.assertEqual(expected, skyline_cholesky_solve(matrix, vector))
+
+    def test_factorization_solves_many_vectors(self):
+        factorization = SkylineCholeskyFactorization(self.skyline)
+
+        self.assertEqual(self.solution, factorization.solve(self.sys_vec))
+        self.assertEqual(
+            self.solution.scaled(3), factorization.solve(self.sys_vec.scaled(3))
+        )
+
+    def test_factorization_solve_many(self):
+        factorization = SkylineCholeskyFactorization(self.skyline)
+        actual = factorization.solve_many([self.sys_vec, self.sys_vec.scaled(2)])
+
+        self.assertEqual([self.solution, self.solution.scaled(2)], actual)
+
+    def test_singular_matrix(self):
+        matrix = make_skyline([0, 0], [1, 1, 1])
+
+        with self.assertRaises(NonPositivePivotError) as context:
+            skyline_cholesky_decomposition(matrix)
+
+        self.assertEqual(1, context.exception.index)
+
+
+def make_skyline(first_cols, lower_values):
+    matrix = SkylineMatrix(first_cols)
+    values = iter(lower_values)
+
+    for i, first_col in enumerate(first_cols):
+        for j in range(first_col, i + 1):
+            matrix.set_value(next(values), i, j)
+
+    return matrix
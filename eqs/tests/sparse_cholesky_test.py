@@ -0,0 +1,95 @@
+import unittest
+
+from eqs.matrix import Matrix
+from eqs.pivots import NonPositivePivotError
+from eqs.sparse_cholesky import (
+    SparseCholeskyAnalysis,
+    elimination_tree,
+    sparse_cholesky_solve,
+)
+from eqs.sparse_matrix import make_csr_from_matrix
+from eqs.vector import Vector
+
+
+class SparseCholeskyTest(unittest.TestCase):
+    sys_matrix = Matrix(4, 4).set_data(
+        [4, -2, 4, 2, -2, 10, -2, -7, 4, -2, 8, 4, 2, -7, 4, 7]
+    )
+    sys_vec = Vector(4).set_data([20, -16, 40, 28])
+    solution = Vector(4).set_data([1.0, 2.0, 3.0, 4.0])
+
+    # Arrow matrix: the last unknown is coupled with every other one
+    arrow_matrix = Matrix(4, 4).set_data(
+        [4, 0, 0, 1, 0, 4, 0, 1, 0, 0, 4, 1, 1, 1, 1, 4]
+    )
+
+    def test_solve_system(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        self.assertEqual(self.solution, sparse_cholesky_solve(csr, self.sys_vec))
+
+    def test_solve_with_natural_ordering(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        factorization = SparseCholeskyAnalysis(csr, [0, 1, 2, 3]).factorize(csr)
+
+        self.assertEqual(self.solution, factorization.solve(self.sys_vec))
+
+    def test_solve_many(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        factorization = SparseCholeskyAnalysis(csr).factorize(csr)
+        actual = factorization.solve_many([self.sys_vec, self.sys_vec.scaled(2)])
+
+        self.assertEqual([self.solution, self.solution.scaled(2)], actual)
+
+    def test_arrow_matrix_has_no_fill(self):
+        csr = make_csr_from_matrix(self.arrow_matrix)
+        analysis = SparseCholeskyAnalysis(csr)
+
+        self.assertEqual(7, analysis.factor_non_zeros_count)
+
+    def test_arrow_matrix_fills_in_reverse_order(self):
+        csr = make_csr_from_matrix(self.arrow_matrix)
+        analysis = SparseCholeskyAnalysis(csr, [3, 2, 1, 0])
+
+        self.assertEqual(10, analysis.factor_non_zeros_count)
+
+    def test_analysis_is_reused(self):
+        csr = make_csr_from_matrix(self.arrow_matrix)
+        analysis = SparseCholeskyAnalysis(csr)
+        scaled_csr = make_csr_from_matrix(self.arrow_matrix.copy().scale(2))
+        vector = Vector(4).set_data([5, 5, 5, 7])
+
+        self.assertEqual(
+            Vector(4).set_data([1, 1, 1, 1]), analysis.factorize(csr).solve(vector)
+        )
+        self.assertEqual(
+            Vector(4).set_data([0.5, 0.5, 0.5, 0.5]),
+            analysis.factorize(scaled_csr).solve(vector),
+        )
+
+    def test_factorize_different_pattern(self):
+        analysis = SparseCholeskyAnalysis(make_csr_from_matrix(self.arrow_matrix))
+        csr = make_csr_from_matrix(self.sys_matrix)
+
+        self.assertFalse(analysis.matches(csr))
+        self.assertRaises(ValueError, lambda: analysis.factorize(csr))
+
+    def test_not_positive_definite(self):
+        csr = make_csr_from_matrix(Matrix(2, 2).set_data([1, 2, 2, 1]))
+        self.assertRaises(
+            NonPositivePivotError, lambda: sparse_cholesky_solve(csr, Vector(2))
+        )
+
+    def test_wrong_ordering(self):
+        csr = make_csr_from_matrix(self.sys_matrix)
+        self.assertRaises(ValueError, lambda: SparseCholeskyAnalysis(csr, [0, 0, 1, 2]))
+
+
+class EliminationTreeTest(unittest.TestCase):
+    def test_arrow_matrix(self):
+        adjacency = [[0, 3], [1, 3], [2, 3], [0, 1, 2, 3]]
+        self.assertEqual([3, 3, 3, -1], elimination_tree(adjacency))
+
+    def test_fill_links_columns(self):
+        # The fill in (2, 1) makes 2 the parent of 1
+        adjacency = [[0, 1, 2], [0, 1], [0, 2]]
+        self.assertEqual([1, 2, -1], elimination_tree(adjacency))
@@ -0,0 +1,123 @@
+import unittest
+
+from eqs import Vector
+from eqs.matrix import Matrix
+from eqs.sparse_matrix import CooMatrix, CsrMatrix, make_csr_from_matrix
+
+
+class CooMatrixTest(unittest.TestCase):
+    def test_unset_value_is_zero(self):
+        matrix = CooMatrix(2, 2)
+        self.assertEqual(0.0, matrix.value_at(0, 1))
+
+    def test_add_to_value_sums_repeated_positions(self):
+        matrix = CooMatrix(2, 2).add_to_value(2, 0, 1).add_to_value(3, 0, 1)
+
+        self.assertEqual(2, matrix.triplets_count)
+        self.assertEqual(5, matrix.value_at(0, 1))
+
+    def test_set_value_discards_previous_triplets(self):
+        matrix = CooMatrix(2, 2).add_to_value(2, 0, 1).set_value(7, 0, 1)
+        self.assertEqual(7, matrix.value_at(0, 1))
+
+    def test_add_out_of_bounds(self):
+        self.assertRaises(IndexError, lambda: CooMatrix(2, 2).add_to_value(1, 2, 0))
+
+    def test_add_to_values(self):
+        matrix = CooMatrix(2, 2).add_to_values([2, 3, 4], [0, 0, 1], [1, 1, 0])
+
+        self.assertEqual(3, matrix.triplets_count)
+        self.assertEqual(5, matrix.value_at(0, 1))
+        self.assertEqual(4, matrix.value_at(1, 0))
+
+    def test_add_to_values_out_of_bounds(self):
+        self.assertRaises(
+            IndexError, lambda: CooMatrix(2, 2).add_to_values([1, 2], [0, 1], [0, 2])
+        )
+
+    def test_add_to_values_size_mismatch(self):
+        self.assertRaises(
+            ValueError, lambda: CooMatrix(2, 2).add_to_values([1, 2], [0, 1], [0])
+        )
+
+    def test_set_identity_row_and_col(self):
+        expected = Matrix(2, 2).set_data([1, 0, 0, 5])
+        matrix = (
+            CooMatrix(2, 2)
+            .add_to_value(2, 0, 0)
+            .add_to_value(3, 0, 1)
+            .add_to_value(4, 1, 0)
+            .add_to_value(5, 1, 1)
+            .set_identity_row(0)
+            .set_identity_col(0)
+        )
+
+        self.assertEqual(expected, matrix.to_matrix())
+
+    def test_set_identity(self):
+        expected = Matrix(3, 3).set_data([1, 0, 0, 0, 12, 0, 0, 0, 1])
+        matrix = (
+            CooMatrix(3, 3)
+            .add_to_values([2, 3, 4, 5, 6], [0, 0, 1, 1, 2], [0, 1, 0, 1, 1])
+            .add_to_value(7, 1, 1)
+            .set_identity([2, 0, 2])
+        )
+
+        self.assertEqual(expected, matrix.to_matrix())
+        self.assertEqual(4, matrix.triplets_count)
+
+    def test_set_identity_out_of_bounds(self):
+        self.assertRaises(IndexError, lambda: CooMatrix(2, 2).set_identity([0, 2]))
+
+    def test_to_csr(self):
+        csr = (
+            CooMatrix(2, 3)
+            .add_to_value(6, 1, 2)
+            .add_to_value(1, 0, 1)
+            .add_to_value(4, 1, 0)
+            .add_to_value(1, 0, 1)
+            .to_csr()
+        )
+
+        self.assertEqual([0, 1, 3], csr.row_ptr)
+        self.assertEqual([1, 0, 2], csr.col_indices)
+        self.assertEqual([2, 4, 6], csr.values)
+
+
+class CsrMatrixTest(unittest.TestCase):
+    dense = Matrix(3, 3).set_data([4, -1, 0, -1, 4, -1, 0, -1, 4])
+
+    def test_from_matrix_stores_non_zeros(self):
+        csr = make_csr_from_matrix(self.dense)
+        self.assertEqual(7, csr.non_zeros_count)
+
+    def test_value_at(self):
+        csr = make_csr_from_matrix(self.dense)
+
+        self.assertEqual(-1, csr.value_at(1, 2))
+        self.assertEqual(0.0, csr.value_at(0, 2))
+
+    def test_value_transposed_at(self):
+        csr = CsrMatrix(2, 2, [0, 1, 2], [1, 0], [3, 5])
+        self.assertEqual(5, csr.value_transposed_at(0, 1))
+
+    def test_wrong_row_pointers(self):
+        self.assertRaises(ValueError, lambda: CsrMatrix(2, 2, [0, 1], [0], [1]))
+
+    def test_multiply_vector(self):
+        vector = Vector(3).set_data([1, 2, 3])
+        expected = self.dense.times_vector(vector)
+
+        self.assertEqual(
+            expected, make_csr_from_matrix(self.dense).times_vector(vector)
+        )
+
+    def test_multiply_vector_into_output(self):
+        vector = Vector(3).set_data([1, 2, 3])
+        out = Vector(self.dense.rows_count).set_data([9] * self.dense.rows_count)
+        make_csr_from_matrix(self.dense).times_vector(vector, out=out)
+
+        self.assertEqual(self.dense.times_vector(vector), out)
+
+    def test_to_matrix(self):
+        self.assertEqual(self.dense, make_csr_from_matrix(self.dense).to_matrix())
@@ -0,0 +1,104 @@
+import unittest
+
+from eqs.cholesky import CholeskyFactorization, cholesky_solve
+from eqs.conjugate_gradient import conjugate_gradient_solve
+from eqs.matrix import Matrix
+from eqs.symmetric_matrix import SymmetricMatrix
+from eqs.vector import Vector
+
+
+class SymmetricMatrixTest(unittest.TestCase):
+    def test_stores_lower_triangle(self):
+        self.assertEqual(10, len(SymmetricMatrix(4).data))
+
+    def test_value_is_symmetric(self):
+        matrix = SymmetricMatrix(2).set_value(5, 1, 0)
+
+        self.assertEqual(5, matrix.value_at(1, 0))
+        self.assertEqual(5, matrix.value_at(0, 1))
+
+    def test_add_to_symmetric_positions(self):
+        matrix = SymmetricMatrix(2).add_to_value(2, 0, 1).add_to_value(3, 1, 0)
+        self.assertEqual(5, matrix.value_at(0, 1))
+
+    def test_row_values(self):
+        matrix = make_symmetric([1, 2, 3, 4, 5, 6])
+
+        self.assertEqual([2, 3, 5], list(matrix.row_values(1)))
+        self.assertEqual([2], list(matrix.row_values(1, 0, 1)))
+        self.assertEqual([5], list(matrix.row_values(1, 2)))
+
+    def test_out_of_bounds(self):
+        self.assertRaises(IndexError, lambda: SymmetricMatrix(2).value_at(2, 0))
+
+    def test_set_identity_row(self):
+        matrix = make_symmetric([4, 1, 5, 2, 6, 7])
+        matrix.set_identity_row(1)
+
+        self.assertEqual(1, matrix.value_at(1, 1))
+        self.assertEqual(0, matrix.value_at(1, 0))
+        self.assertEqual(0, matrix.value_at(1, 2))
+        self.assertEqual(0, matrix.value_at(2, 1))
+        self.assertEqual(2, matrix.value_at(2, 0))
+
+    def test_times_vector(self):
+        matrix = make_symmetric([4, 1, 5, 2, 6, 7])
+        vector = Vector(3).set_data([1, 2, 3])
+        expected = Vector(3).set_data([12, 29, 35])
+
+        self.assertEqual(expected, matrix.times_vector(vector))
+
+    def test_times_vector_into_output(self):
+        matrix = make_symmetric([4, 1, 5, 2, 6, 7])
+        vector = Vector(3).set_data([1, 2, 3])
+        out = Vector(3).set_data([1, 1, 1])
+        matrix.times_vector(vector, out=out)
+
+        self.assertEqual(Vector(3).set_data([12, 29, 35]), out)
+
+    def test_to_matrix(self):
+        expected = Matrix(2, 2).set_data([4, 1, 1, 5])
+        self.assertEqual(expected, make_symmetric([4, 1, 5]).to_matrix())
+
+
+class SymmetricMatrixSolveTest(unittest.TestCase):
+    sys_matrix = Matrix(4, 4).set_data(
+        [4, -2, 4, 2, -2, 10, -2, -7, 4, -2, 8, 4, 2, -7, 4, 7]
+    )
+    sys_vec = Vector(4).set_data([20, -16, 40, 28])
+    solution = Vector(4).set_data([1.0, 2.0, 3.0, 4.0])
+
+    def setUp(self):
+        self.symmetric = SymmetricMatrix(4)
+        for i in range(4):
+            for j in range(i + 1):
+                self.symmetric.set_value(self.sys_matrix.value_at(i, j), i, j)
+
+    def test_cholesky_solve(self):
+        actual = cholesky_solve(self.symmetric, self.sys_vec)
+
+        self.assertEqual(self.solution, actual)
+        self.assertEqual(4, self.symmetric.value_at(0, 0))
+
+    def test_factorization_in_place(self):
+        factorization = CholeskyFactorization(self.symmetric, overwrite=True)
+        actual = factorization.solve_many([self.sys_vec, self.sys_vec.scaled(2)])
+
+        self.assertEqual([self.solution, self.solution.scaled(2)], actual)
+        self.assertEqual(2, self.symmetric.value_at(0, 0))
+
+    def test_conjugate_gradient_solve(self):
+        actual = conjugate_gradient_solve(self.symmetric, self.sys_vec)
+        self.assertEqual(self.solution, actual)
+
+
+def make_symmetric(lower_values):
+    size = 0
+    while SymmetricMatrix.row_start(size) < len(lower_values):
+        size += 1
+
+    matrix = SymmetricMatrix(size)
+    for index, value in enumerate(lower_values):
+        matrix.data[index] = value
+
+    return matrix
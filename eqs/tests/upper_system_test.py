@@ -1,7 +1,12 @@
 import unittest
 
 from eqs.matrix import Matrix
-from eqs.upper_system import solve_upper_sys
+from eqs.upper_system import (
+    solve_transposed_upper_sys,
+    solve_transposed_upper_sys_many,
+    solve_upper_sys,
+    solve_upper_sys_many,
+)
 from eqs.vector import Vector
 
 
@@ -32,3 +37,32 @@ class UpperSystemResolutionTest(unittest.TestCase):
     def test_upper_system_resolution(self):
         actual = solve_upper_sys(self.upper_matrix, self.sys_vec)
         self.assertEqual(self.expected_solution, actual)
+
+    def test_many_systems_resolution(self):
+        vectors = [self.sys_vec, self.sys_vec.scaled(2), self.sys_vec.scaled(-1)]
+        expected = [
+            self.expected_solution,
+            self.expected_solution.scaled(2),
+            self.expected_solution.scaled(-1),
+        ]
+
+        self.assertEqual(expected, solve_upper_sys_many(self.upper_matrix, vectors))
+
+    def test_many_systems_size_mismatch(self):
+        self.assertRaises(
+            ValueError, lambda: solve_upper_sys_many(self.upper_matrix, [Vector(3)])
+        )
+
+    def test_transposed_system_resolution(self):
+        lower_matrix = self.upper_matrix.transposed()
+        actual = solve_transposed_upper_sys(lower_matrix, self.sys_vec)
+        self.assertEqual(self.expected_solution, actual)
+
+    def test_transposed_many_systems_resolution(self):
+        lower_matrix = self.upper_matrix.transposed()
+        vectors = [self.sys_vec, self.sys_vec.scaled(2)]
+        expected = [self.expected_solution, self.expected_solution.scaled(2)]
+
+        self.assertEqual(
+            expected, solve_transposed_upper_sys_many(lower_matrix, vectors)
+        )
@@ -27,6 +27,17 @@ class VectorTest(unittest.TestCase):
         self.assertEqual(11, vector.value_at(0))
         self.assertEqual(2, vector.value_at(1))
 
+    def test_flat_data(self):
+        vector = Vector(3).set_data([1, 2, 3])
+        self.assertEqual([1, 2, 3], list(vector.data))
+
+    def test_copy_does_not_share_data(self):
+        vector = Vector(2).set_data([1, 2])
+        copy = vector.copy().set_value(5, 0)
+
+        self.assertEqual(1, vector.value_at(0))
+        self.assertEqual(5, copy.value_at(0))
+
     def test_scaled(self):
         vector = Vector(3).set_data([1, 2, 3])
         expected = Vector(3).set_data([2, 4, 6])
@@ -53,3 +64,36 @@ class VectorTest(unittest.TestCase):
         expected = Vector(2).set_data([8, 15])
 
         self.assertEqual(expected, v1 * v2)
+
+    def test_dot(self):
+        v1 = Vector(2).set_data([4, 5])
+        v2 = Vector(2).set_data([2, 3])
+
+        self.assertEqual(23, v1.dot(v2))
+
+    def test_norm(self):
+        self.assertEqual(5, Vector(2).set_data([3, 4]).norm)
+
+    def test_scale(self):
+        vector = Vector(2).set_data([4, 5])
+        expected = Vector(2).set_data([8, 10])
+
+        self.assertIs(vector, vector.scale(2))
+        self.assertEqual(expected, vector)
+
+    def test_axpy(self):
+        vector = Vector(2).set_data([4, 5])
+        expected = Vector(2).set_data([8, 11])
+
+        self.assertIs(vector, vector.axpy(2, Vector(2).set_data([2, 3])))
+        self.assertEqual(expected, vector)
+
+    def test_scale_and_add(self):
+        vector = Vector(2).set_data([4, 5])
+        expected = Vector(2).set_data([10, 13])
+
+        vector.scale_and_add(2, Vector(2).set_data([2, 3]))
+        self.assertEqual(expected, vector)
+
+    def test_in_place_length_mismatch(self):
+        self.assertRaises(ValueError, lambda: Vector(2).axpy(1, Vector(3)))
@@ -1,3 +1,7 @@
+from typing import List
+
+from eqs.backend import numpy_kernels
+from eqs.blocked import dot
 from eqs.matrix import Matrix
 from eqs.vector import Vector
 
@@ -12,21 +16,108 @@ def solve_upper_sys(up_matrix: Matrix, vector: Vector) -> Vector:
     :param vector: system's `Vector` [b]
     :return: solution vector [x]
     """
-    size = vector.length
-    last_index = size - 1
-    solution = Vector(size)
+    kernels = numpy_kernels()
+    if kernels and isinstance(up_matrix, Matrix):
+        return kernels.solve_upper_sys(up_matrix, vector)
+
+    (solution,) = solve_upper_sys_many(up_matrix, [vector])
+    return solution
+
+
+def solve_upper_sys_many(up_matrix: Matrix, vectors: List[Vector]) -> List[Vector]:
+    """
+    Given an upper triangular matrix `up_matrix` [U] and a list of
+    vectors `vectors` [b1, b2, ...], computes the solution of every
+    [U][x] = [b] system by backward substitution.
+
+    All the systems are solved in a single sweep of the matrix, so
+    each value of [U] is read once for the whole block of vectors
+    instead of once per vector.
+
+    :param up_matrix: upper triangular `Matrix` [U]
+    :param vectors: systems' `Vector`s [b1, b2, ...]
+    :return: solution `Vector`s [x1, x2, ...]
+    """
+    size = up_matrix.rows_count
+    for vector in vectors:
+        if vector.length != size:
+            raise ValueError("Size mismatch between matrix and vector")
+
+    kernels = numpy_kernels()
+    if kernels and isinstance(up_matrix, Matrix):
+        return kernels.solve_upper_sys_many(up_matrix, vectors)
+
+    solutions = [vector.data.tolist() for vector in vectors]
+
+    for i in range(size - 1, -1, -1):
+        # the row is copied into a list once for all the vectors
+        u_row = up_matrix.row_values(i, i, size).tolist()
+        u_ii = u_row[0]
+        del u_row[0]
+
+        for solution in solutions:
+            solution[i] = (solution[i] - dot(u_row, solution[i + 1 :])) / u_ii
+
+    return [Vector(size).set_data(solution) for solution in solutions]
 
-    for i in range(last_index, -1, -1):
-        _sum = 0.0
 
-        for j in range(i + 1, size):
-            u_ij = up_matrix.value_at(i, j)
-            x_j = solution.value_at(j)
-            _sum += u_ij * x_j
+def solve_transposed_upper_sys(low_mat: Matrix, vector: Vector) -> Vector:
+    """
+    Given a lower triangular matrix `low_mat` [L] and a vector
+    `vector` [b], computes the [L]'[x] = [b] system solution, [x],
+    by backward substitution.
+
+    The values of the upper triangular matrix [L]' are read from
+    [L] using `value_transposed_at`, so the transpose is never
+    created.
 
-        y_i = vector.value_at(i)
-        u_ii = up_matrix.value_at(i, i)
-        solution_val = (y_i - _sum) / u_ii
-        solution.set_value(solution_val, i)
+    :param low_mat: lower triangular `Matrix` [L]
+    :param vector: system's `Vector` [b]
+    :return: solution vector [x]
+    """
+    kernels = numpy_kernels()
+    if kernels and isinstance(low_mat, Matrix):
+        return kernels.solve_transposed_upper_sys(low_mat, vector)
 
+    (solution,) = solve_transposed_upper_sys_many(low_mat, [vector])
     return solution
+
+
+def solve_transposed_upper_sys_many(
+    low_mat: Matrix, vectors: List[Vector]
+) -> List[Vector]:
+    """
+    Given a lower triangular matrix `low_mat` [L] and a list of
+    vectors `vectors` [b1, b2, ...], computes the solution of every
+    [L]'[x] = [b] system by backward substitution, reading [L]'
+    from [L] and sweeping it once for the whole block of vectors.
+
+    :param low_mat: lower triangular `Matrix` [L]
+    :param vectors: systems' `Vector`s [b1, b2, ...]
+    :return: solution `Vector`s [x1, x2, ...]
+    """
+    size = low_mat.rows_count
+    for vector in vectors:
+        if vector.length != size:
+            raise ValueError("Size mismatch between matrix and vector")
+
+    kernels = numpy_kernels()
+    if kernels and isinstance(low_mat, Matrix):
+        return kernels.solve_transposed_upper_sys_many(low_mat, vectors)
+
+    solutions = [vector.data.tolist() for vector in vectors]
+
+    # the row i of [L] is the column i of [L]': once x_i is known,
+    # it's substituted into the equations above, sweeping [L] by rows
+    for i in range(size - 1, -1, -1):
+        l_row = low_mat.row_values(i, 0, i + 1).tolist()
+        l_ii = l_row.pop()
+
+        for solution in solutions:
+            x_i = solution[i] / l_ii
+            solution[i] = x_i
+            solution[:i] = [
+                b_j - l_ij * x_i for b_j, l_ij in zip(solution[:i], l_row, strict=True)
+            ]
+
+    return [Vector(size).set_data(solution) for solution in solutions]
@@ -1,21 +1,56 @@
+import math
 import operator
+from array import array
 from functools import reduce
 from typing import List
 
+from eqs.buffers import doubles_view
 from geom2d import are_close_enough
-from utils.lists import list_of_zeros
 
 
 class Vector:
     """
     A Vector is a unidimensional array of numbers.
 
+    The values are stored in a contiguous array of doubles.
+
     Upon initialization, the vector is filled with zeroes.
     """
 
+    __slots__ = ("__length", "__data")
+
     def __init__(self, length: int):
         self.__length = length
-        self.__data = list_of_zeros(length)
+        self.__data = array("d", [0.0]) * length
+
+    @staticmethod
+    def from_buffer(buffer):
+        """
+        Creates a vector whose values are stored in the given
+        `buffer`, any object supporting the buffer protocol that
+        holds doubles or raw bytes, without copying them: modifying
+        the vector modifies the buffer, and vice versa.
+
+        :param buffer: object supporting the buffer protocol
+        :return: `Vector`
+        """
+        data = doubles_view(buffer)
+        vector = Vector(0)
+        vector.__length = len(data)
+        vector.__data = data
+        return vector
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Exposes the vector's storage through the buffer protocol, as
+        a one-dimensional buffer of doubles (format 'd'), so that
+        `memoryview(vector)` or `numpy.asarray(vector)` don't copy
+        the values.
+
+        :param flags: `int` buffer request flags
+        :return: `memoryview`
+        """
+        return memoryview(self.__data)
 
     @property
     def length(self):
@@ -35,6 +70,30 @@ class Vector:
         """
         return reduce(operator.add, self.__data)
 
+    @property
+    def norm(self):
+        """
+        Euclidean norm of the vector: the square root of the sum of
+        its squared values.
+
+        :return: `float`
+        """
+        return math.sqrt(self.dot(self))
+
+    @property
+    def data(self):
+        """
+        The contiguous array of doubles where the values are stored,
+        or the `memoryview` of the buffer the vector was created
+        from.
+
+        This array is meant for hot loops that want to avoid a
+        method call per value; modifying it modifies the vector.
+
+        :return: `array` or `memoryview` of doubles
+        """
+        return self.__data
+
     def set_value(self, value: float, index: int):
         """
         Sets the given `value` in the vector at the position
@@ -80,9 +139,7 @@ class Vector:
         if len(data) != self.__length:
             raise ValueError("Cannot set data: length mismatch")
 
-        for i in range(self.__length):
-            self.__data[i] = data[i]
-
+        self.__data[:] = array("d", data)
         return self
 
     def value_at(self, index: int):
@@ -108,6 +165,74 @@ class Vector:
 
         return result
 
+    def scale(self, factor: float):
+        """
+        Scales every value of this vector by the given factor, in
+        place.
+
+        :param factor: `float`
+        :return: this vector
+        """
+        data = self.__data
+        for i in range(self.__length):
+            data[i] *= factor
+
+        return self
+
+    def dot(self, other):
+        """
+        Computes the dot product of this and `other` vector: the sum
+        of the products of their values one by one.
+
+        Unlike `(self * other).sum`, no intermediate vector is
+        created.
+
+        :param other: `Vector`
+        :return: `float`
+        """
+        if other.__length != self.__length:
+            raise ValueError("Cannot compute dot product: length mismatch")
+
+        return sum(map(operator.mul, self.__data, other.__data))
+
+    def axpy(self, factor: float, other):
+        """
+        Adds `other` vector, scaled by `factor`, to this one in
+        place: this = this + factor * other.
+
+        :param factor: `float`
+        :param other: `Vector`
+        :return: this vector
+        """
+        if other.__length != self.__length:
+            raise ValueError("Cannot add: length mismatch")
+
+        data = self.__data
+        other_data = other.__data
+        for i in range(self.__length):
+            data[i] += factor * other_data[i]
+
+        return self
+
+    def scale_and_add(self, factor: float, other):
+        """
+        Scales this vector by `factor` and adds `other` vector to it
+        in place: this = factor * this + other.
+
+        :param factor: `float`
+        :param other: `Vector`
+        :return: this vector
+        """
+        if other.__length != self.__length:
+            raise ValueError("Cannot add: length mismatch")
+
+        data = self.__data
+        other_data = other.__data
+        for i in range(self.__length):
+            data[i] = factor * data[i] + other_data[i]
+
+        return self
+
     def __sub__(self, other):
         """
         Creates a new vector result of subtracting `other` vector
@@ -165,7 +290,9 @@ class Vector:
 
         :return: new `Vector`
         """
-        return Vector(self.__length).set_data(self.__data.copy())
+        vector = Vector(self.__length)
+        memoryview(vector.__data)[:] = self.__data
+        return vector
 
     def __eq__(self, other):
         """
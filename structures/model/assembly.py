@@ -0,0 +1,287 @@
+import math
+from array import array
+from itertools import chain
+from typing import Dict, List, Tuple, Union
+
+from eqs import CooMatrix, SymmetricMatrix, Vector
+from eqs.skyline import SkylineMatrix
+from structures.model.bar import StrBar
+from structures.model.columnar import StructureColumns
+
+
+class BarStiffnessTerms:
+    """
+    The terms of the global stiffness matrices of a group of bars,
+    computed for all of them at once, without creating any geometry
+    or matrix per bar.
+
+    The global stiffness matrix of a bar with axial stiffness EA/L
+    and direction cosines (c, s) only has three distinct terms,
+    c²·EA/L, s²·EA/L and sc·EA/L:
+
+        |  c²  sc -c² -sc |
+        |  sc  s² -sc -s² |
+        | -c² -sc  c²  sc | · EA/L
+        | -sc -s²  sc  s² |
+
+    They are computed straight from the coordinates of the bars'
+    nodes: with the projections (dx, dy) of the bar, c² EA/L is
+    dx² EA/L³, so each bar only takes one square root.
+
+    The terms are kept in flat arrays, in the order of the bars,
+    along with the degrees of freedom of the bars' nodes, and added
+    to the system matrix directly, in its storage. They're computed
+    from the arrays of a `StructureColumns` model, or from bar
+    objects using `from_bars`.
+    """
+
+    def __init__(self, columns: StructureColumns, node_dofs: array):
+        """
+        Computes the terms of the bars of a `StructureColumns`
+        model, reading its arrays, without creating any node or bar
+        object.
+
+        The degrees of freedom of the node at index `i` are the
+        values at the `2i` and `2i + 1` positions of `node_dofs`.
+
+        :param columns: `StructureColumns`
+        :param node_dofs: `array` with two degrees of freedom per node
+        """
+        (xs, ys) = (columns.xs, columns.ys)
+        (starts, ends) = (columns.starts, columns.ends)
+        bars_count = columns.bars_count
+
+        self.__dofs = array(
+            "q",
+            chain.from_iterable(
+                (
+                    node_dofs[2 * start],
+                    node_dofs[2 * start + 1],
+                    node_dofs[2 * end],
+                    node_dofs[2 * end + 1],
+                )
+                for start, end in zip(starts, ends, strict=True)
+            ),
+        )
+        self.__c2_eal = array("d", [0.0]) * bars_count
+        self.__s2_eal = array("d", [0.0]) * bars_count
+        self.__sc_eal = array("d", [0.0]) * bars_count
+
+        for i, (start, end, section, young_mod) in enumerate(
+            zip(starts, ends, columns.cross_sections, columns.young_mods, strict=True)
+        ):
+            (dx, dy) = (xs[end] - xs[start], ys[end] - ys[start])
+            length_sq = dx * dx + dy * dy
+            ea_l3 = young_mod * section / (length_sq * math.sqrt(length_sq))
+
+            self.__c2_eal[i] = dx * dx * ea_l3
+            self.__s2_eal[i] = dy * dy * ea_l3
+            self.__sc_eal[i] = dx * dy * ea_l3
+
+    @staticmethod
+    def from_bars(bars: List[StrBar], dofs_dict: Dict[int, Tuple[int, int]]):
+        """
+        Computes the terms of the given bar objects, whose nodes'
+        degrees of freedom are given by node id.
+
+        :param bars: `List[StrBar]`
+        :param dofs_dict: degrees of freedom of the nodes, by id
+        :return: `BarStiffnessTerms`
+        """
+        nodes = {
+            node.id: node for bar in bars for node in (bar.start_node, bar.end_node)
+        }
+        node_dofs = array(
+            "q", chain.from_iterable(dofs_dict[node_id] for node_id in nodes)
+        )
+        columns = StructureColumns.from_objects(list(nodes.values()), bars)
+
+        return BarStiffnessTerms(columns, node_dofs)
+
+    @property
+    def bars_count(self):
+        """
+        Number of bars whose terms are stored.
+
+        :return: `int`
+        """
+        return len(self.__c2_eal)
+
+    @property
+    def dofs(self):
+        """
+        The degrees of freedom of every bar, four per bar: the ones
+        of its start node, in x and y, followed by the ones of its
+        end node. The ones of the bar `i` are in the positions from
+        `4i` to `4i + 3`.
+
+        :return: `array` of integers
+        """
+        return self.__dofs
+
+    @property
+    def c2_eal(self):
+        """
+        The c²·EA/L term of every bar.
+
+        :return: `array` of doubles
+        """
+        return self.__c2_eal
+
+    @property
+    def s2_eal(self):
+        """
+        The s²·EA/L term of every bar.
+
+        :return: `array` of doubles
+        """
+        return self.__s2_eal
+
+    @property
+    def sc_eal(self):
+        """
+        The sc·EA/L term of every bar.
+
+        :return: `array` of doubles
+        """
+        return self.__sc_eal
+
+    def per_bar(self):
+        """
+        Iterates over the bars, yielding the degrees of freedom of
+        each bar, as a tuple, followed by its c²·EA/L, s²·EA/L and
+        sc·EA/L terms.
+
+        :return: iterator of `(Tuple[int, int, int, int], float, float, float)`
+        """
+        dofs = self.__dofs
+        return zip(
+            zip(dofs[0::4], dofs[1::4], dofs[2::4], dofs[3::4], strict=True),
+            self.__c2_eal,
+            self.__s2_eal,
+            self.__sc_eal,
+            strict=True,
+        )
+
+    def times_vector(self, v: Vector) -> Vector:
+        """
+        Computes the product of the stiffness matrix of the bars,
+        without any external constraint, times the vector `v`, bar
+        by bar, without assembling the matrix.
+
+        For a displacements vector [u], [K][u] are the forces that
+        the nodes need to be applied to stay in their displaced
+        position; at the constrained degrees of freedom, they are
+        the external loads plus the reactions.
+
+        :param v: `Vector`, with a value per degree of freedom
+        :return: `Vector`
+        """
+        result = Vector(v.length)
+        (v_data, result_data) = (v.data, result.data)
+
+        for (sx, sy, ex, ey), c2, s2, sc in self.per_bar():
+            (du, dv) = (v_data[ex] - v_data[sx], v_data[ey] - v_data[sy])
+            (force_x, force_y) = (c2 * du + sc * dv, sc * du + s2 * dv)
+            result_data[sx] -= force_x
+            result_data[sy] -= force_y
+            result_data[ex] += force_x
+            result_data[ey] += force_y
+
+        return result
+
+    def add_to_symmetric(self, matrix: Union[SymmetricMatrix, SkylineMatrix]):
+        """
+        Adds the stiffness matrices of the bars to the given
+        symmetric `matrix`, writing to its lower triangle storage:
+        the ten values of each bar's lower triangle are added at the
+        `row_start(row) + col` index of the matrix' `data`.
+
+        Degrees of freedom beyond the size of the matrix are the
+        ones left out of the system, and their rows and columns are
+        skipped.
+
+        A skyline matrix's profile must include the positions of
+        every bar, which is the case when its first columns are
+        computed from the bars' degrees of freedom.
+
+        :param matrix: `SymmetricMatrix` or `SkylineMatrix`
+        :return: `matrix`
+        """
+        size = matrix.rows_count
+        data = matrix.data
+        row_starts = [matrix.row_start(row) for row in range(size)]
+
+        def index_of(row: int, col: int):
+            return row_starts[row] + col if col <= row else row_starts[col] + row
+
+        for dofs, c2, s2, sc in self.per_bar():
+            if max(dofs) >= size:
+                triplets = self.__triplets(dofs, c2, s2, sc)
+                for row, col, amount in zip(*triplets, strict=True):
+                    if col <= row < size:
+                        data[row_starts[row] + col] += amount
+                continue
+
+            (sx, sy, ex, ey) = dofs
+            data[row_starts[sx] + sx] += c2
+            data[row_starts[sy] + sy] += s2
+            data[row_starts[ex] + ex] += c2
+            data[row_starts[ey] + ey] += s2
+            data[index_of(sx, sy)] += sc
+            data[index_of(sx, ex)] -= c2
+            data[index_of(sx, ey)] -= sc
+            data[index_of(sy, ex)] -= sc
+            data[index_of(sy, ey)] -= s2
+            data[index_of(ex, ey)] += sc
+
+        return matrix
+
+    def add_to_sparse(self, matrix: CooMatrix, first_row=0):
+        """
+        Adds the stiffness matrices of the bars to the given sparse
+        `matrix`, as a single batch of triplets.
+
+        The matrix can be a block of the whole stiffness matrix: its
+        rows are the degrees of freedom from `first_row` on, and its
+        columns the first ones. The values outside the block are
+        skipped, so a matrix starting at row zero, whose size is the
+        number of free degrees of freedom, gets the free block, and
+        one starting at that row, the block coupling the constrained
+        degrees of freedom, numbered after the free ones, with the
+        free ones.
+
+        :param matrix: `CooMatrix`
+        :param first_row: `int` degree of freedom of the first row
+        :return: `matrix`
+        """
+        (rows_end, cols_end) = (first_row + matrix.rows_count, matrix.cols_count)
+        whole_bar_end = min(rows_end, cols_end) if first_row == 0 else 0
+        (rows, cols, amounts) = ([], [], [])
+
+        for dofs, c2, s2, sc in self.per_bar():
+            triplets = self.__triplets(dofs, c2, s2, sc)
+
+            if max(dofs) < whole_bar_end:
+                (bar_rows, bar_cols, bar_amounts) = triplets
+                rows.extend(bar_rows)
+                cols.extend(bar_cols)
+                amounts.extend(bar_amounts)
+                continue
+
+            for row, col, amount in zip(*triplets, strict=True):
+                if first_row <= row < rows_end and col < cols_end:
+                    rows.append(row - first_row)
+                    cols.append(col)
+                    amounts.append(amount)
+
+        return matrix.add_to_values(amounts, rows, cols)
+
+    @staticmethod
+    def __triplets(dofs, c2: float, s2: float, sc: float):
+        (sx, sy, ex, ey) = dofs
+        return (
+            (sx, sx, sx, sx, sy, sy, sy, sy, ex, ex, ex, ex, ey, ey, ey, ey),
+            dofs * 4,
+            (c2, sc, -c2, -sc, sc, s2, -sc, -s2, -c2, -sc, c2, sc, -sc, -s2, sc, s2),
+        )
@@ -50,8 +50,9 @@ class StrBar:
 
         :return: global stiffness `Matrix`
         """
-        direction = self.geometry.direction_vector
-        eal = self.young_mod * self.cross_section / self.length
+        geometry = self.geometry
+        direction = geometry.direction_vector
+        eal = self.young_mod * self.cross_section / geometry.length
         c = direction.cosine
         s = direction.sine
 
@@ -0,0 +1,483 @@
+from array import array
+from typing import Dict, List, Tuple
+
+from geom2d import Point, Vector
+from structures.model.bar import StrBar
+from structures.model.node import StrNode
+
+
+class StructureColumns:
+    """
+    A truss structure model stored by columns: instead of an object
+    per node and bar, every property of the nodes and bars is kept
+    in its own flat array, with a value per node or bar, in the
+    order they were added.
+
+    - nodes: `node_ids`, `xs`, `ys` and `constraints`, a bit mask
+      with `CONSTRAINED_X` and `CONSTRAINED_Y`,
+    - loads: `load_nodes`, the index of the loaded node, and the
+      load components, `load_us` and `load_vs`,
+    - bars: `bar_ids`, `starts` and `ends`, the indices of their
+      nodes, `cross_sections` and `young_mods`.
+
+    A node takes 25 bytes and a bar 40, so models with millions of
+    bars fit in memory, and a `Structure` created with
+    `Structure.from_columns` assembles and solves its system
+    reading these arrays directly.
+
+    `StrNode` and `StrBar` objects are only created on demand, by
+    `node_at`, `bar_at` and `to_objects`, as snapshots of the
+    columns: modifying them doesn't modify the model.
+    """
+
+    CONSTRAINED_X = 1
+    CONSTRAINED_Y = 2
+
+    def __init__(self):
+        self.__node_ids = array("q")
+        self.__xs = array("d")
+        self.__ys = array("d")
+        self.__constraints = bytearray()
+
+        self.__load_nodes = array("q")
+        self.__load_us = array("d")
+        self.__load_vs = array("d")
+
+        self.__bar_ids = array("q")
+        self.__starts = array("q")
+        self.__ends = array("q")
+        self.__cross_sections = array("d")
+        self.__young_mods = array("d")
+
+        self.__node_indices: Dict[int, int] = None
+        self.__loads_by_node: Dict[int, List[int]] = None
+
+    @staticmethod
+    def from_objects(nodes: List[StrNode], bars: List[StrBar]):
+        """
+        Creates the columns of a model defined by node and bar
+        objects, like the ones a `Structure` is created with.
+
+        :param nodes: `List[StrNode]`
+        :param bars: `List[StrBar]`
+        :return: `StructureColumns`
+        """
+        columns = StructureColumns()
+
+        for node in nodes:
+            index = columns.add_node(
+                node.id,
+                node.position.x,
+                node.position.y,
+                node.dx_constrained,
+                node.dy_constrained,
+            )
+            for load in node.loads:
+                columns.add_load(index, load.u, load.v)
+
+        for bar in bars:
+            columns.add_bar(
+                bar.id,
+                columns.index_of(bar.start_node.id),
+                columns.index_of(bar.end_node.id),
+                bar.cross_section,
+                bar.young_mod,
+            )
+
+        return columns
+
+    @property
+    def nodes_count(self):
+        """
+        Number of nodes in the model.
+
+        :return: `int`
+        """
+        return len(self.__node_ids)
+
+    @property
+    def bars_count(self):
+        """
+        Number of bars in the model.
+
+        :return: `int`
+        """
+        return len(self.__bar_ids)
+
+    @property
+    def loads_count(self):
+        """
+        Number of external loads applied on the nodes.
+
+        :return: `int`
+        """
+        return len(self.__load_nodes)
+
+    @property
+    def node_ids(self):
+        """
+        The id of every node.
+
+        :return: `array` of integers
+        """
+        return self.__node_ids
+
+    @property
+    def xs(self):
+        """
+        The x coordinate of every node.
+
+        :return: `array` of doubles
+        """
+        return self.__xs
+
+    @property
+    def ys(self):
+        """
+        The y coordinate of every node.
+
+        :return: `array` of doubles
+        """
+        return self.__ys
+
+    @property
+    def constraints(self):
+        """
+        The external constraints of every node, as a combination of
+        the `CONSTRAINED_X` and `CONSTRAINED_Y` bits.
+
+        :return: `bytearray`
+        """
+        return self.__constraints
+
+    @property
+    def load_nodes(self):
+        """
+        The index of the node every load is applied on.
+
+        :return: `array` of integers
+        """
+        return self.__load_nodes
+
+    @property
+    def load_us(self):
+        """
+        The x component of every load.
+
+        :return: `array` of doubles
+        """
+        return self.__load_us
+
+    @property
+    def load_vs(self):
+        """
+        The y component of every load.
+
+        :return: `array` of doubles
+        """
+        return self.__load_vs
+
+    @property
+    def bar_ids(self):
+        """
+        The id of every bar.
+
+        :return: `array` of integers
+        """
+        return self.__bar_ids
+
+    @property
+    def starts(self):
+        """
+        The index of the start node of every bar.
+
+        :return: `array` of integers
+        """
+        return self.__starts
+
+    @property
+    def ends(self):
+        """
+        The index of the end node of every bar.
+
+        :return: `array` of integers
+        """
+        return self.__ends
+
+    @property
+    def cross_sections(self):
+        """
+        The cross section of every bar.
+
+        :return: `array` of doubles
+        """
+        return self.__cross_sections
+
+    @property
+    def young_mods(self):
+        """
+        The Young modulus of every bar.
+
+        :return: `array` of doubles
+        """
+        return self.__young_mods
+
+    def add_node(
+        self, _id: int, x: float, y: float, dx_constrained=False, dy_constrained=False
+    ):
+        """
+        Adds a node to the model.
+
+        :param _id: `int` node id
+        :param x: `float` x coordinate
+        :param y: `float` y coordinate
+        :param dx_constrained: whether the x displacement is constrained
+        :param dy_constrained: whether the y displacement is constrained
+        :return: `int` index of the node
+        """
+        if self.__node_indices is not None and _id in self.__node_indices:
+            raise ValueError(f"Repeated node id: {_id}")
+
+        index = len(self.__node_ids)
+        self.__node_ids.append(_id)
+        self.__xs.append(x)
+        self.__ys.append(y)
+        self.__constraints.append(
+            self.__constraints_mask(dx_constrained, dy_constrained)
+        )
+
+        if self.__node_indices is not None:
+            self.__node_indices[_id] = index
+
+        return index
+
+    def add_load(self, node_index: int, u: float, v: float):
+        """
+        Adds an external load on the node at `node_index`.
+
+        :param node_index: `int` index of the loaded node
+        :param u: `float` x component of the load
+        :param v: `float` y component of the load
+        :return: this model
+        """
+        self.__ensure_node_index(node_index)
+
+        self.__load_nodes.append(node_index)
+        self.__load_us.append(u)
+        self.__load_vs.append(v)
+        self.__loads_by_node = None
+        return self
+
+    def add_bar(
+        self,
+        _id: int,
+        start_index: int,
+        end_index: int,
+        cross_section: float,
+        young_mod: float,
+    ):
+        """
+        Adds a bar between the nodes at `start_index` and
+        `end_index`.
+
+        :param _id: `int` bar id
+        :param start_index: `int` index of the start node
+        :param end_index: `int` index of the end node
+        :param cross_section: `float` cross section area
+        :param young_mod: `float` Young modulus
+        :return: `int` index of the bar
+        """
+        self.__ensure_node_index(start_index)
+        self.__ensure_node_index(end_index)
+
+        self.__bar_ids.append(_id)
+        self.__starts.append(start_index)
+        self.__ends.append(end_index)
+        self.__cross_sections.append(cross_section)
+        self.__young_mods.append(young_mod)
+        return len(self.__bar_ids) - 1
+
+    def index_of(self, node_id: int):
+        """
+        Returns the index of the node with the given id.
+
+        The map from ids to indices is built the first time it's
+        needed.
+
+        :param node_id: `int` node id
+        :return: `int` node index
+        """
+        if self.__node_indices is None:
+            self.__node_indices = {
+                _id: index for index, _id in enumerate(self.__node_ids)
+            }
+            if len(self.__node_indices) != len(self.__node_ids):
+                self.__node_indices = None
+                raise ValueError("The node ids are repeated")
+
+        if node_id not in self.__node_indices:
+            raise ValueError(f"Unknown node {node_id}")
+
+        return self.__node_indices[node_id]
+
+    def loads_at(self, node_index: int) -> List[Vector]:
+        """
+        Returns the loads applied on the node at `node_index`.
+
+        The loads are indexed by node the first time they're
+        needed, so each call only visits the node's own loads.
+
+        :param node_index: `int` node index
+        :return: `List[Vector]`
+        """
+        return [Vector(u, v) for u, v in self.__load_components(node_index)]
+
+    def describes(self, nodes: List[StrNode], bars: List[StrBar]):
+        """
+        Checks whether this model holds the same values as the
+        given node and bar objects, as if it was created from them
+        using `from_objects`, so it doesn't need to be created
+        again.
+
+        :param nodes: `List[StrNode]`
+        :param bars: `List[StrBar]`
+        :return: `bool`
+        """
+        if len(nodes) != self.nodes_count or len(bars) != self.bars_count:
+            return False
+
+        for index, node in enumerate(nodes):
+            if (
+                node.id != self.__node_ids[index]
+                or node.position.x != self.__xs[index]
+                or node.position.y != self.__ys[index]
+                or self.__constraints_mask(node.dx_constrained, node.dy_constrained)
+                != self.__constraints[index]
+                or [(load.u, load.v) for load in node.loads]
+                != self.__load_components(index)
+            ):
+                return False
+
+        for index, bar in enumerate(bars):
+            if (
+                bar.id != self.__bar_ids[index]
+                or bar.start_node.id != self.__node_ids[self.__starts[index]]
+                or bar.end_node.id != self.__node_ids[self.__ends[index]]
+                or bar.cross_section != self.__cross_sections[index]
+                or bar.young_mod != self.__young_mods[index]
+            ):
+                return False
+
+        return True
+
+    def with_loads(self, loads: Dict[int, List[Vector]]):
+        """
+        Creates a model with the same nodes and bars as this one,
+        but a different set of external loads, given as the list of
+        loads applied on the nodes, by node id, like a load case.
+
+        The node and bar arrays are shared with this model, not
+        copied.
+
+        :param loads: loads applied on the nodes, by node id
+        :return: `StructureColumns`
+        """
+        columns = StructureColumns()
+        columns.__node_ids = self.__node_ids
+        columns.__xs = self.__xs
+        columns.__ys = self.__ys
+        columns.__constraints = self.__constraints
+        columns.__bar_ids = self.__bar_ids
+        columns.__starts = self.__starts
+        columns.__ends = self.__ends
+        columns.__cross_sections = self.__cross_sections
+        columns.__young_mods = self.__young_mods
+
+        for node_id, node_loads in loads.items():
+            index = self.index_of(node_id)
+            for load in node_loads:
+                columns.add_load(index, load.u, load.v)
+
+        columns.__node_indices = self.__node_indices
+        return columns
+
+    def node_at(self, index: int) -> StrNode:
+        """
+        Creates a `StrNode` with the values of the node at `index`.
+
+        :param index: `int` node index
+        :return: `StrNode`
+        """
+        (node,) = self.__nodes([index])
+        return node
+
+    def bar_at(self, index: int) -> StrBar:
+        """
+        Creates a `StrBar` with the values of the bar at `index`,
+        and its two nodes.
+
+        :param index: `int` bar index
+        :return: `StrBar`
+        """
+        (start, end) = self.__nodes([self.__starts[index], self.__ends[index]])
+        return StrBar(
+            self.__bar_ids[index],
+            start,
+            end,
+            self.__cross_sections[index],
+            self.__young_mods[index],
+        )
+
+    def to_objects(self) -> Tuple[List[StrNode], List[StrBar]]:
+        """
+        Creates the `StrNode` and `StrBar` objects of the whole
+        model, with the bars linked to the nodes in the list.
+
+        :return: the nodes and the bars
+        """
+        nodes = self.__nodes(range(self.nodes_count))
+        bars = [
+            StrBar(bar_id, nodes[start], nodes[end], cross_section, young_mod)
+            for bar_id, start, end, cross_section, young_mod in zip(
+                self.__bar_ids,
+                self.__starts,
+                self.__ends,
+                self.__cross_sections,
+                self.__young_mods,
+                strict=True,
+            )
+        ]
+
+        return nodes, bars
+
+    def __nodes(self, indices):
+        return [
+            StrNode(
+                self.__node_ids[index],
+                Point(self.__xs[index], self.__ys[index]),
+                self.loads_at(index),
+                bool(self.__constraints[index] & self.CONSTRAINED_X),
+                bool(self.__constraints[index] & self.CONSTRAINED_Y),
+            )
+            for index in indices
+        ]
+
+    def __load_components(self, node_index: int):
+        if self.__loads_by_node is None:
+            self.__loads_by_node = {}
+            for position, index in enumerate(self.__load_nodes):
+                self.__loads_by_node.setdefault(index, []).append(position)
+
+        return [
+            (self.__load_us[position], self.__load_vs[position])
+            for position in self.__loads_by_node.get(node_index, [])
+        ]
+
+    def __constraints_mask(self, dx_constrained: bool, dy_constrained: bool):
+        return (self.CONSTRAINED_X if dx_constrained else 0) | (
+            self.CONSTRAINED_Y if dy_constrained else 0
+        )
+
+    def __ensure_node_index(self, index: int):
+        if not 0 <= index < len(self.__node_ids):
+            raise IndexError(f"Node index {index} out of bounds")
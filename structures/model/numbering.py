@@ -0,0 +1,38 @@
+from typing import List
+
+
+class DofNumberingReport:
+    """
+    Bandwidth and profile of a structure's stiffness matrix before
+    and after its nodes are renumbered.
+
+    The bandwidth is the largest distance between a value in the
+    lower triangle and the main diagonal. The profile is the number
+    of values between the first non-zero value of every row and the
+    main diagonal, which is what a skyline matrix stores.
+
+    Both are computed from the first non-zero column of every row
+    of the matrix.
+    """
+
+    def __init__(self, first_cols_before: List[int], first_cols_after: List[int]):
+        self.bandwidth_before = self.__bandwidth(first_cols_before)
+        self.profile_before = self.__profile(first_cols_before)
+        self.bandwidth_after = self.__bandwidth(first_cols_after)
+        self.profile_after = self.__profile(first_cols_after)
+
+    @staticmethod
+    def __bandwidth(first_cols: List[int]):
+        return max(
+            (row - first_col for row, first_col in enumerate(first_cols)), default=0
+        )
+
+    @staticmethod
+    def __profile(first_cols: List[int]):
+        return sum(row - first_col + 1 for row, first_col in enumerate(first_cols))
+
+    def __str__(self):
+        return (
+            f"bandwidth: {self.bandwidth_before} ➜ {self.bandwidth_after}, "
+            f"profile: {self.profile_before} ➜ {self.profile_after}"
+        )
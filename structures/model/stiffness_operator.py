@@ -0,0 +1,106 @@
+from typing import Dict, List, Set, Tuple
+
+from eqs import LinearOperator, Vector
+from structures.model.assembly import BarStiffnessTerms
+from structures.model.bar import StrBar
+
+
+class StiffnessOperator(LinearOperator):
+    """
+    The stiffness matrix [K] of a truss structure as a linear
+    operator: its product times a displacements vector, [K][u], is
+    computed bar by bar, without ever assembling the matrix.
+
+    The stiffness of a bar only depends on its axial stiffness, EA/L,
+    and its direction cosines (c, s): the bar's elongation is the
+    projection of the relative displacement of its end nodes over
+    its direction, and its axial force, EA/L times the elongation,
+    pushes its end nodes in that direction.
+
+    The external constraints are applied on the fly, the same way
+    they are applied to an assembled matrix: the rows and columns of
+    the constrained degrees of freedom behave like the ones of the
+    identity matrix.
+
+    The operator stores the three stiffness terms and four degrees of
+    freedom per bar, computed by `BarStiffnessTerms`, so its memory
+    is proportional to the number of bars.
+    """
+
+    def __init__(self, terms: BarStiffnessTerms, constrained_dofs: Set[int], size: int):
+        LinearOperator.__init__(self, size, size)
+
+        self.__constrained_dofs = sorted(constrained_dofs)
+        self.__free = [True] * size
+        for dof in constrained_dofs:
+            self.__free[dof] = False
+
+        self.__terms = terms
+
+    @staticmethod
+    def from_bars(
+        bars: List[StrBar],
+        dofs_dict: Dict[int, Tuple[int, int]],
+        constrained_dofs: Set[int],
+        size: int,
+    ):
+        """
+        Creates the operator of the given bar objects, whose nodes'
+        degrees of freedom are given by node id.
+
+        :param bars: `List[StrBar]`
+        :param dofs_dict: degrees of freedom of the nodes, by id
+        :param constrained_dofs: the constrained degrees of freedom
+        :param size: number of degrees of freedom
+        :return: `StiffnessOperator`
+        """
+        return StiffnessOperator(
+            BarStiffnessTerms.from_bars(bars, dofs_dict), constrained_dofs, size
+        )
+
+    def matvec(self, v: Vector, out: Vector) -> Vector:
+        free = self.__free
+        v_data = v.data
+        out_data = out.data
+
+        for i in range(len(out_data)):
+            out_data[i] = 0.0
+
+        for (sx, sy, ex, ey), c2, s2, sc in self.__terms.per_bar():
+            # the constrained displacements are columns of the identity
+            (du, dv) = (0.0, 0.0)
+            if free[sx]:
+                du -= v_data[sx]
+            if free[sy]:
+                dv -= v_data[sy]
+            if free[ex]:
+                du += v_data[ex]
+            if free[ey]:
+                dv += v_data[ey]
+
+            (force_x, force_y) = (c2 * du + sc * dv, sc * du + s2 * dv)
+            out_data[sx] -= force_x
+            out_data[sy] -= force_y
+            out_data[ex] += force_x
+            out_data[ey] += force_y
+
+        # the constrained equations are rows of the identity
+        for dof in self.__constrained_dofs:
+            out_data[dof] = v_data[dof]
+
+        return out
+
+    def diagonal(self) -> Vector:
+        diagonal = Vector(self.rows_count)
+        data = diagonal.data
+
+        for (sx, sy, ex, ey), c2, s2, _ in self.__terms.per_bar():
+            data[sx] += c2
+            data[sy] += s2
+            data[ex] += c2
+            data[ey] += s2
+
+        for dof in self.__constrained_dofs:
+            data[dof] = 1.0
+
+        return diagonal
@@ -1,35 +1,116 @@
-from functools import reduce
-from typing import List
+from array import array
+from itertools import count
+from typing import Callable, Dict, List
 
-from eqs import Matrix
+from eqs import CooMatrix, CsrMatrix, SymmetricMatrix
 from eqs import Vector as EqVector
-from eqs import cholesky_solve
+from eqs import CholeskyFactorization, LDLFactorization, NonPositivePivotError
+from eqs.conjugate_gradient import conjugate_gradient_solve
+from eqs.preconditioners import JacobiPreconditioner
+from eqs.ordering import reverse_cuthill_mckee
+from eqs.skyline import SkylineCholeskyFactorization, SkylineMatrix
+from eqs.sparse_cholesky import SparseCholeskyAnalysis
 from geom2d import Vector
+from structures.model.assembly import BarStiffnessTerms
 from structures.model.bar import StrBar
+from structures.model.columnar import StructureColumns
 from structures.model.node import StrNode
-from structures.solution.bar import StrBarSolution
-from structures.solution.node import StrNodeSolution
+from structures.model.numbering import DofNumberingReport
+from structures.model.stiffness_operator import StiffnessOperator
+from structures.solution.columnar import SolutionColumns
 from structures.solution.structure import StructureSolution
 
 
+class UnstableStructureError(ValueError):
+    """
+    Error raised when the stiffness matrix of a structure is
+    singular: the structure is a mechanism, or isn't supported
+    enough, so some of its nodes can move without deforming the
+    bars.
+
+    It includes the id of the node, and the direction ("x" or "y")
+    of the displacement where the factorization found the singular
+    pivot.
+    """
+
+    def __init__(self, node_id: int, direction: str):
+        ValueError.__init__(
+            self,
+            f"The structure is unstable: node {node_id} can move in the "
+            f"{direction} direction without deforming the bars. Check "
+            "its external constraints and the bars connected to it",
+        )
+        self.node_id = node_id
+        self.direction = direction
+
+
 class Structure:
     """
     A truss structure is a group of linear resistant elements
     (bars) built to withstand the application of external loads.
 
-    A structure is defined by its nodes and bars.
+    A structure is defined by its nodes and bars, either as lists
+    of `StrNode` and `StrBar` objects, or as the arrays of a
+    `StructureColumns` model, using `from_columns`.
+
+    Either way, the system of equations is numbered, assembled and
+    solved reading the arrays of the nodes and bars, by index.
     """
 
     __DOF_PER_NODE = 2
+    __SOLVERS = (
+        "auto",
+        "cholesky",
+        "ldlt",
+        "skyline",
+        "sparse_cholesky",
+        "sparse_cg",
+        "matrix_free_cg",
+    )
+    __CG_ITERATIONS_PER_DOF = 10
+    __CG_RELATIVE_TOLERANCE = 1e-10
+    __SKYLINE_MAX_FILL = 0.5
+
+    def __init__(
+        self,
+        nodes: List[StrNode] = None,
+        bars: List[StrBar] = None,
+        columns: StructureColumns = None,
+    ):
+        if (nodes is None) == (columns is None) or (nodes is None) != (bars is None):
+            raise ValueError("Define the structure by its nodes and bars, or columns")
 
-    def __init__(self, nodes: List[StrNode], bars: List[StrBar]):
         self.__bars = bars
         self.__nodes = nodes
+        self.__columns = columns
+
+        self.__solver = None
+        self.__reorder_nodes = True
+        self.__eliminate_constraints = False
+        self.__system_size = 0
+        self.__node_dofs: array = None
+        self.__dof_positions: array = None
+        self.__stiffness_terms: BarStiffnessTerms = None
+        self.__coupling_matrix: CsrMatrix = None
+        self.__matrix_first_cols = None
+        self.__numbering_report: DofNumberingReport = None
+        self.__sparse_analysis: SparseCholeskyAnalysis = None
+        self.__previous_displacements: List[EqVector] = []
+        self.__previous_node_dofs: array = None
+        self.__system_solver: Callable[[List[EqVector]], List[EqVector]] = None
+
+    @staticmethod
+    def from_columns(columns: StructureColumns):
+        """
+        Creates a structure defined by the arrays of a
+        `StructureColumns` model, which is solved without creating
+        any node or bar object: they're only created for the
+        solution, once the displacements are known.
 
-        self.__dofs_dict = None
-        self.__system_matrix: Matrix = None
-        self.__system_vector: EqVector = None
-        self.__global_displacements: EqVector = None
+        :param columns: `StructureColumns`
+        :return: `Structure`
+        """
+        return Structure(columns=columns)
 
     @property
     def nodes_count(self):
@@ -38,6 +119,9 @@ class Structure:
 
         :return: `int` number of nodes
         """
+        if self.__nodes is None:
+            return self.__columns.nodes_count
+
         return len(self.__nodes)
 
     @property
@@ -47,6 +131,9 @@ class Structure:
 
         :return: `int` number of bars
         """
+        if self.__bars is None:
+            return self.__columns.bars_count
+
         return len(self.__bars)
 
     @property
@@ -57,98 +144,503 @@ class Structure:
 
         :return: `int` number of external loads
         """
-        return reduce(lambda count, node: count + node.loads_count, self.__nodes, 0)
+        if self.__nodes is None:
+            return self.__columns.loads_count
+
+        return sum(node.loads_count for node in self.__nodes)
+
+    @property
+    def numbering_report(self):
+        """
+        The bandwidth and profile of the stiffness matrix before
+        and after renumbering the nodes in the last resolution of
+        the structure, or `None` if it hasn't been solved yet.
+
+        :return: `DofNumberingReport`
+        """
+        return self.__numbering_report
 
-    def solve_structure(self) -> StructureSolution:
+    def solve_structure(
+        self, solver="auto", reorder_nodes=True, eliminate_constraints=False
+    ) -> StructureSolution:
         """
         Computes the solution for the structure: the displacements
         of the nodes under the existing loads and the stresses on
         each of the bars.
 
+        The `solver` argument selects how the system of equations
+        is stored and solved:
+
+        - "auto": uses "skyline" when the profile of the stiffness
+          matrix is small compared to its lower triangle, and
+          "cholesky" otherwise.
+        - "cholesky": the lower triangle of the stiffness matrix is
+          assembled into a packed `SymmetricMatrix` and solved using
+          the Cholesky factorization, computed in place.
+        - "ldlt": like "cholesky", but using the square root free
+          LDL' factorization, which rejects pivots that are
+          negligible relative to the stiffness matrix' diagonal.
+        - "skyline": the stiffness matrix is assembled into a
+          `SkylineMatrix`, which only stores the values inside its
+          profile, and solved using the Cholesky factorization.
+          For a mean bandwidth `b`, the factorization has a time
+          complexity of O(n·b²) instead of O(n³).
+        - "sparse_cholesky": the stiffness matrix is assembled into
+          a `CsrMatrix` and solved using the sparse Cholesky
+          factorization, which renumbers the unknowns by minimum
+          degree and only computes the values in the factor's
+          sparsity pattern. The symbolic analysis of that pattern
+          is kept and reused while the bars' connectivity doesn't
+          change, so only the numeric factorization is repeated
+          after, for instance, changing the bars' sections.
+        - "sparse_cg": the stiffness matrix is assembled into a
+          sparse `CooMatrix`, compressed into a `CsrMatrix` and
+          solved using the conjugate gradient method, preconditioned
+          with the matrix' diagonal (Jacobi). Memory and
+          time per iteration grow with the number of non-zeros,
+          which makes it suitable for big structures. Iterations
+          start from the displacements of the previous resolution,
+          so solving the structure again after small changes
+          takes few iterations.
+        - "matrix_free_cg": like "sparse_cg", but the stiffness
+          matrix is never assembled: the products of the matrix
+          times a vector are computed bar by bar by a
+          `StiffnessOperator`, so the memory only grows with the
+          number of bars.
+
+        The bandwidth and profile of the stiffness matrix depend on
+        the order in which the degrees of freedom are numbered.
+        When `reorder_nodes` is set, the nodes are renumbered using
+        the Reverse Cuthill-McKee ordering of the graph defined by
+        the bars before assembling the system, which keeps them
+        small regardless of the order of the nodes in the input.
+        The solution is given in terms of the original nodes, and
+        the bandwidth and profile before and after renumbering are
+        available in the `numbering_report` property.
+
+        By default, the constrained degrees of freedom are kept in
+        the system, and their rows and columns are replaced by the
+        ones of the identity matrix. When `eliminate_constraints` is
+        set, only the free degrees of freedom are numbered in the
+        system, [K_ff], and the constrained ones are skipped while
+        assembling it, so a heavily supported structure has a
+        smaller system to factorize. The block coupling the
+        constrained and free degrees of freedom, [K_cf], is kept to
+        compute the reactions: [R_c] = [K_cf][u_f] - [F_c]. The
+        "matrix_free_cg" solver never assembles the system, and
+        always applies the constraints on the fly.
+
+        The direct solvers check every pivot of the factorization as
+        soon as it's computed: if the structure is a mechanism or
+        isn't supported enough, an `UnstableStructureError` with the
+        node that can move freely is raised at the first singular
+        pivot.
+
+        :param solver: name of the solver to use
+        :param reorder_nodes: whether to renumber the nodes
+        :param eliminate_constraints: whether to leave the
+            constrained degrees of freedom out of the system
         :return: `StructureSolution`
         """
+        self.__update_columns()
+        self.__prepare_system(solver, reorder_nodes, eliminate_constraints)
+        (solution,) = self.__solve_cases([self.__columns])
+        return solution
+
+    def solve_load_cases(
+        self,
+        load_cases: List[Dict[int, List[Vector]]],
+        solver="auto",
+        reorder_nodes=True,
+        eliminate_constraints=False,
+    ) -> List[StructureSolution]:
+        """
+        Computes the solution of the structure for each of the given
+        load cases.
+
+        A load case maps node ids to the list of external loads
+        applied on them. The loads defined in the nodes themselves
+        are ignored, and nodes not present in a load case are
+        unloaded.
+
+        The stiffness matrix is assembled and factorized only once,
+        so each load case only takes a forward and a backward
+        substitution to be solved. This brings the cost per load
+        case from O(n³) to O(n²) for the dense Cholesky solver.
+        All the load cases are substituted together, reading the
+        factorized matrix once for the whole block.
+
+        The `solver`, `reorder_nodes` and `eliminate_constraints`
+        arguments work as in `solve_structure`.
+
+        :param load_cases: loads applied on the nodes, by node id
+        :param solver: name of the solver to use
+        :param reorder_nodes: whether to renumber the nodes
+        :param eliminate_constraints: whether to leave the
+            constrained degrees of freedom out of the system
+        :return: a `StructureSolution` per load case
+        """
+        self.__update_columns()
+        cases_columns = [self.__columns_with_loads(case) for case in load_cases]
+
+        self.__prepare_system(solver, reorder_nodes, eliminate_constraints)
+        return self.__solve_cases(cases_columns)
+
+    def __update_columns(self):
+        # nodes and bars objects may have changed since the last time
+        if self.__nodes is None:
+            return
+
+        if self.__columns is None or not self.__columns.describes(
+            self.__nodes, self.__bars
+        ):
+            self.__columns = StructureColumns.from_objects(self.__nodes, self.__bars)
+
+    def __columns_with_loads(self, load_case: Dict[int, List[Vector]]):
+        try:
+            return self.__columns.with_loads(load_case)
+        except ValueError as error:
+            raise ValueError(f"Load case references unknown node: {error}") from error
+
+    def __prepare_system(
+        self, solver: str, reorder_nodes: bool, eliminate_constraints: bool
+    ):
+        if solver not in self.__SOLVERS:
+            raise ValueError(f"Unknown solver: {solver}")
+
+        self.__solver = solver
+        self.__reorder_nodes = reorder_nodes
+        self.__eliminate_constraints = (
+            eliminate_constraints and solver != "matrix_free_cg"
+        )
+        self.__system_size = self.__dofs_count - (
+            self.__constraints_count if self.__eliminate_constraints else 0
+        )
+        self.__coupling_matrix = None
         self.__assign_degrees_of_freedom()
-        self.__solve_system_of_equations()
-        return self.__make_structure_solution()
+        self.__factorize_system_matrix()
 
     def __assign_degrees_of_freedom(self):
-        self.__dofs_dict = {}
-        for i, node in enumerate(self.__nodes):
-            self.__dofs_dict[node.id] = (2 * i, 2 * i + 1)
-
-    def __solve_system_of_equations(self):
-        size = self.nodes_count * self.__DOF_PER_NODE
-        self.__assemble_system_matrix(size)
-        self.__assemble_system_vector(size)
-        self.__apply_external_constraints()
-        self.__global_displacements = cholesky_solve(
-            self.__system_matrix, self.__system_vector
+        self.__number_dofs(range(self.nodes_count))
+        first_cols_before = self.__first_cols()
+
+        if self.__reorder_nodes:
+            self.__number_dofs(self.__nodes_in_rcm_order())
+            self.__matrix_first_cols = self.__first_cols()
+        else:
+            self.__matrix_first_cols = first_cols_before
+
+        self.__numbering_report = DofNumberingReport(
+            first_cols_before, self.__matrix_first_cols
+        )
+
+        # the inverse of node_dofs: 2i for the x dof of node i, 2i + 1 for y
+        self.__dof_positions = array("q", [0]) * self.__dofs_count
+        for position, dof in enumerate(self.__node_dofs):
+            self.__dof_positions[dof] = position
+
+    def __number_dofs(self, node_indices: List[int]):
+        # the dofs of the node at index i are at 2i and 2i + 1
+        node_dofs = array("q", [0]) * self.__dofs_count
+        self.__node_dofs = node_dofs
+
+        if not self.__eliminate_constraints:
+            for position, index in enumerate(node_indices):
+                node_dofs[2 * index] = 2 * position
+                node_dofs[2 * index + 1] = 2 * position + 1
+            return
+
+        # the constrained dofs are numbered after the system's free ones
+        free_dofs = count()
+        constrained_dofs = count(self.__system_size)
+        constraints = self.__columns.constraints
+        for index in node_indices:
+            node_dofs[2 * index] = next(
+                constrained_dofs
+                if constraints[index] & StructureColumns.CONSTRAINED_X
+                else free_dofs
+            )
+            node_dofs[2 * index + 1] = next(
+                constrained_dofs
+                if constraints[index] & StructureColumns.CONSTRAINED_Y
+                else free_dofs
+            )
+
+    @property
+    def __dofs_count(self):
+        return self.nodes_count * self.__DOF_PER_NODE
+
+    @property
+    def __constraints_count(self):
+        constraints = self.__columns.constraints
+        both = StructureColumns.CONSTRAINED_X | StructureColumns.CONSTRAINED_Y
+        return (
+            constraints.count(StructureColumns.CONSTRAINED_X)
+            + constraints.count(StructureColumns.CONSTRAINED_Y)
+            + 2 * constraints.count(both)
         )
 
-    def __assemble_system_matrix(self, size: int):
-        matrix = Matrix(size, size)
+    def __nodes_in_rcm_order(self):
+        columns = self.__columns
+        adjacency = [[] for _ in range(columns.nodes_count)]
+
+        for start, end in zip(columns.starts, columns.ends, strict=True):
+            adjacency[start].append(end)
+            adjacency[end].append(start)
 
-        for bar in self.__bars:
-            bar_matrix = bar.global_stiffness_matrix()
-            dofs = self.__bar_dofs(bar)
+        return reverse_cuthill_mckee(adjacency)
 
-            for row, row_dof in enumerate(dofs):
-                for col, col_dof in enumerate(dofs):
-                    matrix.add_to_value(bar_matrix.value_at(row, col), row_dof, col_dof)
+    def __first_cols(self):
+        size = self.__system_size
+        first_cols = list(range(size))
+        node_dofs = self.__node_dofs
 
-        self.__system_matrix = matrix
+        for start, end in zip(self.__columns.starts, self.__columns.ends, strict=True):
+            bar_dofs = (
+                node_dofs[2 * start],
+                node_dofs[2 * start + 1],
+                node_dofs[2 * end],
+                node_dofs[2 * end + 1],
+            )
+            dofs = [dof for dof in bar_dofs if dof < size]
+            min_dof = min(dofs, default=size)
+            for dof in dofs:
+                first_cols[dof] = min(first_cols[dof], min_dof)
+
+        return first_cols
+
+    def __factorize_system_matrix(self):
+        size = self.__system_size
+
+        if self.__solver == "auto":
+            self.__solver = self.__choose_solver(size)
+
+        terms = BarStiffnessTerms(self.__columns, self.__node_dofs)
+        self.__stiffness_terms = terms
+
+        if self.__solver == "matrix_free_cg":
+            operator = StiffnessOperator(terms, self.__constrained_dofs(), size)
+            self.__system_solver = self.__iterative_solver(operator, size)
+            return
+
+        matrix = self.__assemble_system_matrix(terms, size)
+
+        if self.__eliminate_constraints:
+            coupling = CooMatrix(self.__dofs_count - size, size)
+            self.__coupling_matrix = terms.add_to_sparse(coupling, size).to_csr()
+        else:
+            self.__apply_external_constraints(matrix)
 
-    def __bar_dofs(self, bar: StrBar):
-        start_dofs = self.__dofs_dict[bar.start_node.id]
-        end_dofs = self.__dofs_dict[bar.end_node.id]
-        return start_dofs + end_dofs
+        if self.__solver == "sparse_cg":
+            self.__system_solver = self.__iterative_solver(matrix.to_csr(), size)
+            return
 
-    def __assemble_system_vector(self, size: int):
-        vector = EqVector(size)
+        try:
+            self.__system_solver = self.__factorize_direct(matrix)
+        except NonPositivePivotError as error:
+            if not 0 <= error.index < size:
+                raise
 
-        for node in self.__nodes:
-            net_load = node.net_load
-            (dof_x, dof_y) = self.__dofs_dict[node.id]
+            raise self.__unstable_structure_error(error.index) from error
 
-            vector.add_to_value(net_load.u, dof_x)
-            vector.add_to_value(net_load.v, dof_y)
+    def __factorize_direct(self, matrix):
+        if self.__solver == "sparse_cholesky":
+            csr_matrix = matrix.to_csr()
+            if self.__sparse_analysis is None or not self.__sparse_analysis.matches(
+                csr_matrix
+            ):
+                self.__sparse_analysis = SparseCholeskyAnalysis(csr_matrix)
 
-        self.__system_vector = vector
+            return self.__sparse_analysis.factorize(csr_matrix).solve_many
+
+        if self.__solver == "skyline":
+            return SkylineCholeskyFactorization(matrix).solve_many
+
+        if self.__solver == "ldlt":
+            return LDLFactorization(matrix, overwrite=True).solve_many
+
+        return CholeskyFactorization(matrix, overwrite=True).solve_many
+
+    def __unstable_structure_error(self, dof: int):
+        (index, direction) = divmod(self.__dof_positions[dof], 2)
+        return UnstableStructureError(
+            self.__columns.node_ids[index], "y" if direction else "x"
+        )
+
+    def __iterative_solver(self, sys_mat, size: int):
+        preconditioner = JacobiPreconditioner(sys_mat)
+        max_iter = self.__CG_ITERATIONS_PER_DOF * size
+
+        return lambda vectors: [
+            conjugate_gradient_solve(
+                sys_mat,
+                vector,
+                max_iter=max_iter,
+                preconditioner=preconditioner,
+                initial_guess=self.__previous_displacement(index, size),
+                relative_tolerance=self.__CG_RELATIVE_TOLERANCE,
+            )
+            for index, vector in enumerate(vectors)
+        ]
 
-    def __apply_external_constraints(self):
-        for node in self.__nodes:
-            (dof_x, dof_y) = self.__dofs_dict[node.id]
+    def __constrained_dofs(self):
+        node_dofs = self.__node_dofs
+        constrained_dofs = set()
 
-            if node.dx_constrained:
-                self.__system_matrix.set_identity_row(dof_x)
-                self.__system_matrix.set_identity_col(dof_x)
-                self.__system_vector.set_value(0, dof_x)
+        for index, constraints in enumerate(self.__columns.constraints):
+            if constraints & StructureColumns.CONSTRAINED_X:
+                constrained_dofs.add(node_dofs[2 * index])
 
-            if node.dy_constrained:
-                self.__system_matrix.set_identity_row(dof_y)
-                self.__system_matrix.set_identity_col(dof_y)
-                self.__system_vector.set_value(0, dof_y)
+            if constraints & StructureColumns.CONSTRAINED_Y:
+                constrained_dofs.add(node_dofs[2 * index + 1])
 
-    def __make_structure_solution(self) -> StructureSolution:
-        nodes = [self.__node_to_solution(node) for node in self.__nodes]
+        return constrained_dofs
 
-        nodes_dict = {}
-        for node in nodes:
-            nodes_dict[node.id] = node
+    def __solve_cases(
+        self, cases_columns: List[StructureColumns]
+    ) -> List[StructureSolution]:
+        cases_loads = [self.__assemble_loads_vector(case) for case in cases_columns]
+        vectors = [self.__system_vector(loads) for loads in cases_loads]
+        self.__previous_displacements = self.__system_solver(vectors)
+        self.__previous_node_dofs = self.__node_dofs
 
-        bars = [
-            StrBarSolution(
-                bar, nodes_dict[bar.start_node.id], nodes_dict[bar.end_node.id]
+        return [
+            self.__make_structure_solution(case, displacements, loads)
+            for case, displacements, loads in zip(
+                cases_columns, self.__previous_displacements, cases_loads, strict=True
             )
-            for bar in self.__bars
         ]
 
-        return StructureSolution(nodes, bars)
+    def __previous_displacement(self, index: int, size: int):
+        previous_dofs = self.__previous_node_dofs
+        if index >= len(self.__previous_displacements) or previous_dofs is None:
+            return None
 
-    def __node_to_solution(self, node: StrNode) -> StrNodeSolution:
-        (dof_x, dof_y) = self.__dofs_dict[node.id]
-        disp = Vector(
-            self.__global_displacements.value_at(dof_x),
-            self.__global_displacements.value_at(dof_y),
+        node_dofs = self.__node_dofs
+        if len(previous_dofs) != len(node_dofs):
+            return None
+
+        # the dofs may have been renumbered or constrained since
+        previous = self.__previous_displacements[index].data
+        guess = EqVector(size)
+        data = guess.data
+        constraints = self.__columns.constraints
+
+        for position, (previous_dof, dof) in enumerate(
+            zip(previous_dofs, node_dofs, strict=True)
+        ):
+            # CONSTRAINED_X is bit 0, and CONSTRAINED_Y, bit 1
+            constrained = constraints[position >> 1] & (1 << (position & 1))
+            if not constrained and dof < size and previous_dof < len(previous):
+                data[dof] = previous[previous_dof]
+
+        return guess
+
+    def __choose_solver(self, size: int):
+        lower_size = size * (size + 1) / 2
+
+        if (
+            self.__numbering_report.profile_after
+            <= self.__SKYLINE_MAX_FILL * lower_size
+        ):
+            return "skyline"
+
+        return "cholesky"
+
+    def __assemble_system_matrix(self, terms: BarStiffnessTerms, size: int):
+        if self.__solver in ("sparse_cg", "sparse_cholesky"):
+            return terms.add_to_sparse(CooMatrix(size, size))
+
+        # Symmetric matrices only store the lower triangle
+        if self.__solver == "skyline":
+            return terms.add_to_symmetric(SkylineMatrix(self.__matrix_first_cols))
+
+        return terms.add_to_symmetric(SymmetricMatrix(size))
+
+    def __assemble_loads_vector(self, case: StructureColumns):
+        node_dofs = self.__node_dofs
+        vector = EqVector(self.__dofs_count)
+
+        for index, u, v in zip(
+            case.load_nodes, case.load_us, case.load_vs, strict=True
+        ):
+            vector.add_to_value(u, node_dofs[2 * index])
+            vector.add_to_value(v, node_dofs[2 * index + 1])
+
+        return vector
+
+    def __system_vector(self, loads: EqVector):
+        if self.__eliminate_constraints:
+            return EqVector(self.__system_size).set_data(
+                loads.data[: self.__system_size]
+            )
+
+        vector = loads.copy()
+        for dof in self.__constrained_dofs():
+            vector.set_value(0, dof)
+
+        return vector
+
+    def __apply_external_constraints(self, matrix):
+        if isinstance(matrix, CooMatrix):
+            # a single pass over the triplets for all the dofs
+            matrix.set_identity(self.__constrained_dofs())
+            return
+
+        for dof in sorted(self.__constrained_dofs()):
+            matrix.set_identity_row(dof)
+            matrix.set_identity_col(dof)
+
+    def __make_structure_solution(
+        self, case: StructureColumns, system_displacements: EqVector, loads: EqVector
+    ) -> StructureSolution:
+        # the eliminated, constrained dofs don't move
+        displacements = EqVector(self.__dofs_count)
+        displacements.data[: self.__system_size] = system_displacements.data
+
+        reactions = self.__reactions(system_displacements, displacements, loads)
+        return StructureSolution(
+            None,
+            None,
+            reactions,
+            SolutionColumns(case, self.__node_dofs, displacements),
         )
-        return StrNodeSolution(node, disp)
+
+    def __reactions(
+        self,
+        system_displacements: EqVector,
+        displacements: EqVector,
+        loads: EqVector,
+    ):
+        if self.__coupling_matrix is not None:
+            # [R_c] = [K_cf][u_f] - [F_c], constrained dofs numbered from size
+            forces = self.__coupling_matrix.times_vector(system_displacements)
+            first_dof = self.__system_size
+        else:
+            # [R] = [K][u] - [F], at the constrained dofs
+            forces = self.__stiffness_terms.times_vector(displacements)
+            first_dof = 0
+
+        def reaction(dof: int, constrained: int):
+            if not constrained:
+                return 0.0
+
+            return forces.value_at(dof - first_dof) - loads.value_at(dof)
+
+        node_dofs = self.__node_dofs
+        columns = self.__columns
+        reactions = {}
+        for index, constraints in enumerate(columns.constraints):
+            if constraints:
+                reactions[columns.node_ids[index]] = Vector(
+                    reaction(
+                        node_dofs[2 * index],
+                        constraints & StructureColumns.CONSTRAINED_X,
+                    ),
+                    reaction(
+                        node_dofs[2 * index + 1],
+                        constraints & StructureColumns.CONSTRAINED_Y,
+                    ),
+                )
+
+        return reactions
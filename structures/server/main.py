@@ -5,6 +5,7 @@ import pathlib
 from tornado.ioloop import IOLoop
 from tornado.web import Application, RequestHandler, StaticFileHandler
 
+from structures.model.structure import UnstableStructureError
 from structures.out.json import structure_solution_to_json
 from structures.out.text import structure_solution_to_string
 from structures.parse import parse_structure
@@ -92,7 +93,20 @@ class SolveHandler(CORSMixin, RequestHandler):
             self.write({"error": {"cause": "definition", "message": str(e)}})
             return
 
-        solution = structure.solve_structure()
+        try:
+            solution = structure.solve_structure()
+        except UnstableStructureError as e:
+            self.set_status(400)
+            self.write(
+                {
+                    "error": {
+                        "cause": "structure",
+                        "message": str(e),
+                        "nodeId": e.node_id,
+                    }
+                }
+            )
+            return
 
         if wants_text:
             solution_text = structure_solution_to_string(solution)
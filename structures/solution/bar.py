@@ -1,4 +1,6 @@
-from geom2d import Segment, make_vector_between
+import math
+
+from geom2d import Segment, Vector
 from structures.model.bar import StrBar
 from .node import StrNodeSolution
 
@@ -11,8 +13,26 @@ class StrBarSolution:
     linked to the solution nodes, that include their displacement
     vectors. It's thanks to the solution displaced nodes that we
     can obtain the stress and strain values for the bar.
+
+    The elongation, strain, stress and internal force are computed
+    once, when the solution bar is created, straight from the
+    coordinates and displacements of its nodes, so reading them
+    doesn't create any geometry.
     """
 
+    __slots__ = (
+        "__original_bar",
+        "start_node",
+        "end_node",
+        "__original_length",
+        "__final_projections",
+        "__final_length",
+        "__elongation",
+        "__strain",
+        "__stress",
+        "__internal_force",
+    )
+
     def __init__(
         self,
         original_bar: StrBar,
@@ -29,6 +49,24 @@ class StrBarSolution:
         self.start_node = start_node
         self.end_node = end_node
 
+        (start, end) = (start_node.original_pos, end_node.original_pos)
+        (start_disp, end_disp) = (start_node.global_disp, end_node.global_disp)
+        (dx, dy) = (end.x - start.x, end.y - start.y)
+        (du, dv) = (end_disp.u - start_disp.u, end_disp.v - start_disp.v)
+
+        self.__original_length = math.hypot(dx, dy)
+        self.__final_projections = (dx + du, dy + dv)
+        self.__final_length = math.hypot(dx + du, dy + dv)
+
+        # l² - l₀² = (2dx + du)du + (2dy + dv)dv, which unlike l - l₀,
+        # doesn't lose precision when the displacements are small
+        self.__elongation = ((2 * dx + du) * du + (2 * dy + dv) * dv) / (
+            self.__final_length + self.__original_length
+        )
+        self.__strain = self.__elongation / self.__original_length
+        self.__stress = original_bar.young_mod * self.__strain
+        self.__internal_force = self.__stress * original_bar.cross_section
+
     @property
     def id(self):
         """
@@ -83,7 +121,7 @@ class StrBarSolution:
 
         :return: the bar's length
         """
-        return self.original_geometry.length
+        return self.__original_length
 
     @property
     def final_length(self):
@@ -93,7 +131,7 @@ class StrBarSolution:
 
         :return: the solution bar's length
         """
-        return self.final_geometry.length
+        return self.__final_length
 
     @property
     def elongation(self):
@@ -107,7 +145,7 @@ class StrBarSolution:
 
         :return: the bar's elongation
         """
-        return self.final_length - self.original_length
+        return self.__elongation
 
     @property
     def strain(self):
@@ -117,7 +155,7 @@ class StrBarSolution:
 
         :return: the bar's strain
         """
-        return self.elongation / self.original_length
+        return self.__strain
 
     @property
     def stress(self):
@@ -128,7 +166,7 @@ class StrBarSolution:
         product of the bar's strain and Young modulus.
         :return:
         """
-        return self.young_mod * self.strain
+        return self.__stress
 
     @property
     def internal_force_value(self):
@@ -137,7 +175,7 @@ class StrBarSolution:
 
         :return: the bar's internal force
         """
-        return self.stress * self.cross_section
+        return self.__internal_force
 
     def force_in_node(self, node: StrNodeSolution):
         """
@@ -149,14 +187,14 @@ class StrBarSolution:
         :param node: one of the bar's end nodes
         :return: force exerted by the bar on the given node
         """
+        # the force goes along the displaced bar, from the other node
+        (final_dx, final_dy) = self.__final_projections
+        force_per_length = self.__internal_force / self.__final_length
+
         if node is self.start_node:
-            return make_vector_between(
-                self.end_node.displaced_pos, self.start_node.displaced_pos
-            ).with_length(self.internal_force_value)
+            return Vector(-final_dx, -final_dy).scaled_by(force_per_length)
         elif node is self.end_node:
-            return make_vector_between(
-                self.start_node.displaced_pos, self.end_node.displaced_pos
-            ).with_length(self.internal_force_value)
+            return Vector(final_dx, final_dy).scaled_by(force_per_length)
 
         raise ValueError(f"Bar {self.id} does not know about node {node.id}")
 
@@ -0,0 +1,108 @@
+from typing import List
+
+from eqs import Vector as EqVector
+from geom2d import Vector
+from structures.model.columnar import StructureColumns
+
+from .bar import StrBarSolution
+from .node import StrNodeSolution
+
+
+class SolutionColumns:
+    """
+    The displacements of the nodes of a `StructureColumns` model,
+    kept in the solved system's vector, along with the degrees of
+    freedom of every node.
+
+    The solution nodes and bars are only created on demand, one by
+    one with `node_at` and `bar_at`, or all of them, linked to each
+    other, with `nodes` and `bars`.
+    """
+
+    def __init__(self, columns: StructureColumns, node_dofs, displacements: EqVector):
+        self.__columns = columns
+        self.__node_dofs = node_dofs
+        self.__displacements = displacements
+        self.__objects = None
+
+    @property
+    def columns(self):
+        """
+        The solved structure model.
+
+        :return: `StructureColumns`
+        """
+        return self.__columns
+
+    def displacement_at(self, index: int) -> Vector:
+        """
+        The global displacement of the node at `index`.
+
+        :param index: `int` node index
+        :return: `Vector`
+        """
+        data = self.__displacements.data
+        return Vector(
+            data[self.__node_dofs[2 * index]], data[self.__node_dofs[2 * index + 1]]
+        )
+
+    def node_at(self, index: int) -> StrNodeSolution:
+        """
+        Creates the solution of the node at `index`.
+
+        :param index: `int` node index
+        :return: `StrNodeSolution`
+        """
+        return StrNodeSolution(
+            self.__columns.node_at(index), self.displacement_at(index)
+        )
+
+    def bar_at(self, index: int) -> StrBarSolution:
+        """
+        Creates the solution of the bar at `index`, along with the
+        solution of its two nodes.
+
+        :param index: `int` bar index
+        :return: `StrBarSolution`
+        """
+        bar = self.__columns.bar_at(index)
+        (start, end) = (self.__columns.starts[index], self.__columns.ends[index])
+        return StrBarSolution(
+            bar,
+            StrNodeSolution(bar.start_node, self.displacement_at(start)),
+            StrNodeSolution(bar.end_node, self.displacement_at(end)),
+        )
+
+    def nodes(self) -> List[StrNodeSolution]:
+        """
+        Creates the solution of every node, in order.
+
+        :return: `List[StrNodeSolution]`
+        """
+        (nodes, _) = self.__model_objects()
+        return [
+            StrNodeSolution(node, self.displacement_at(index))
+            for index, node in enumerate(nodes)
+        ]
+
+    def bars(self, nodes: List[StrNodeSolution]) -> List[StrBarSolution]:
+        """
+        Creates the solution of every bar, in order, linked to the
+        given solution `nodes`, as created by `nodes`.
+
+        :param nodes: `List[StrNodeSolution]`
+        :return: `List[StrBarSolution]`
+        """
+        (_, bars) = self.__model_objects()
+        return [
+            StrBarSolution(bar, nodes[start], nodes[end])
+            for bar, start, end in zip(
+                bars, self.__columns.starts, self.__columns.ends, strict=True
+            )
+        ]
+
+    def __model_objects(self):
+        if self.__objects is None:
+            self.__objects = self.__columns.to_objects()
+
+        return self.__objects
@@ -1,10 +1,9 @@
-import operator
-from functools import reduce
-from typing import List
+from typing import Dict, List
 
 from geom2d import Vector, make_rect_containing_with_margin
 
 from .bar import StrBarSolution
+from .columnar import SolutionColumns
 from .node import StrNodeSolution
 
 
@@ -13,12 +12,87 @@ class StructureSolution:
     Truss structure solution model.
 
     The solution model groups the list of solution nodes and the
-    list of solution bars.
+    list of solution bars, and the reaction forces of the
+    constrained nodes, by node id.
+
+    The reactions are usually computed while solving the structure,
+    from the equilibrium equations of the constrained degrees of
+    freedom. Otherwise, they are computed the first time they're
+    needed, in a single pass over the bars.
+
+    A solution can also be given by its `SolutionColumns` instead
+    of the nodes and bars, which are then created the first time
+    they're needed. Solution nodes and bars can be read one by one
+    from the `columns`, without creating all of them.
     """
 
-    def __init__(self, nodes: List[StrNodeSolution], bars: List[StrBarSolution]):
-        self.nodes = nodes
-        self.bars = bars
+    def __init__(
+        self,
+        nodes: List[StrNodeSolution],
+        bars: List[StrBarSolution],
+        reactions: Dict[int, Vector] = None,
+        columns: SolutionColumns = None,
+    ):
+        self.__nodes = nodes
+        self.__bars = bars
+        self.__reactions = reactions
+        self.__columns = columns
+        self.__columns_nodes: List[StrNodeSolution] = None
+
+    @property
+    def columns(self):
+        """
+        The solution's `SolutionColumns`, if it was given by them,
+        or `None` otherwise.
+
+        :return: `SolutionColumns`
+        """
+        return self.__columns
+
+    @property
+    def nodes(self):
+        """
+        The solution nodes, in the order of the structure's nodes.
+
+        :return: `List[StrNodeSolution]`
+        """
+        if self.__nodes is None:
+            self.__nodes = list(self.__nodes_by_index())
+
+        return self.__nodes
+
+    @nodes.setter
+    def nodes(self, nodes: List[StrNodeSolution]):
+        self.__nodes = nodes
+
+    @property
+    def bars(self):
+        """
+        The solution bars, in the order of the structure's bars.
+
+        :return: `List[StrBarSolution]`
+        """
+        if self.__bars is None:
+            self.__bars = self.__columns.bars(self.__nodes_by_index())
+
+        return self.__bars
+
+    @bars.setter
+    def bars(self, bars: List[StrBarSolution]):
+        self.__bars = bars
+
+    @property
+    def reactions(self):
+        """
+        The external reaction forces of the constrained nodes, by
+        node id.
+
+        :return: `Dict[int, Vector]`
+        """
+        if self.__reactions is None:
+            self.__reactions = self.__reactions_from_bars()
+
+        return self.__reactions
 
     def bounds_rect(self, margin: float, scale=1):
         """
@@ -37,30 +111,46 @@ class StructureSolution:
 
     def reaction_for_node(self, node: StrNodeSolution) -> Vector:
         """
-        Computes the external reaction force for a given node.
-
-        To compute the reaction, it takes into account the external
-        loads and the internal forces from the bars connected to
-        the node.
+        Returns the external reaction force for a given node.
 
         A node that isn't externally constrained has no reaction
         force.
 
-        :param node: node to compute the reaction force
+        :param node: node to get the reaction force for
         :return: reaction force on the node
         """
         if not node.is_constrained:
             return Vector(0, 0)
 
-        forces = [bar.force_in_node(node) for bar in self.bars if bar.has_node(node)]
+        return self.reactions[node.id]
+
+    def __nodes_by_index(self):
+        # kept apart from `nodes`, which can be sorted in place
+        if self.__columns_nodes is None:
+            self.__columns_nodes = self.__columns.nodes()
+
+        return self.__columns_nodes
 
-        if node.is_loaded:
-            forces.append(node.net_load.opposite())
+    def __reactions_from_bars(self):
+        # The reaction balances the external loads and the forces
+        # from the bars connected to the node
+        net_forces = {
+            node.id: node.net_load.opposite() if node.is_loaded else Vector(0, 0)
+            for node in self.nodes
+            if node.is_constrained
+        }
 
-        net_force = reduce(operator.add, forces)
+        for bar in self.bars:
+            for node in (bar.start_node, bar.end_node):
+                if node.id in net_forces:
+                    net_forces[node.id] += bar.force_in_node(node)
 
         # The reaction can only have the components of the constrained directions
-        return Vector(
-            u=net_force.u if node.dx_constrained else 0.0,
-            v=net_force.v if node.dy_constrained else 0.0,
-        )
+        return {
+            node.id: Vector(
+                u=net_forces[node.id].u if node.dx_constrained else 0.0,
+                v=net_forces[node.id].v if node.dy_constrained else 0.0,
+            )
+            for node in self.nodes
+            if node.is_constrained
+        }
@@ -0,0 +1,111 @@
+import unittest
+from array import array
+
+from eqs import CooMatrix, Matrix, SymmetricMatrix, Vector
+from eqs.skyline import SkylineMatrix
+from geom2d import Point
+from structures.model.assembly import BarStiffnessTerms
+from structures.model.bar import StrBar
+from structures.model.columnar import StructureColumns
+from structures.model.node import StrNode
+
+
+class BarStiffnessTermsTest(unittest.TestCase):
+    n_1 = StrNode(1, Point(0, 0))
+    n_2 = StrNode(2, Point(0, 200))
+    n_3 = StrNode(3, Point(400, 200))
+    n_4 = StrNode(4, Point(-150, 350))
+    bars = [
+        StrBar(1, n_1, n_2, 5, 2e7),
+        StrBar(2, n_2, n_3, 5, 2e7),
+        StrBar(3, n_3, n_1, 3, 2e7),
+        StrBar(4, n_4, n_2, 2, 1e7),
+    ]
+    dofs_dict = {1: (4, 5), 2: (0, 1), 3: (6, 7), 4: (2, 3)}
+    terms = BarStiffnessTerms.from_bars(bars, dofs_dict)
+
+    def test_terms_match_bar_stiffness_matrix(self):
+        for i, bar in enumerate(self.bars):
+            bar_matrix = bar.global_stiffness_matrix()
+            self.assertAlmostEqual(bar_matrix.value_at(0, 0), self.terms.c2_eal[i])
+            self.assertAlmostEqual(bar_matrix.value_at(1, 1), self.terms.s2_eal[i])
+            self.assertAlmostEqual(bar_matrix.value_at(0, 1), self.terms.sc_eal[i])
+
+    def test_dofs(self):
+        self.assertEqual(4, self.terms.bars_count)
+        self.assertEqual([2, 3, 0, 1], list(self.terms.dofs[12:16]))
+
+    def test_from_bars_matches_columns(self):
+        columns = StructureColumns.from_objects(
+            [self.n_1, self.n_2, self.n_3, self.n_4], self.bars
+        )
+        node_dofs = array("q", [4, 5, 0, 1, 6, 7, 2, 3])
+        terms = BarStiffnessTerms(columns, node_dofs)
+
+        self.assertEqual(list(self.terms.dofs), list(terms.dofs))
+        self.assertEqual(self.terms.c2_eal, terms.c2_eal)
+        self.assertEqual(self.terms.s2_eal, terms.s2_eal)
+        self.assertEqual(self.terms.sc_eal, terms.sc_eal)
+
+    def test_per_bar(self):
+        (dofs, c2, s2, sc) = list(self.terms.per_bar())[3]
+
+        self.assertEqual((2, 3, 0, 1), dofs)
+        self.assertEqual(self.terms.c2_eal[3], c2)
+        self.assertEqual(self.terms.sc_eal[3], sc)
+
+    def test_add_to_symmetric_matrix(self):
+        matrix = self.terms.add_to_symmetric(SymmetricMatrix(8))
+        self.assertEqual(self.__assembled_matrix(), matrix.to_matrix())
+
+    def test_add_to_skyline_matrix(self):
+        matrix = self.terms.add_to_symmetric(SkylineMatrix([0, 0, 0, 0, 0, 0, 0, 0]))
+        expected = self.__assembled_matrix()
+
+        for i in range(8):
+            for j in range(8):
+                self.assertAlmostEqual(expected.value_at(i, j), matrix.value_at(i, j))
+
+    def test_add_to_sparse_matrix(self):
+        matrix = self.terms.add_to_sparse(CooMatrix(8, 8))
+
+        self.assertEqual(16 * len(self.bars), matrix.triplets_count)
+        self.assertEqual(self.__assembled_matrix(), matrix.to_matrix())
+
+    def test_add_to_symmetric_skips_dofs_beyond_size(self):
+        matrix = self.terms.add_to_symmetric(SymmetricMatrix(5))
+        expected = self.__assembled_matrix()
+
+        for i in range(5):
+            for j in range(5):
+                self.assertAlmostEqual(expected.value_at(i, j), matrix.value_at(i, j))
+
+    def test_add_to_sparse_block(self):
+        matrix = self.terms.add_to_sparse(CooMatrix(3, 5), first_row=5)
+        expected = self.__assembled_matrix()
+
+        for i in range(3):
+            for j in range(5):
+                self.assertAlmostEqual(
+                    expected.value_at(i + 5, j), matrix.value_at(i, j)
+                )
+
+    def test_times_vector(self):
+        vector = Vector(8).set_data([1, -2, 3, 4, -5, 6, 0.5, 0.25])
+        expected = self.__assembled_matrix().times_vector(vector)
+        actual = self.terms.times_vector(vector)
+
+        for i in range(8):
+            self.assertAlmostEqual(expected.value_at(i), actual.value_at(i), delta=1e-6)
+
+    def __assembled_matrix(self):
+        matrix = Matrix(8, 8)
+        for bar in self.bars:
+            bar_matrix = bar.global_stiffness_matrix()
+            dofs = self.dofs_dict[bar.start_node.id] + self.dofs_dict[bar.end_node.id]
+
+            for row, row_dof in enumerate(dofs):
+                for col, col_dof in enumerate(dofs):
+                    matrix.add_to_value(bar_matrix.value_at(row, col), row_dof, col_dof)
+
+        return matrix
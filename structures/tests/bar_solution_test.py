@@ -0,0 +1,66 @@
+import unittest
+
+from geom2d import Point, Vector, make_vector_between
+from structures.model.bar import StrBar
+from structures.model.node import StrNode
+from structures.solution.bar import StrBarSolution
+from structures.solution.node import StrNodeSolution
+
+
+class BarSolutionTest(unittest.TestCase):
+    section = 5
+    young = 2e4
+
+    start = StrNode(1, Point(0, 0))
+    end = StrNode(2, Point(300, 400))
+    start_solution = StrNodeSolution(start, Vector(1, -2))
+    end_solution = StrNodeSolution(end, Vector(4, 2))
+    bar = StrBarSolution(
+        StrBar(1, start, end, section, young), start_solution, end_solution
+    )
+
+    def test_lengths(self):
+        self.assertAlmostEqual(500, self.bar.original_length)
+        self.assertAlmostEqual(self.bar.final_geometry.length, self.bar.final_length)
+
+    def test_elongation(self):
+        # the displaced bar goes from (1, -2) to (304, 402)
+        expected = Vector(303, 404).norm - 500
+        self.assertAlmostEqual(expected, self.bar.elongation)
+
+    def test_elongation_of_tiny_displacements(self):
+        end_solution = StrNodeSolution(self.end, Vector(3e-12, 4e-12))
+        bar = StrBarSolution(
+            StrBar(1, self.start, self.end, 1, 1),
+            StrNodeSolution(self.start, Vector(0, 0)),
+            end_solution,
+        )
+
+        self.assertAlmostEqual(5e-12, bar.elongation, delta=1e-24)
+
+    def test_strain_stress_and_force(self):
+        strain = self.bar.elongation / 500
+
+        self.assertAlmostEqual(strain, self.bar.strain)
+        self.assertAlmostEqual(self.young * strain, self.bar.stress)
+        self.assertAlmostEqual(
+            self.young * strain * self.section, self.bar.internal_force_value
+        )
+
+    def test_force_in_nodes(self):
+        force = self.bar.internal_force_value
+        start_pos = self.start_solution.displaced_pos
+        end_pos = self.end_solution.displaced_pos
+
+        self.assertEqual(
+            make_vector_between(end_pos, start_pos).with_length(force),
+            self.bar.force_in_node(self.start_solution),
+        )
+        self.assertEqual(
+            make_vector_between(start_pos, end_pos).with_length(force),
+            self.bar.force_in_node(self.end_solution),
+        )
+
+    def test_force_in_other_node(self):
+        other = StrNodeSolution(StrNode(3, Point(0, 0)), Vector(0, 0))
+        self.assertRaises(ValueError, lambda: self.bar.force_in_node(other))
@@ -0,0 +1,118 @@
+import unittest
+
+from geom2d import Point, Vector
+from structures.model.bar import StrBar
+from structures.model.columnar import StructureColumns
+from structures.model.node import StrNode
+
+
+class StructureColumnsTest(unittest.TestCase):
+    def setUp(self):
+        self.columns = StructureColumns()
+        self.columns.add_node(10, 0, 0, dx_constrained=True, dy_constrained=True)
+        self.columns.add_node(20, 0, 200, dx_constrained=True)
+        self.columns.add_node(30, 400, 200)
+        self.columns.add_load(2, 500, -1000)
+        self.columns.add_bar(1, 0, 1, 5, 2e7)
+        self.columns.add_bar(2, 1, 2, 5, 2e7)
+        self.columns.add_bar(3, 0, 2, 3, 1e7)
+
+    def test_counts(self):
+        self.assertEqual(3, self.columns.nodes_count)
+        self.assertEqual(3, self.columns.bars_count)
+        self.assertEqual(1, self.columns.loads_count)
+
+    def test_add_node_returns_index(self):
+        self.assertEqual(3, self.columns.add_node(40, 1, 2))
+
+    def test_constraints(self):
+        both = StructureColumns.CONSTRAINED_X | StructureColumns.CONSTRAINED_Y
+        self.assertEqual(
+            [both, StructureColumns.CONSTRAINED_X, 0], list(self.columns.constraints)
+        )
+
+    def test_bar_arrays(self):
+        self.assertEqual([0, 1, 0], list(self.columns.starts))
+        self.assertEqual([1, 2, 2], list(self.columns.ends))
+        self.assertEqual([5, 5, 3], list(self.columns.cross_sections))
+
+    def test_index_of(self):
+        self.assertEqual(1, self.columns.index_of(20))
+
+    def test_index_of_unknown_node(self):
+        self.assertRaises(ValueError, lambda: self.columns.index_of(99))
+
+    def test_repeated_node_id(self):
+        self.columns.index_of(10)
+        self.assertRaises(ValueError, lambda: self.columns.add_node(10, 1, 1))
+
+    def test_bar_with_unknown_node_index(self):
+        self.assertRaises(IndexError, lambda: self.columns.add_bar(4, 0, 3, 1, 1))
+
+    def test_node_at(self):
+        node = self.columns.node_at(2)
+
+        self.assertEqual(30, node.id)
+        self.assertEqual(Point(400, 200), node.position)
+        self.assertEqual([Vector(500, -1000)], node.loads)
+        self.assertFalse(node.dx_constrained)
+
+    def test_bar_at(self):
+        bar = self.columns.bar_at(2)
+
+        self.assertEqual(3, bar.id)
+        self.assertEqual(10, bar.start_node.id)
+        self.assertEqual(30, bar.end_node.id)
+        self.assertEqual(1e7, bar.young_mod)
+
+    def test_to_objects_links_bars_to_nodes(self):
+        nodes, bars = self.columns.to_objects()
+
+        self.assertEqual([10, 20, 30], [node.id for node in nodes])
+        self.assertIs(nodes[1], bars[0].end_node)
+        self.assertIs(nodes[1], bars[1].start_node)
+
+    def test_from_objects(self):
+        n_1 = StrNode(1, Point(0, 0), dy_constrained=True)
+        n_2 = StrNode(2, Point(3, 4), [Vector(1, 2), Vector(3, 4)])
+        columns = StructureColumns.from_objects([n_1, n_2], [StrBar(7, n_2, n_1, 2, 3)])
+
+        self.assertEqual([StructureColumns.CONSTRAINED_Y, 0], list(columns.constraints))
+        self.assertEqual([1, 1], list(columns.load_nodes))
+        self.assertEqual([1, 3], list(columns.load_us))
+        self.assertEqual([1], list(columns.starts))
+        self.assertEqual([0], list(columns.ends))
+
+    def test_with_loads(self):
+        case = self.columns.with_loads({10: [Vector(1, 2)], 20: []})
+
+        self.assertEqual([0], list(case.load_nodes))
+        self.assertIs(self.columns.xs, case.xs)
+        self.assertEqual(1, self.columns.loads_count)
+
+    def test_with_loads_unknown_node(self):
+        self.assertRaises(
+            ValueError, lambda: self.columns.with_loads({99: [Vector(1, 2)]})
+        )
+
+    def test_loads_at(self):
+        self.columns.add_load(2, 1, 2)
+
+        self.assertEqual([Vector(500, -1000), Vector(1, 2)], self.columns.loads_at(2))
+        self.assertEqual([], self.columns.loads_at(0))
+
+    def test_describes_its_objects(self):
+        nodes, bars = self.columns.to_objects()
+        self.assertTrue(self.columns.describes(nodes, bars))
+
+    def test_doesnt_describe_modified_objects(self):
+        for modify in (
+            lambda nodes, bars: setattr(nodes[2], "dy_constrained", True),
+            lambda nodes, bars: nodes[1].add_load(Vector(0, 1)),
+            lambda nodes, bars: setattr(bars[0], "cross_section", 7),
+            lambda nodes, bars: nodes.pop(),
+        ):
+            nodes, bars = self.columns.to_objects()
+            modify(nodes, bars)
+
+            self.assertFalse(self.columns.describes(nodes, bars))
@@ -0,0 +1,15 @@
+import unittest
+
+from structures.model.numbering import DofNumberingReport
+
+
+class DofNumberingReportTest(unittest.TestCase):
+    report = DofNumberingReport([0, 0, 0, 1], [0, 0, 1, 2])
+
+    def test_bandwidth(self):
+        self.assertEqual(2, self.report.bandwidth_before)
+        self.assertEqual(1, self.report.bandwidth_after)
+
+    def test_profile(self):
+        self.assertEqual(9, self.report.profile_before)
+        self.assertEqual(7, self.report.profile_after)
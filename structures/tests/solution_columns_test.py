@@ -0,0 +1,64 @@
+import unittest
+from array import array
+from operator import attrgetter
+
+from eqs import Vector as EqVector
+from geom2d import Vector
+from structures.model.columnar import StructureColumns
+from structures.solution.columnar import SolutionColumns
+from structures.solution.structure import StructureSolution
+
+
+class SolutionColumnsTest(unittest.TestCase):
+    def setUp(self):
+        # a bar of axial stiffness EA/L = 100, pulled by 100 in the end node
+        self.columns = StructureColumns()
+        self.columns.add_node(2, 100, 0, dy_constrained=True)
+        self.columns.add_node(1, 0, 0, dx_constrained=True, dy_constrained=True)
+        self.columns.add_load(0, 100, 0)
+        self.columns.add_bar(1, 1, 0, 1, 1e4)
+
+        # the dofs are numbered from the second node
+        node_dofs = array("q", [2, 3, 0, 1])
+        displacements = EqVector(4).set_data([0, 0, 1, 0])
+        self.solution_columns = SolutionColumns(self.columns, node_dofs, displacements)
+
+    def test_displacement_at(self):
+        self.assertEqual(Vector(1, 0), self.solution_columns.displacement_at(0))
+        self.assertEqual(Vector(0, 0), self.solution_columns.displacement_at(1))
+
+    def test_node_at(self):
+        node = self.solution_columns.node_at(0)
+
+        self.assertEqual(2, node.id)
+        self.assertEqual(Vector(1, 0), node.global_disp)
+        self.assertTrue(node.is_loaded)
+
+    def test_bar_at(self):
+        bar = self.solution_columns.bar_at(0)
+
+        self.assertEqual(1, bar.start_node.id)
+        self.assertEqual(2, bar.end_node.id)
+        self.assertAlmostEqual(100, bar.internal_force_value)
+
+    def test_bars_linked_to_nodes(self):
+        nodes = self.solution_columns.nodes()
+        (bar,) = self.solution_columns.bars(nodes)
+
+        self.assertIs(nodes[1], bar.start_node)
+        self.assertIs(nodes[0], bar.end_node)
+
+    def test_structure_solution_from_columns(self):
+        solution = StructureSolution(None, None, columns=self.solution_columns)
+
+        self.assertIs(self.solution_columns, solution.columns)
+        self.assertEqual([2, 1], [node.id for node in solution.nodes])
+        self.assertEqual(Vector(-100, 0), solution.reactions[1])
+
+    def test_structure_solution_bars_after_sorting_nodes(self):
+        solution = StructureSolution(None, None, columns=self.solution_columns)
+        solution.nodes.sort(key=attrgetter("id"))
+        (bar,) = solution.bars
+
+        self.assertIs(solution.nodes[0], bar.start_node)
+        self.assertIs(solution.nodes[1], bar.end_node)
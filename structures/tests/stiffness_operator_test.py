@@ -0,0 +1,51 @@
+import unittest
+
+from eqs import Matrix, Vector
+from geom2d import Point
+from structures.model.bar import StrBar
+from structures.model.node import StrNode
+from structures.model.stiffness_operator import StiffnessOperator
+
+
+class StiffnessOperatorTest(unittest.TestCase):
+    n_1 = StrNode(1, Point(0, 0))
+    n_2 = StrNode(2, Point(0, 200))
+    n_3 = StrNode(3, Point(400, 200))
+    bars = [
+        StrBar(1, n_1, n_2, 5, 2e7),
+        StrBar(2, n_2, n_3, 5, 2e7),
+        StrBar(3, n_1, n_3, 5, 2e7),
+    ]
+    dofs_dict = {1: (0, 1), 2: (2, 3), 3: (4, 5)}
+    constrained_dofs = {0, 1, 2}
+
+    operator = StiffnessOperator.from_bars(bars, dofs_dict, constrained_dofs, 6)
+    vector = Vector(6).set_data([1, -2, 3, 4, -5, 6])
+
+    def test_times_vector_matches_assembled_matrix(self):
+        expected = self.__assembled_matrix().times_vector(self.vector)
+        actual = self.operator.times_vector(self.vector)
+
+        self.assertEqual(expected, actual)
+
+    def test_diagonal_matches_assembled_matrix(self):
+        matrix = self.__assembled_matrix()
+        expected = Vector(6).set_data([matrix.value_at(i, i) for i in range(6)])
+
+        self.assertEqual(expected, self.operator.diagonal())
+
+    def __assembled_matrix(self):
+        matrix = Matrix(6, 6)
+        for bar in self.bars:
+            bar_matrix = bar.global_stiffness_matrix()
+            dofs = self.dofs_dict[bar.start_node.id] + self.dofs_dict[bar.end_node.id]
+
+            for row, row_dof in enumerate(dofs):
+                for col, col_dof in enumerate(dofs):
+                    matrix.add_to_value(bar_matrix.value_at(row, col), row_dof, col_dof)
+
+        for dof in self.constrained_dofs:
+            matrix.set_identity_row(dof)
+            matrix.set_identity_col(dof)
+
+        return matrix
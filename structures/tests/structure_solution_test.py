@@ -1,7 +1,10 @@
 import unittest
 from unittest.mock import Mock, patch
 
-from geom2d import Point
+from geom2d import Point, Vector
+from structures.model.bar import StrBar
+from structures.model.node import StrNode
+from structures.solution.bar import StrBarSolution
 from structures.solution.node import StrNodeSolution
 from structures.solution.structure import StructureSolution
 
@@ -29,3 +32,27 @@ class StructureSolutionTest(unittest.TestCase):
         solution.bounds_rect(margin=10, scale=4)
 
         make_rect_mock.assert_called_once_with([self.p_one, self.p_two], 10)
+
+    def test_reactions_computed_while_solving(self):
+        self.n_one.id = 1
+        self.n_one.is_constrained = True
+        self.n_two.is_constrained = False
+        solution = StructureSolution([self.n_one, self.n_two], [], {1: Vector(10, -20)})
+
+        self.assertEqual(Vector(10, -20), solution.reaction_for_node(self.n_one))
+        self.assertEqual(Vector(0, 0), solution.reaction_for_node(self.n_two))
+
+    def test_reactions_from_bars(self):
+        # a bar of axial stiffness EA/L = 100, pulled by 100 in the end node
+        start = StrNode(1, Point(0, 0), dx_constrained=True, dy_constrained=True)
+        end = StrNode(2, Point(100, 0), [Vector(100, 0)], dy_constrained=True)
+        start_solution = StrNodeSolution(start, Vector(0, 0))
+        end_solution = StrNodeSolution(end, Vector(1, 0))
+        bar = StrBarSolution(
+            StrBar(1, start, end, 1, 1e4), start_solution, end_solution
+        )
+        solution = StructureSolution([start_solution, end_solution], [bar])
+
+        self.assertEqual(Vector(-100, 0), solution.reaction_for_node(start_solution))
+        self.assertEqual(Vector(0, 0), solution.reaction_for_node(end_solution))
+        self.assertEqual({1, 2}, set(solution.reactions))
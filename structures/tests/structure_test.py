@@ -1,13 +1,24 @@
 import unittest
 from operator import attrgetter
+from unittest.mock import patch
 
+from eqs import NonPositivePivotError
 from geom2d import Point, Vector
 from structures.model.bar import StrBar
+from structures.model.columnar import StructureColumns
 from structures.model.node import StrNode
-from structures.model.structure import Structure
+from structures.model.structure import Structure, UnstableStructureError
 
 
 class StructureTest(unittest.TestCase):
+    __assembled_solvers = (
+        "cholesky",
+        "ldlt",
+        "skyline",
+        "sparse_cholesky",
+        "sparse_cg",
+    )
+
     def setUp(self):
         self.section = 5
         self.young = 2e7
@@ -49,6 +60,323 @@ class StructureTest(unittest.TestCase):
         self.assertGreater(node_3.global_disp.u, 0.0)
         self.assertLess(node_3.global_disp.v, 0.0)
 
+    def test_solve_displacements_sparse_cg(self):
+        self._assert_solver_matches_cholesky("sparse_cg")
+
+    def test_solve_displacements_skyline(self):
+        self._assert_solver_matches_cholesky("skyline")
+
+    def test_solve_displacements_sparse_cholesky(self):
+        self._assert_solver_matches_cholesky("sparse_cholesky")
+
+    def test_solve_displacements_matrix_free_cg(self):
+        self._assert_solver_matches_cholesky("matrix_free_cg")
+
+    def test_solve_displacements_ldlt(self):
+        self._assert_solver_matches_cholesky("ldlt")
+
+    def test_unstable_structure(self):
+        # a y support in node 2 doesn't stop the rotation around node 1
+        self.n_1.dx_constrained = True
+        self.n_1.dy_constrained = True
+        self.n_2.dy_constrained = True
+
+        for solver in ("cholesky", "ldlt", "skyline", "sparse_cholesky"):
+            with self.subTest(solver=solver):
+                with self.assertRaises(UnstableStructureError) as context:
+                    self.structure.solve_structure(solver=solver)
+
+                self.assertIn(context.exception.node_id, (2, 3))
+                self.assertIsInstance(
+                    context.exception.__cause__, NonPositivePivotError
+                )
+
+    def test_eliminate_constraints(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_structure(solver="cholesky")
+
+        for solver in self.__assembled_solvers:
+            with self.subTest(solver=solver):
+                actual = self.structure.solve_structure(
+                    solver=solver, eliminate_constraints=True
+                )
+                self._assert_same_displacements(expected, actual)
+
+    def test_eliminate_constraints_reactions(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_structure()
+
+        for solver in self.__assembled_solvers:
+            with self.subTest(solver=solver):
+                actual = self.structure.solve_structure(
+                    solver=solver, eliminate_constraints=True
+                )
+
+                for expected_node, actual_node in zip(
+                    expected.nodes, actual.nodes, strict=True
+                ):
+                    expected_reaction = expected.reaction_for_node(expected_node)
+                    actual_reaction = actual.reaction_for_node(actual_node)
+                    self.assertAlmostEqual(
+                        expected_reaction.u, actual_reaction.u, delta=0.75
+                    )
+                    self.assertAlmostEqual(
+                        expected_reaction.v, actual_reaction.v, delta=0.75
+                    )
+
+    def test_eliminate_constraints_reactions_include_loads_on_supports(self):
+        self._set_external_constraints()
+        self.n_2.loads.append(Vector(0, -300))
+        solution = self.structure.solve_structure(eliminate_constraints=True)
+        solution.nodes.sort(key=attrgetter("id"))
+
+        reaction = solution.reaction_for_node(solution.nodes[1])
+        self.assertAlmostEqual(-2500, reaction.u)
+        self.assertAlmostEqual(300, reaction.v)
+
+    def test_eliminate_constraints_load_cases(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_load_cases([{3: [self.load]}])
+        actual = self.structure.solve_load_cases(
+            [{3: [self.load]}], eliminate_constraints=True
+        )
+
+        self._assert_same_displacements(expected[0], actual[0])
+
+    def test_eliminate_constraints_unstable_structure(self):
+        self.n_1.dx_constrained = True
+        self.n_1.dy_constrained = True
+        self.n_2.dy_constrained = True
+
+        with self.assertRaises(UnstableStructureError) as context:
+            self.structure.solve_structure(eliminate_constraints=True)
+
+        self.assertIn(context.exception.node_id, (2, 3))
+
+    def test_eliminate_constraints_numbers_free_dofs(self):
+        self._set_external_constraints()
+        self.structure.solve_structure(eliminate_constraints=True)
+
+        # only the two dofs of node 3 are left in the system
+        self.assertEqual(1, self.structure.numbering_report.bandwidth_after)
+        self.assertEqual(3, self.structure.numbering_report.profile_after)
+
+    def test_reactions_are_computed_while_solving(self):
+        self._set_external_constraints()
+
+        for solver in self.__assembled_solvers + ("matrix_free_cg",):
+            with self.subTest(solver=solver):
+                solution = self.structure.solve_structure(solver=solver)
+
+                self.assertEqual({1, 2}, set(solution.reactions))
+                self.assertAlmostEqual(2000, solution.reactions[1].u, delta=0.75)
+                self.assertAlmostEqual(1000, solution.reactions[1].v, delta=0.75)
+                self.assertAlmostEqual(-2500, solution.reactions[2].u, delta=0.75)
+                self.assertAlmostEqual(0, solution.reactions[2].v, delta=0.75)
+
+    def test_iterative_solvers_unloaded_load_case(self):
+        structure = Structure.from_columns(self._panels_columns(20))
+
+        for solver in ("sparse_cg", "matrix_free_cg"):
+            structure.solve_structure(solver)
+            (solution,) = structure.solve_load_cases([{}], solver)
+
+            for node in solution.nodes:
+                self.assertEqual(Vector(0, 0), node.global_disp)
+
+    def test_iterative_solvers_fully_constrained_structure(self):
+        self._set_external_constraints()
+        self.n_3.dx_constrained = True
+        self.n_3.dy_constrained = True
+
+        for solver, eliminate_constraints in (
+            ("sparse_cg", True),
+            ("sparse_cg", False),
+            ("matrix_free_cg", False),
+        ):
+            solution = self.structure.solve_structure(
+                solver, eliminate_constraints=eliminate_constraints
+            )
+
+            for node in solution.nodes:
+                self.assertEqual(Vector(0, 0), node.global_disp)
+
+    def test_iterative_solvers_warm_start_after_renumbering(self):
+        structure = Structure.from_columns(self._panels_columns(20))
+        expected = structure.solve_structure("cholesky")
+
+        for solver in ("sparse_cg", "matrix_free_cg"):
+            for reorder_nodes, eliminate_constraints in (
+                (True, False),
+                (False, False),
+                (False, True),
+                (True, True),
+                (True, False),
+            ):
+                solution = structure.solve_structure(
+                    solver, reorder_nodes, eliminate_constraints
+                )
+
+                # the constrained displacements are exactly zero
+                (first, last) = (solution.nodes[0], solution.nodes[-2])
+                self.assertEqual(
+                    (0.0, 0.0, 0.0),
+                    (first.global_disp.u, first.global_disp.v, last.global_disp.v),
+                )
+
+                for expected_node, node in zip(
+                    expected.nodes, solution.nodes, strict=True
+                ):
+                    disp = node.global_disp
+                    self.assertAlmostEqual(expected_node.global_disp.u, disp.u, 6)
+                    self.assertAlmostEqual(expected_node.global_disp.v, disp.v, 6)
+
+    def test_sparse_cg_solves_again_from_previous_solution(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_structure(solver="sparse_cg")
+        actual = self.structure.solve_structure(solver="sparse_cg")
+
+        for expected_node, actual_node in zip(
+            expected.nodes, actual.nodes, strict=True
+        ):
+            self.assertEqual(expected_node.global_disp, actual_node.global_disp)
+
+    def test_solve_displacements_without_reordering(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_structure()
+        actual = self.structure.solve_structure(reorder_nodes=False)
+
+        for expected_node, actual_node in zip(
+            expected.nodes, actual.nodes, strict=True
+        ):
+            self.assertEqual(expected_node.global_disp, actual_node.global_disp)
+
+    def test_reordering_reduces_bandwidth(self):
+        # Chain of bars 1 - 4 - 2 - 3, with the nodes listed by id
+        n_4 = StrNode(4, Point(400, 0), [self.load])
+        chain = Structure(
+            [self.n_1, self.n_2, self.n_3, n_4],
+            [
+                StrBar(1, self.n_1, n_4, self.section, self.young),
+                StrBar(2, n_4, self.n_2, self.section, self.young),
+                StrBar(3, self.n_2, self.n_3, self.section, self.young),
+            ],
+        )
+        self._set_external_constraints()
+        self.n_3.dy_constrained = True
+        chain.solve_structure()
+
+        self.assertEqual(7, chain.numbering_report.bandwidth_before)
+        self.assertEqual(3, chain.numbering_report.bandwidth_after)
+
+    def test_solve_load_cases(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_structure()
+        own_loads, double_loads = self.structure.solve_load_cases(
+            [{3: [self.load]}, {3: [self.load, self.load]}]
+        )
+
+        for expected_node, own_node, double_node in zip(
+            expected.nodes, own_loads.nodes, double_loads.nodes, strict=True
+        ):
+            disp = expected_node.global_disp
+            self.assertEqual(disp, own_node.global_disp)
+            self.assertEqual(disp.scaled_by(2), double_node.global_disp)
+
+    def test_load_case_reactions_use_case_loads(self):
+        self._set_external_constraints()
+        (solution,) = self.structure.solve_load_cases([{3: [self.load.opposite()]}])
+        solution.nodes.sort(key=attrgetter("id"))
+
+        reaction = solution.reaction_for_node(solution.nodes[0])
+        self.assertAlmostEqual(-2000, reaction.u, delta=0.75)
+        self.assertAlmostEqual(-1000, reaction.v, delta=0.75)
+
+    def test_load_case_with_unknown_node(self):
+        self.assertRaises(
+            ValueError, lambda: self.structure.solve_load_cases([{9: [self.load]}])
+        )
+
+    def test_from_columns_counts(self):
+        structure = Structure.from_columns(self._columns())
+
+        self.assertEqual(3, structure.nodes_count)
+        self.assertEqual(3, structure.bars_count)
+        self.assertEqual(1, structure.loads_count)
+
+    def test_from_columns_matches_objects(self):
+        self._set_external_constraints()
+        structure = Structure.from_columns(self._columns())
+
+        for solver in self.__assembled_solvers + ("matrix_free_cg",):
+            for eliminate_constraints in (False, True):
+                expected = self.structure.solve_structure(
+                    solver, eliminate_constraints=eliminate_constraints
+                )
+                actual = structure.solve_structure(
+                    solver, eliminate_constraints=eliminate_constraints
+                )
+
+                self._assert_same_displacements(expected, actual)
+                self.assertEqual(expected.reactions, actual.reactions)
+                self.assertEqual(
+                    [bar.stress for bar in expected.bars],
+                    [bar.stress for bar in actual.bars],
+                )
+
+    def test_from_columns_load_cases(self):
+        self._set_external_constraints()
+        expected = self.structure.solve_load_cases([{3: [self.load, self.load]}])
+        actual = Structure.from_columns(self._columns()).solve_load_cases(
+            [{3: [self.load, self.load]}]
+        )
+
+        self._assert_same_displacements(expected[0], actual[0])
+        self.assertEqual(expected[0].reactions, actual[0].reactions)
+
+    def test_from_columns_unstable_structure(self):
+        columns = StructureColumns()
+        columns.add_node(1, 0, 0, dx_constrained=True, dy_constrained=True)
+        columns.add_node(2, 0, 200, dy_constrained=True)
+        columns.add_bar(1, 0, 1, self.section, self.young)
+
+        with self.assertRaises(UnstableStructureError) as context:
+            Structure.from_columns(columns).solve_structure("cholesky")
+
+        self.assertEqual(2, context.exception.node_id)
+        self.assertEqual("x", context.exception.direction)
+
+    def test_columns_are_kept_while_the_objects_dont_change(self):
+        self._set_external_constraints()
+
+        with patch.object(
+            StructureColumns, "from_objects", wraps=StructureColumns.from_objects
+        ) as from_objects:
+            self.structure.solve_structure()
+            self.structure.solve_structure("sparse_cholesky")
+            self.assertEqual(1, from_objects.call_count)
+
+            self.b_13.cross_section = 2 * self.section
+            changed = self.structure.solve_structure()
+            self.assertEqual(2, from_objects.call_count)
+
+        self.assertAlmostEqual(self.b_13.cross_section, changed.bars[2].cross_section)
+
+    def test_solution_objects_are_created_on_demand(self):
+        self._set_external_constraints()
+        solution = Structure.from_columns(self._columns()).solve_structure()
+
+        with patch.object(StructureColumns, "to_objects") as to_objects:
+            node = solution.columns.node_at(2)
+            self.assertEqual(3, node.id)
+            self.assertEqual(node.global_disp, solution.columns.displacement_at(2))
+            to_objects.assert_not_called()
+
+    def test_unknown_solver(self):
+        self.assertRaises(
+            ValueError, lambda: self.structure.solve_structure(solver="magic")
+        )
+
     def test_solve_reactions(self):
         self._set_external_constraints()
         solution = self.structure.solve_structure()
@@ -73,6 +401,41 @@ class StructureTest(unittest.TestCase):
         self.assertAlmostEqual(0.0, sum_forces.u, delta=1.0)
         self.assertAlmostEqual(0.0, sum_forces.v, delta=1.0)
 
+    def _assert_solver_matches_cholesky(self, solver):
+        self._set_external_constraints()
+        expected = self.structure.solve_structure(solver="cholesky")
+        actual = self.structure.solve_structure(solver=solver)
+        self._assert_same_displacements(expected, actual)
+
+    def _assert_same_displacements(self, expected, actual):
+        for expected_node, actual_node in zip(
+            expected.nodes, actual.nodes, strict=True
+        ):
+            self.assertEqual(expected_node.global_disp, actual_node.global_disp)
+
+    def _columns(self):
+        return StructureColumns.from_objects(
+            [self.n_1, self.n_2, self.n_3], [self.b_12, self.b_23, self.b_13]
+        )
+
+    def _panels_columns(self, panels_count: int):
+        # a simply supported truss of square, braced panels
+        columns = StructureColumns()
+        for i in range(panels_count):
+            last = i == panels_count - 1
+            columns.add_node(2 * i, 200 * i, 0, i == 0, i == 0 or last)
+            columns.add_node(2 * i + 1, 200 * i, 200)
+            columns.add_load(2 * i + 1, 0, -1000)
+            columns.add_bar(4 * i, 2 * i, 2 * i + 1, self.section, self.young)
+
+        for i in range(panels_count - 1):
+            for k, (start, end) in enumerate(((0, 2), (1, 3), (0, 3)), 1):
+                columns.add_bar(
+                    4 * i + k, 2 * i + start, 2 * i + end, self.section, self.young
+                )
+
+        return columns
+
     def _set_external_constraints(self):
         self.n_1.dx_constrained = True
         self.n_1.dy_constrained = True